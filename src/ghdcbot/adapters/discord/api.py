@@ -81,6 +81,27 @@ class DiscordApiAdapter:
             )
         return member_roles
 
+    def list_roles_for_member(self, discord_user_id: str) -> list[str]:
+        """Return sorted role names for a single guild member.
+
+        Fetches only that member (GET /guilds/{guild}/members/{user}) instead of paging
+        through the whole guild. Returns an empty list if the member or roles cannot be read.
+        """
+        roles, roles_ok = self._list_roles()
+        if not roles_ok:
+            return []
+        response = self._request("GET", f"/guilds/{self._guild_id}/members/{discord_user_id}")
+        if response is None or response.status_code != 200:
+            self._logger.warning(
+                "Unable to read guild member",
+                extra={"guild_id": self._guild_id, "user_id": discord_user_id},
+            )
+            return []
+        member = response.json()
+        role_lookup = {role["id"]: role["name"] for role in roles}
+        role_names = [role_lookup.get(role_id, "") for role_id in member.get("roles") or []]
+        return sorted(name for name in role_names if name)
+
     def list_members(self) -> list[dict]:
         """Return member objects with user ID, username, and role IDs."""
         members, _ = self._list_members()
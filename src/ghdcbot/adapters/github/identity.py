@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Any, Iterable
 
 import httpx
 
+ETAG_CACHE_MAXSIZE = 1024
+# Keep-alive pool for the long-running bot: verifications from the worker threads reuse
+# warm TLS connections to api.github.com / gist hosts instead of handshaking each time.
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+# Threads that prefetch a user's gist list while their bio is being checked.
+GIST_PREFETCH_WORKERS = 4
+
 
 @dataclass(frozen=True)
 class VerificationMatch:
@@ -20,7 +30,11 @@ class GitHubIdentityReader:
     (profile bio and public gists) and searches for a verification code.
     """
 
-    def __init__(self, token: str, api_base: str = "https://api.github.com") -> None:
+    def __init__(
+        self,
+        token: str,
+        api_base: str = "https://api.github.com",
+    ) -> None:
         self._logger = logging.getLogger(self.__class__.__name__)
         self._client = httpx.Client(
             base_url=api_base,
@@ -29,9 +43,22 @@ class GitHubIdentityReader:
                 "Accept": "application/vnd.github+json",
             },
             timeout=20.0,
+            limits=HTTP_POOL_LIMITS,
+        )
+        # (path, params) -> (etag, parsed body). Conditional GETs answered with 304 do not
+        # count against the GitHub rate limit, so unchanged profiles/gists cost nothing.
+        # Bounded LRU so a long-running bot does not grow with every user ever checked.
+        self._etag_cache: OrderedDict[tuple[str, tuple], tuple[str, Any]] = OrderedDict()
+        # Guards _etag_cache: the bot verifies from several worker threads, plus the prefetch.
+        self._cache_lock = threading.Lock()
+        # Created up front (threads start on first submit) so concurrent verifications from
+        # the bot's worker threads cannot race to build, and leak, a second pool.
+        self._prefetch = ThreadPoolExecutor(
+            max_workers=GIST_PREFETCH_WORKERS, thread_name_prefix="ghdcbot-gists"
         )
 
     def close(self) -> None:
+        self._prefetch.shutdown(wait=False, cancel_futures=True)
         self._client.close()
 
     def __enter__(self) -> "GitHubIdentityReader":
@@ -41,31 +68,35 @@ class GitHubIdentityReader:
         self.close()
 
     def search_verification_code(self, github_user: str, code: str) -> VerificationMatch:
-        """Search for code in GitHub bio or public gists."""
+        """Search for code in GitHub bio or public gists.
+
+        The gist list is fetched concurrently with the bio, so a code that is not in the
+        bio costs one round trip less. Trade-off: with idle prefetch workers the cancel on a
+        bio hit rarely wins, so a bio match also spends one /users/{user}/gists request
+        against the rate budget. It is a 304 (free) once that list is in the ETag cache.
+        """
+        gists_future = self._prefetch.submit(self._list_public_gists, github_user)
         bio = self._fetch_bio(github_user)
         if bio and code in bio:
+            gists_future.cancel()
             return VerificationMatch(found=True, location="bio")
 
-        for match in self._search_public_gists(github_user, code):
+        for match in self._search_public_gists(gists_future.result(), code):
             return match
 
         return VerificationMatch(found=False, location=None)
 
     def _fetch_bio(self, github_user: str) -> str | None:
-        response = self._request("GET", f"/users/{github_user}", params={})
-        if response is None or response.status_code != 200:
+        data = self._get_json(f"/users/{github_user}", params={})
+        if not isinstance(data, dict):
             return None
-        data = response.json()
         bio = data.get("bio")
         return bio if isinstance(bio, str) else None
 
-    def _search_public_gists(self, github_user: str, code: str) -> Iterable[VerificationMatch]:
-        # List public gists for the user.
-        response = self._request("GET", f"/users/{github_user}/gists", params={"per_page": 20, "page": 1})
-        if response is None or response.status_code != 200:
-            return []
+    def _list_public_gists(self, github_user: str) -> Any | None:
+        return self._get_json(f"/users/{github_user}/gists", params={"per_page": 20, "page": 1})
 
-        gists = response.json()
+    def _search_public_gists(self, gists: Any, code: str) -> Iterable[VerificationMatch]:
         if not isinstance(gists, list):
             return []
 
@@ -79,10 +110,9 @@ class GitHubIdentityReader:
                 return
 
             # Fetch gist details to get file raw URLs.
-            gist_resp = self._request("GET", f"/gists/{gist_id}", params={})
-            if gist_resp is None or gist_resp.status_code != 200:
+            gist_data = self._get_json(f"/gists/{gist_id}", params={})
+            if not isinstance(gist_data, dict):
                 continue
-            gist_data = gist_resp.json()
             files = gist_data.get("files") or {}
             if not isinstance(files, dict):
                 continue
@@ -109,9 +139,37 @@ class GitHubIdentityReader:
         # Keep this simple; searching is deterministic.
         return code in text
 
-    def _request(self, method: str, path: str, params: dict) -> httpx.Response | None:
+    def _get_json(self, path: str, params: dict) -> Any | None:
+        """GET path and return the parsed body, revalidating cached bodies with If-None-Match."""
+        key = (path, tuple(sorted(params.items())))
+        with self._cache_lock:
+            cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._request("GET", path, params=params, headers=headers)
+        if response is None:
+            return None
+        if response.status_code == 304 and cached:
+            with self._cache_lock:
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return cached[1]
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._cache_lock:
+                self._etag_cache[key] = (etag, data)
+                self._etag_cache.move_to_end(key)
+                while len(self._etag_cache) > ETAG_CACHE_MAXSIZE:
+                    self._etag_cache.popitem(last=False)
+        return data
+
+    def _request(
+        self, method: str, path: str, params: dict, headers: dict | None = None
+    ) -> httpx.Response | None:
         try:
-            response = self._client.request(method, path, params=params)
+            response = self._client.request(method, path, params=params, headers=headers)
         except httpx.HTTPError as exc:
             self._logger.warning("GitHub identity request failed", extra={"path": path, "error": str(exc)})
             return None
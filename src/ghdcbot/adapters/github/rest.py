@@ -2,16 +2,23 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, Iterator, Sequence
+from typing import Any, Iterable, Iterator, Sequence
 
 import httpx
 
 from ghdcbot.config.loader import get_active_config
 from ghdcbot.config.models import RepoFilterConfig
+from ghdcbot.core.errors import GitHubRateLimitError
 from ghdcbot.core.models import ContributionEvent
 
+ETAG_CACHE_MAXSIZE = 512
+# Single-resource reads stop before the last few requests of the hourly budget are spent.
+RATE_LIMIT_RESERVE = 10
+
 
 @dataclass(frozen=True)
 class RateLimitStatus:
@@ -24,6 +31,13 @@ class GitHubRestAdapter:
         self._logger = logging.getLogger(self.__class__.__name__)
         self._org = org
         self._last_repo_count: int | None = None
+        # (path, params) -> (etag, parsed body) for single-resource reads (PR, issue, check runs).
+        # 304 Not Modified replies do not count against the GitHub rate limit.
+        self._etag_cache: OrderedDict[tuple[str, tuple], tuple[str, Any]] = OrderedDict()
+        # Guards _etag_cache: the bot reads PRs/issues from several worker threads at once.
+        self._cache_lock = threading.Lock()
+        # Budget reported by the most recent response (X-RateLimit-Remaining/Reset).
+        self._rate_limit = RateLimitStatus(remaining=None, reset_at=None)
         self._client = httpx.Client(
             base_url=api_base,
             headers={
@@ -201,6 +215,73 @@ class GitHubRestAdapter:
             )
             return False
 
+    def replace_assignees(
+        self, owner: str, repo: str, issue_number: int, new_assignees: list[str]
+    ) -> bool:
+        """Set the full assignee list of a GitHub issue in a single PATCH.
+
+        Replaces unassign_issue + assign_issue for reassignment: GitHub applies the
+        new list atomically, so a failure never leaves the issue unassigned.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            issue_number: Issue number
+            new_assignees: GitHub usernames that should be the only assignees
+
+        Returns:
+            True if the update succeeded, False otherwise.
+        """
+        path = f"/repos/{owner}/{repo}/issues/{issue_number}"
+        try:
+            response = self._client.patch(path, json={"assignees": new_assignees})
+        except httpx.HTTPError as exc:
+            self._logger.warning(
+                "GitHub request failed",
+                extra={"path": path, "error": str(exc)},
+            )
+            return False
+
+        rate_limit = _parse_rate_limit(response.headers)
+        if rate_limit.remaining is not None and rate_limit.remaining <= 1:
+            self._logger.warning(
+                "GitHub rate limit nearly exhausted",
+                extra={
+                    "path": path,
+                    "remaining": rate_limit.remaining,
+                    "reset_at": rate_limit.reset_at.isoformat() if rate_limit.reset_at else None,
+                },
+            )
+
+        if response.status_code == 200:
+            self._logger.info(
+                "Issue assignees replaced successfully",
+                extra={
+                    "owner": owner,
+                    "repo": repo,
+                    "issue_number": issue_number,
+                    "assignees": new_assignees,
+                },
+            )
+            return True
+        error_body = ""
+        try:
+            error_body = (response.text or "")[:500]
+        except Exception:
+            pass
+        self._logger.warning(
+            "Issue assignee replacement failed (GitHub API non-2xx)",
+            extra={
+                "owner": owner,
+                "repo": repo,
+                "issue_number": issue_number,
+                "assignees": new_assignees,
+                "status_code": response.status_code,
+                "error_response": error_body,
+            },
+        )
+        return False
+
     def request_review(self, repo: str, pr_number: int, reviewer: str) -> None:
         """Request a review on a pull request from the given reviewer (GitHub login)."""
         owner = self._org
@@ -242,10 +323,7 @@ class GitHubRestAdapter:
 
         Returns PR dict or None if not found/accessible.
         """
-        response = self._request("GET", f"/repos/{owner}/{repo}/pulls/{pr_number}", params={})
-        if response and response.status_code == 200:
-            return response.json()
-        return None
+        return self._get_json(f"/repos/{owner}/{repo}/pulls/{pr_number}", params={})
 
     def get_pull_request_reviews(self, owner: str, repo: str, pr_number: int) -> list[dict]:
         """Fetch reviews for a pull request.
@@ -278,15 +356,12 @@ class GitHubRestAdapter:
         """
         check_runs = []
         # Use check-runs endpoint (requires checks:read scope)
-        response = self._request(
-            "GET",
+        data = self._get_json(
             f"/repos/{owner}/{repo}/commits/{head_sha}/check-runs",
             params={"per_page": 100},
         )
-        if response and response.status_code == 200:
-            data = response.json()
-            if isinstance(data, dict) and "check_runs" in data:
-                check_runs = data["check_runs"]
+        if isinstance(data, dict) and "check_runs" in data:
+            check_runs = data["check_runs"]
         return check_runs
 
     def get_issue(self, owner: str, repo: str, issue_number: int) -> dict | None:
@@ -295,10 +370,7 @@ class GitHubRestAdapter:
         Returns issue dict or None if not found/accessible.
         Note: GitHub API uses /issues/{number} for both issues and PRs.
         """
-        response = self._request("GET", f"/repos/{owner}/{repo}/issues/{issue_number}", params={})
-        if response and response.status_code == 200:
-            return response.json()
-        return None
+        return self._get_json(f"/repos/{owner}/{repo}/issues/{issue_number}", params={})
 
     def write_file(
         self, owner: str, repo: str, file_path: str, content: str, commit_message: str, branch: str | None = None
@@ -1062,14 +1134,63 @@ class GitHubRestAdapter:
                 return
             page += 1
 
-    def _request(self, method: str, path: str, params: dict) -> httpx.Response | None:
+    def _get_json(self, path: str, params: dict) -> Any | None:
+        """GET path and return the parsed body, revalidating cached bodies with If-None-Match.
+
+        Returns None when the resource is missing or inaccessible. Raises
+        GitHubRateLimitError instead of requesting while the budget is exhausted.
+        """
+        self._raise_if_rate_limited()
+        key = (path, tuple(sorted(params.items())))
+        with self._cache_lock:
+            cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._request("GET", path, params=params, headers=headers)
+        if response is None:
+            # A 403 caused by an exhausted budget is not "inaccessible"; report when to retry.
+            self._raise_if_rate_limited()
+            return None
+        if response.status_code == 304 and cached:
+            with self._cache_lock:
+                # Another thread may have evicted the entry while the request was in flight.
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return cached[1]
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._cache_lock:
+                self._etag_cache[key] = (etag, data)
+                self._etag_cache.move_to_end(key)
+                while len(self._etag_cache) > ETAG_CACHE_MAXSIZE:
+                    self._etag_cache.popitem(last=False)
+        return data
+
+    def _raise_if_rate_limited(self) -> None:
+        remaining, reset_at = self._rate_limit.remaining, self._rate_limit.reset_at
+        if remaining is None or remaining >= RATE_LIMIT_RESERVE:
+            return
+        if reset_at is not None and datetime.now(timezone.utc) >= reset_at:
+            return
+        raise GitHubRateLimitError(reset_at)
+
+    def _request(
+        self, method: str, path: str, params: dict, headers: dict | None = None
+    ) -> httpx.Response | None:
         try:
-            response = self._client.request(method, path, params=params)
+            if headers:
+                response = self._client.request(method, path, params=params, headers=headers)
+            else:
+                response = self._client.request(method, path, params=params)
         except httpx.HTTPError as exc:
             self._logger.warning("GitHub request failed", extra={"path": path, "error": str(exc)})
             return None
 
         rate_limit = _parse_rate_limit(response.headers)
+        if rate_limit.remaining is not None:
+            self._rate_limit = rate_limit
         if rate_limit.remaining is not None and rate_limit.remaining <= 1:
             self._logger.warning(
                 "GitHub rate limit nearly exhausted",
@@ -1099,6 +1220,8 @@ class GitHubRestAdapter:
             return None
 
         rate_limit = _parse_rate_limit(response.headers)
+        if rate_limit.remaining is not None:
+            self._rate_limit = rate_limit
         if rate_limit.remaining is not None and rate_limit.remaining <= 1:
             self._logger.warning(
                 "GitHub rate limit nearly exhausted",
@@ -1,130 +1,197 @@
 from __future__ import annotations
 
 import json
+import queue
 import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Sequence
+from typing import Any, Iterable, Iterator, Sequence
 
 from ghdcbot.config.models import IdentityMapping
 from ghdcbot.core.models import ContributionEvent, ContributionSummary, Score
+from ghdcbot.utils.jsonl import iter_jsonl
+
+
+# Bump whenever init_schema gains DDL or a migration so existing databases re-run it.
+SCHEMA_VERSION = 1
+# Read-only connections kept open for the bot's worker threads. With WAL, readers do not
+# wait on writers, so concurrent slash commands (/status, /verify, ...) run in parallel.
+READ_POOL_SIZE = 4
+# Seconds a connection waits on a locked database before raising "database is locked".
+BUSY_TIMEOUT_SECONDS = 30.0
+# Rows fetched per round trip when streaming verified identities (`identity list`).
+IDENTITY_PAGE_SIZE = 256
 
 
 class SqliteStorage:
     def __init__(self, data_dir: str) -> None:
         self._db_path = Path(data_dir) / "state.db"
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        self._schema_ready = False
+        self._read_pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._read_pool_lock = threading.Lock()
+        self._readers_opened = 0
+
+    def _connect(self, *, check_same_thread: bool = True) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._db_path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=check_same_thread
+        )
         conn.row_factory = sqlite3.Row
+        # Safe with WAL: a crash can lose the last commits but never corrupts the database.
+        conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Check out a pooled read-only connection (opened lazily, at most READ_POOL_SIZE)."""
+        conn = None
+        with self._read_pool_lock:
+            if self._read_pool.empty() and self._readers_opened < READ_POOL_SIZE:
+                self._readers_opened += 1
+                conn = self._connect(check_same_thread=False)
+        if conn is None:
+            conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    def close(self) -> None:
+        """Close pooled read connections. Per-call write connections need no cleanup."""
+        with self._read_pool_lock:
+            while True:
+                try:
+                    self._read_pool.get_nowait().close()
+                except queue.Empty:
+                    break
+                self._readers_opened -= 1
+
     def init_schema(self) -> None:
+        """Create tables/indexes and run column migrations; idempotent.
+
+        The DDL runs once per database: PRAGMA user_version records the applied
+        SCHEMA_VERSION, and the instance remembers it so later calls skip the connect.
+        """
+        if self._schema_ready:
+            return
         with self._connect() as conn:
-            conn.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS contributions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    github_user TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    repo TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    payload_json TEXT NOT NULL
-                );
-                CREATE TABLE IF NOT EXISTS scores (
-                    github_user TEXT NOT NULL,
-                    period_start TEXT NOT NULL,
-                    period_end TEXT NOT NULL,
-                    points INTEGER NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    PRIMARY KEY (github_user, period_start, period_end)
-                );
-                CREATE TABLE IF NOT EXISTS cursors (
-                    source TEXT PRIMARY KEY,
-                    cursor TEXT NOT NULL
-                );
-                CREATE TABLE IF NOT EXISTS identity_links (
-                    discord_user_id TEXT NOT NULL,
-                    github_user TEXT NOT NULL,
-                    verified INTEGER NOT NULL DEFAULT 0,
-                    verification_code TEXT,
-                    expires_at TEXT,
-                    created_at TEXT NOT NULL,
-                    verified_at TEXT,
-                    PRIMARY KEY (discord_user_id, github_user)
-                );
-                CREATE INDEX IF NOT EXISTS idx_identity_links_github_user
-                    ON identity_links (github_user);
-                CREATE INDEX IF NOT EXISTS idx_identity_links_verified
-                    ON identity_links (verified);
-                """
-            )
-            # Additive: unlinked_at for unlink flow (preserve history, no row delete).
-            try:
-                conn.execute("ALTER TABLE identity_links ADD COLUMN unlinked_at TEXT")
-            except sqlite3.OperationalError as e:
-                if "duplicate column" not in str(e).lower():
-                    raise
-            # Case-insensitive github_user: normalized column for uniqueness and lookups.
-            try:
-                conn.execute("ALTER TABLE identity_links ADD COLUMN github_user_normalized TEXT")
-            except sqlite3.OperationalError as e:
-                if "duplicate column" not in str(e).lower():
-                    raise
-            conn.execute(
-                "UPDATE identity_links SET github_user_normalized = lower(github_user) WHERE github_user_normalized IS NULL"
-            )
-            # De-duplicate: keep one row per (discord_user_id, github_user_normalized), prefer verified then newest.
-            conn.execute(
-                """
-                DELETE FROM identity_links
-                WHERE rowid IN (
-                    SELECT rowid FROM (
-                        SELECT rowid,
-                               ROW_NUMBER() OVER (
-                                   PARTITION BY discord_user_id, COALESCE(github_user_normalized, '')
-                                   ORDER BY verified DESC, created_at DESC
-                               ) AS rn
-                        FROM identity_links
-                    ) WHERE rn > 1
-                )
-                """
-            )
-            conn.execute(
-                "CREATE UNIQUE INDEX IF NOT EXISTS idx_identity_links_discord_github_norm "
-                "ON identity_links (discord_user_id, github_user_normalized)"
-            )
-            # Issue requests: contributor requests for assignment, mentor reviews
-            conn.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS issue_requests (
-                    request_id TEXT PRIMARY KEY,
-                    discord_user_id TEXT NOT NULL,
-                    github_user TEXT NOT NULL,
-                    owner TEXT NOT NULL,
-                    repo TEXT NOT NULL,
-                    issue_number INTEGER NOT NULL,
-                    issue_url TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'pending'
-                );
-                CREATE INDEX IF NOT EXISTS idx_issue_requests_status ON issue_requests (status);
-                CREATE INDEX IF NOT EXISTS idx_issue_requests_created ON issue_requests (created_at);
-                CREATE TABLE IF NOT EXISTS notifications_sent (
-                    dedupe_key TEXT PRIMARY KEY,
-                    event_type TEXT NOT NULL,
-                    github_user TEXT NOT NULL,
-                    discord_user_id TEXT NOT NULL,
-                    repo TEXT NOT NULL,
-                    target TEXT NOT NULL,
-                    channel_id TEXT,
-                    sent_at TEXT NOT NULL
-                );
-                CREATE INDEX IF NOT EXISTS idx_notifications_sent_github_user ON notifications_sent (github_user);
-                CREATE INDEX IF NOT EXISTS idx_notifications_sent_discord_user ON notifications_sent (discord_user_id);
-                """
+            # Persistent on the database file; lets pooled readers run alongside a writer.
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                self._create_schema(conn)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._schema_ready = True
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS contributions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                github_user TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                repo TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                payload_json TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS scores (
+                github_user TEXT NOT NULL,
+                period_start TEXT NOT NULL,
+                period_end TEXT NOT NULL,
+                points INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (github_user, period_start, period_end)
+            );
+            CREATE TABLE IF NOT EXISTS cursors (
+                source TEXT PRIMARY KEY,
+                cursor TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS identity_links (
+                discord_user_id TEXT NOT NULL,
+                github_user TEXT NOT NULL,
+                verified INTEGER NOT NULL DEFAULT 0,
+                verification_code TEXT,
+                expires_at TEXT,
+                created_at TEXT NOT NULL,
+                verified_at TEXT,
+                PRIMARY KEY (discord_user_id, github_user)
+            );
+            CREATE INDEX IF NOT EXISTS idx_identity_links_github_user
+                ON identity_links (github_user);
+            CREATE INDEX IF NOT EXISTS idx_identity_links_verified
+                ON identity_links (verified);
+            """
+        )
+        # Additive: unlinked_at for unlink flow (preserve history, no row delete).
+        try:
+            conn.execute("ALTER TABLE identity_links ADD COLUMN unlinked_at TEXT")
+        except sqlite3.OperationalError as e:
+            if "duplicate column" not in str(e).lower():
+                raise
+        # Case-insensitive github_user: normalized column for uniqueness and lookups.
+        try:
+            conn.execute("ALTER TABLE identity_links ADD COLUMN github_user_normalized TEXT")
+        except sqlite3.OperationalError as e:
+            if "duplicate column" not in str(e).lower():
+                raise
+        conn.execute(
+            "UPDATE identity_links SET github_user_normalized = lower(github_user) WHERE github_user_normalized IS NULL"
+        )
+        # De-duplicate: keep one row per (discord_user_id, github_user_normalized), prefer verified then newest.
+        conn.execute(
+            """
+            DELETE FROM identity_links
+            WHERE rowid IN (
+                SELECT rowid FROM (
+                    SELECT rowid,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY discord_user_id, COALESCE(github_user_normalized, '')
+                               ORDER BY verified DESC, created_at DESC
+                           ) AS rn
+                    FROM identity_links
+                ) WHERE rn > 1
             )
+            """
+        )
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_identity_links_discord_github_norm "
+            "ON identity_links (discord_user_id, github_user_normalized)"
+        )
+        # Issue requests: contributor requests for assignment, mentor reviews
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS issue_requests (
+                request_id TEXT PRIMARY KEY,
+                discord_user_id TEXT NOT NULL,
+                github_user TEXT NOT NULL,
+                owner TEXT NOT NULL,
+                repo TEXT NOT NULL,
+                issue_number INTEGER NOT NULL,
+                issue_url TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending'
+            );
+            CREATE INDEX IF NOT EXISTS idx_issue_requests_status ON issue_requests (status);
+            CREATE INDEX IF NOT EXISTS idx_issue_requests_created ON issue_requests (created_at);
+            CREATE TABLE IF NOT EXISTS notifications_sent (
+                dedupe_key TEXT PRIMARY KEY,
+                event_type TEXT NOT NULL,
+                github_user TEXT NOT NULL,
+                discord_user_id TEXT NOT NULL,
+                repo TEXT NOT NULL,
+                target TEXT NOT NULL,
+                channel_id TEXT,
+                sent_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_notifications_sent_github_user ON notifications_sent (github_user);
+            CREATE INDEX IF NOT EXISTS idx_notifications_sent_discord_user ON notifications_sent (discord_user_id);
+            CREATE INDEX IF NOT EXISTS idx_contributions_user_created
+                ON contributions (github_user, created_at);
+            """
+        )
+
 
     def record_contributions(self, events: Iterable[ContributionEvent]) -> int:
         stored = 0
@@ -159,17 +226,36 @@ class SqliteStorage:
                 """,
                 (since_utc.isoformat(),),
             ).fetchall()
+        # sqlite3 returns a fresh str per cell; users, repos and event types repeat across
+        # thousands of rows, so intern them to share one object per distinct value.
         return [
             ContributionEvent(
-                github_user=row["github_user"],
-                event_type=row["event_type"],
-                repo=row["repo"],
+                github_user=sys.intern(row["github_user"]),
+                event_type=sys.intern(row["event_type"]),
+                repo=sys.intern(row["repo"]),
                 created_at=_parse_utc(row["created_at"]),
                 payload=json.loads(row["payload_json"]),
             )
             for row in rows
         ]
 
+    def has_activity(self, github_user: str, since: datetime) -> bool:
+        """Return True if github_user has any contribution at or after since.
+        Optional method; a single indexed probe so /summary can skip aggregation for dormant users.
+        """
+        since_utc = _ensure_utc(since)
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT 1
+                FROM contributions
+                WHERE github_user = ? AND created_at >= ?
+                LIMIT 1
+                """,
+                (github_user, since_utc.isoformat()),
+            ).fetchone()
+        return row is not None
+
     def list_contribution_summaries(
         self,
         period_start: datetime,
@@ -386,7 +472,7 @@ class SqliteStorage:
                 """,
                 (discord_user_id, gh_norm),
             ).fetchone()
-            if row and int(row["verified"] or 0) == 1:
+            if row and row["verified"] == 1:
                 # Check if stale
                 is_stale = False
                 if max_age_days is not None and max_age_days > 0:
@@ -525,7 +611,7 @@ class SqliteStorage:
 
     def list_verified_identity_mappings(self) -> list[IdentityMapping]:
         """Return verified identity mappings for engine usage."""
-        with self._connect() as conn:
+        with self._reader() as conn:
             rows = conn.execute(
                 """
                 SELECT discord_user_id, github_user
@@ -539,11 +625,77 @@ class SqliteStorage:
             for row in rows
         ]
 
+    def count_verified_identity_mappings(self) -> int:
+        """Return the number of verified identity mappings.
+        Optional method; lets `identity list` print its header before streaming rows.
+        """
+        with self._reader() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM identity_links WHERE verified = 1").fetchone()
+        return int(row[0])
+
+    def iter_verified_identity_mappings(
+        self, batch_size: int = IDENTITY_PAGE_SIZE
+    ) -> Iterator[IdentityMapping]:
+        """Yield verified mappings in list_verified_identity_mappings order, batch_size rows
+        at a time. Optional method; memory stays bounded by one batch.
+        """
+        with self._reader() as conn:
+            cursor = conn.execute(
+                """
+                SELECT discord_user_id, github_user
+                FROM identity_links
+                WHERE verified = 1
+                ORDER BY discord_user_id ASC
+                """
+            )
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield IdentityMapping(
+                        github_user=row["github_user"], discord_user_id=row["discord_user_id"]
+                    )
+
+    def get_verified_mapping_by_discord(self, discord_user_id: str) -> IdentityMapping | None:
+        """Return the verified identity mapping for a Discord user, or None.
+        Optional method; single primary-key lookup instead of scanning all verified mappings.
+        """
+        with self._reader() as conn:
+            row = conn.execute(
+                """
+                SELECT discord_user_id, github_user
+                FROM identity_links
+                WHERE discord_user_id = ? AND verified = 1
+                ORDER BY github_user ASC
+                LIMIT 1
+                """,
+                (discord_user_id,),
+            ).fetchone()
+        if not row:
+            return None
+        return IdentityMapping(github_user=row["github_user"], discord_user_id=row["discord_user_id"])
+
+    def get_discord_user_for_github_user(self, github_user: str) -> str | None:
+        """Return the Discord user ID verified for github_user, or None.
+        Optional method; single indexed lookup instead of scanning all verified mappings.
+        """
+        with self._reader() as conn:
+            row = conn.execute(
+                """
+                SELECT discord_user_id
+                FROM identity_links
+                WHERE github_user = ? AND verified = 1
+                ORDER BY discord_user_id ASC
+                LIMIT 1
+                """,
+                (github_user,),
+            ).fetchone()
+        return row["discord_user_id"] if row else None
+
     def get_identity_links_for_discord_user(self, discord_user_id: str) -> list[dict]:
         """Return all identity link rows for a Discord user (verified and pending).
         Optional method; not part of the Storage protocol. Used for /verify and /status.
+        ``verified`` is always an int (0/1; the column is NOT NULL), so callers can test it directly.
         """
-        with self._connect() as conn:
+        with self._reader() as conn:
             rows = conn.execute(
                 """
                 SELECT discord_user_id, github_user, verified, verification_code,
@@ -567,7 +719,7 @@ class SqliteStorage:
             max_age_days: Optional max age in days for verified identities. If set and verified_at
                          is older than this, status will be 'verified_stale' and is_stale=True.
         """
-        with self._connect() as conn:
+        with self._reader() as conn:
             row = conn.execute(
                 """
                 SELECT discord_user_id, github_user, verified, verified_at
@@ -578,30 +730,17 @@ class SqliteStorage:
                 """,
                 (discord_user_id,),
             ).fetchone()
-        if not row:
-            return {"github_user": None, "status": "not_linked", "verified_at": None, "is_stale": False}
-        if int(row["verified"] or 0) == 1:
-            verified_at_raw = row["verified_at"]
-            is_stale = False
-            status = "verified"
-            if verified_at_raw and max_age_days is not None and max_age_days > 0:
-                verified_at = _parse_utc(verified_at_raw)
-                age_days = (datetime.now(timezone.utc) - verified_at).days
-                if age_days >= max_age_days:
-                    is_stale = True
-                    status = "verified_stale"
-            return {
-                "github_user": row["github_user"],
-                "status": status,
-                "verified_at": verified_at_raw,
-                "is_stale": is_stale,
-            }
-        return {
-            "github_user": row["github_user"],
-            "status": "pending",
-            "verified_at": None,
-            "is_stale": False,
-        }
+        return _identity_status_from_row(row, max_age_days)
+
+    def get_identity_overview(self, discord_user_id: str, max_age_days: int | None = None) -> dict:
+        """Read-only: link rows and identity status for a Discord user from one query.
+        Returns {"links": <get_identity_links_for_discord_user>, "status": <get_identity_status>}.
+        Optional method; lets /verify, /status, /summary and /identity status share one read.
+        """
+        links = self.get_identity_links_for_discord_user(discord_user_id)
+        # Same ordering as get_identity_status; it ignores unlinked rows.
+        current = next((row for row in links if row.get("unlinked_at") is None), None)
+        return {"links": links, "status": _identity_status_from_row(current, max_age_days)}
 
     def insert_issue_request(
         self,
@@ -672,18 +811,13 @@ class SqliteStorage:
         Returns empty list if file doesn't exist. Does not modify data.
         Optional method; not part of the Storage protocol.
         """
-        path = self._db_path.parent / "audit_events.jsonl"
-        events = []
-        if path.exists():
-            with path.open(encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            events.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            continue
-        return events
+        return list(self.iter_audit_events())
+
+    def iter_audit_events(self) -> Iterator[dict]:
+        """Read-only: stream audit events from audit_events.jsonl without loading them all.
+        Optional method; not part of the Storage protocol.
+        """
+        return iter_jsonl(self._db_path.parent / "audit_events.jsonl")
 
     def was_notification_sent(self, dedupe_key: str) -> bool:
         """Check if notification was already sent (deduplication)."""
@@ -744,6 +878,34 @@ class SqliteStorage:
         return [dict(row) for row in rows]
 
 
+def _identity_status_from_row(row: Any, max_age_days: int | None) -> dict:
+    """Build the get_identity_status dict from an identity_links row (sqlite3.Row or dict) or None."""
+    if not row:
+        return {"github_user": None, "status": "not_linked", "verified_at": None, "is_stale": False}
+    if row["verified"] == 1:
+        verified_at_raw = row["verified_at"]
+        is_stale = False
+        status = "verified"
+        if verified_at_raw and max_age_days is not None and max_age_days > 0:
+            verified_at = _parse_utc(verified_at_raw)
+            age_days = (datetime.now(timezone.utc) - verified_at).days
+            if age_days >= max_age_days:
+                is_stale = True
+                status = "verified_stale"
+        return {
+            "github_user": row["github_user"],
+            "status": status,
+            "verified_at": verified_at_raw,
+            "is_stale": is_stale,
+        }
+    return {
+        "github_user": row["github_user"],
+        "status": "pending",
+        "verified_at": None,
+        "is_stale": False,
+    }
+
+
 def _ensure_utc(value: datetime) -> datetime:
     """Normalize timestamps to UTC with tzinfo for safe SQLite ordering."""
     if value.tzinfo is None:
@@ -3,23 +3,33 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import hashlib
+import itertools
+import json
 import logging
+import math
+import time
 import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from pathlib import Path
+from typing import Any, Awaitable, Callable
 
 import discord
 from discord import app_commands
 
 from ghdcbot.adapters.github.identity import GitHubIdentityReader
 from ghdcbot.config.loader import load_config
-from ghdcbot.core.errors import ConfigError
-from ghdcbot.engine.identity_linking import IdentityLinkService
+from ghdcbot.core.errors import ConfigError, GitHubRateLimitError
+from ghdcbot.engine.identity_linking import IdentityLinkService, IdentityView, build_identity_view
 from ghdcbot.engine.metrics import (
     format_metrics_summary,
-    get_contribution_metrics,
-    get_rank_for_user,
-    rank_by_activity,
+    get_contribution_metrics_windows,
+    get_rank_for_user_direct,
+    index_metrics_by_user,
 )
 from ghdcbot.core.modes import MutationPolicy, RunMode
 from ghdcbot.engine.issue_assignment import (
@@ -50,27 +60,689 @@ from ghdcbot.engine.pr_context import (
 )
 from ghdcbot.logging.setup import configure_logging
 from ghdcbot.plugins.registry import build_adapter
+from ghdcbot.utils.cache import TTLCache
+from ghdcbot.utils.ratelimit import Cooldown
 from ghdcbot.discord_command_permissions import (
+    compile_command_access,
     format_slash_command_permission_denied,
-    slash_command_allowed,
+    member_has_access,
 )
 
+logger = logging.getLogger("ghdcbot.bot")
+
+# Sentinel for TTLCache.get when None is a valid cached value.
+_CACHE_MISS = object()
+
 # Slash command names used for permission checks (must match @tree.command name=...)
 SLASH_CMD_ASSIGN_ISSUE = "assign-issue"
 SLASH_CMD_ISSUE_REQUESTS = "issue-requests"
 SLASH_CMD_SYNC = "sync"
 
+# How long identity link/status reads are reused for the same Discord user.
+IDENTITY_CACHE_TTL_SECONDS = 60.0
+# Upper bound on worker threads used by asyncio.to_thread for storage/GitHub calls.
+BOT_WORKER_THREADS = 8
+# Pending requests whose issue/metrics are loaded at once when a mentor picks a repo.
+REVIEW_FETCH_CONCURRENCY = BOT_WORKER_THREADS
+# Most review cards sent per repo pick (oldest first); matches the 25-option select cap.
+MAX_REVIEW_CARDS = 25
+# How long the guild member → roles mapping is reused across commands.
+MEMBER_ROLES_CACHE_TTL_SECONDS = 30.0
+# How long a PR author's Discord mention is reused across previews.
+MENTION_CACHE_TTL_SECONDS = 300.0
+# How long a fetched issue / PR context is reused by read-only lookups (not by the
+# pre-write re-checks, which always go to GitHub). Keys are (owner, repo, number).
+ISSUE_CONTEXT_CACHE_TTL_SECONDS = 30.0
+PR_CONTEXT_CACHE_TTL_SECONDS = 60.0
+# Per-user cooldowns: read-only commands hit storage; /link and /verify-link also hit GitHub.
+READ_COMMAND_COOLDOWN_SECONDS = 5.0
+LINK_COMMAND_COOLDOWN_SECONDS = 30.0
+
+# Reply templates for identity commands (only the placeholders change per call).
+LINK_CODE_MSG = (
+    "**Verification code:** `{code}`\n\n"
+    "1. Put this code in your **GitHub profile bio** or in a **public gist**.\n"
+    "2. Run `/verify-link` with `{github_user}` here.\n\n"
+    "Code expires at (UTC): {expires_at}"
+)
+VERIFY_ALREADY_LINKED_MSG = "Your account is already linked to **{github_user}**."
+VERIFY_SUCCESS_MSG = "Verified: **{github_user}** ↔ your Discord (found in {location})."
+VERIFY_EXPIRED_MSG = "Verification code expired. Run `/link` again to get a new code."
+VERIFY_NOT_FOUND_MSG = (
+    "Code not found yet. Add the code to your GitHub bio or a public gist, then run `/verify-link` again."
+)
+NOT_LINKED_MSG = "Not linked. Use `/link` to start."
+LINKED_TO_MSG = "Linked to GitHub: **{github_user}**."
+PENDING_LINK_MSG = "Pending: link to **{github_user}** (expires: {expires_at}). Run `/verify-link` to complete."
+IDENTITY_STATUS_MSG = (
+    "**GitHub user:** {github_user}\n"
+    "**Status:** {status_label}\n"
+    "**Verified at:** {verified_at}"
+)
+# Skip reason shown when policy blocks a GitHub write; any other mode is "write disabled".
+SKIP_REASON_BY_MODE = {RunMode.DRY_RUN: "dry-run", RunMode.OBSERVER: "observer mode"}
+# (color, title) stamped onto the original embed once a view's action completes.
+EMBED_ISSUE_ASSIGNED = (0x10B981, "✅ Issue Assigned")
+EMBED_ISSUE_REASSIGNED = (0x10B981, "🔁 Issue Reassigned")
+EMBED_ASSIGNMENT_CANCELLED = (0xEF4444, "❌ Assignment Cancelled")
+EMBED_REQUEST_APPROVED = (0x10B981, "✅ Approved & assigned")
+EMBED_REQUEST_REASSIGNED = (0x10B981, "🔁 Reassigned")
+EMBED_REQUEST_REJECTED = (0xEF4444, "❌ Rejected")
+GITHUB_RATE_LIMIT_MSG = "GitHub rate limit reached; try again in {seconds} seconds."
+# /assign-issue confirmations a single mentor may have open at once.
+MAX_OPEN_ASSIGNMENT_VIEWS_PER_USER = 3
+# File under data_dir recording the last command set synced to the guild (delete to force a sync).
+SLASH_SYNC_STATE_FILE = ".slash_sync_hash"
+STALE_IDENTITY_WARNING = (
+    "\n\n⚠️ **Warning:** Your identity verification is stale. Use `/verify-link` to refresh it."
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _did_str(uid: int) -> str:
+    """Return the storage-form (string) Discord user ID, reusing one str per active user."""
+    return str(uid)
+
+
+async def _reply_rate_limited(
+    interaction: discord.Interaction, exc: GitHubRateLimitError
+) -> None:
+    """Tell the user when GitHub's budget resets instead of surfacing a generic failure."""
+    msg = GITHUB_RATE_LIMIT_MSG.format(seconds=exc.retry_after_seconds())
+    if interaction.response.is_done():
+        await interaction.followup.send(msg, ephemeral=True)
+    else:
+        await interaction.response.send_message(msg, ephemeral=True)
+
+
+async def _close_card(message: discord.Message, overlay: tuple[int, str]) -> None:
+    """Recolour and retitle the card embed in place and drop its buttons; edit errors ignored."""
+    embed = message.embeds[0] if message.embeds else discord.Embed()
+    embed.colour = discord.Colour(overlay[0])
+    embed.title = overlay[1]
+    with contextlib.suppress(Exception):
+        await message.edit(embed=embed, view=None)
+
+
+def _append_audit_sync(storage: Any, event: dict[str, Any]) -> None:
+    """Append an audit event if storage supports it; a failed write is logged, never raised."""
+    append = getattr(storage, "append_audit_event", None) if storage else None
+    if append is None:
+        return
+    try:
+        append(event)
+    except Exception as exc:
+        logger.warning(
+            "Failed to append audit event",
+            exc_info=exc,
+            extra={"event_type": event.get("event_type")},
+        )
+
+
+async def _append_audit(storage: Any, event: dict[str, Any]) -> None:
+    """Append an audit event on a worker thread so storage latency never blocks the loop."""
+    await asyncio.to_thread(_append_audit_sync, storage, event)
+
+
+# Strong references to fire-and-forget tasks; the loop only keeps weak ones.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _append_audit_soon(storage: Any, event: dict[str, Any]) -> None:
+    """Schedule an informational audit write without making the caller wait for it.
+
+    Only for events nothing downstream reads back (e.g. "mentor viewed a repo");
+    decision audits (approve/reject/assign) are still awaited so they land in order.
+    """
+    task = asyncio.get_running_loop().create_task(_append_audit(storage, event))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_iso_utc(value: str) -> str:
+    """Format an ISO-8601 timestamp for display; returns value unchanged if unparseable.
+
+    Python 3.11+ (the project minimum) parses a trailing ``Z`` natively, so no rewrite is needed.
+    """
+    try:
+        dt = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return value
+    return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+@functools.lru_cache(maxsize=32)
+def _repo_select_options(
+    repos: tuple[tuple[str, str, int], ...],
+) -> tuple[discord.SelectOption, ...]:
+    """Build repository select options; "Back" re-renders the same (owner, repo, count) list."""
+    return tuple(
+        discord.SelectOption(
+            label=f"{owner}/{repo}"[:100],
+            value=f"{owner}/{repo}",
+            description=f"{count} request(s)",
+        )
+        for owner, repo, count in repos
+    )
+
+
+def _command_sync_key(
+    tree: app_commands.CommandTree, guild: discord.abc.Snowflake, application_id: int | None
+) -> str:
+    """Identify the exact command payload tree.sync would upload for this app and guild."""
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda command: (command.get("type", 1), command["name"]),
+    )
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    return f"{application_id}:{guild.id}:{digest}"
+
+
+def _is_closed(issue: dict[str, Any]) -> bool:
+    """GitHub's REST API reports issue state in lowercase ("open"/"closed")."""
+    return issue.get("state") == "closed"
+
+
+_UNDATED_REQUEST = datetime.max.replace(tzinfo=timezone.utc)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_request_created_at(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return _UNDATED_REQUEST
+
+
+def _request_created_at(req: dict) -> datetime:
+    """Parse created_at from request dict for sorting (oldest first).
+
+    Parses are memoised by string, so re-listing the same pending requests after
+    "Back" does not re-parse every timestamp.
+    """
+    v = req.get("created_at")
+    if v is None:
+        return _UNDATED_REQUEST
+    return _parse_request_created_at(str(v))
+
+
+def deferred(*, ephemeral: bool = True) -> Callable:
+    """Decorate a slash command so the interaction is deferred before the handler body runs.
+
+    Keeps the ACK ahead of any parsing, storage or GitHub work (Discord's 3-second limit);
+    handlers then reply with ``interaction.followup``. Apply below ``@tree.command``/``@describe``.
+    Logs ACK and total latency per command at debug level.
+    """
+
+    def decorator(func: Callable[..., Awaitable[None]]) -> Callable[..., Awaitable[None]]:
+        @functools.wraps(func)
+        async def wrapper(interaction: discord.Interaction, *args: Any, **kwargs: Any) -> None:
+            started = time.perf_counter()
+            await interaction.response.defer(ephemeral=ephemeral)
+            acked = time.perf_counter()
+            try:
+                await func(interaction, *args, **kwargs)
+            finally:
+                logger.debug(
+                    "Slash command timing",
+                    extra={
+                        "command": getattr(interaction.command, "qualified_name", func.__name__),
+                        "ack_ms": round((acked - started) * 1000, 1),
+                        "total_ms": round((time.perf_counter() - started) * 1000, 1),
+                    },
+                )
+
+        return wrapper
+
+    return decorator
+
+
+# Open /assign-issue confirmations; weak so a view discord.py has dropped does not linger here.
+_active_assignment_views: weakref.WeakSet[IssueAssignmentView] = weakref.WeakSet()
+
+
+def _open_assignment_views(actor_discord_id: str) -> int:
+    """Number of unfinished IssueAssignmentViews started by actor_discord_id."""
+    return sum(1 for v in _active_assignment_views if v.actor_discord_id == actor_discord_id)
+
+
+class IssueAssignmentView(discord.ui.View):
+    """View with buttons for confirming issue assignment."""
+    
+    def __init__(
+        self,
+        owner: str,
+        repo: str,
+        issue_number: int,
+        new_assignee_github: str,
+        new_assignee_discord: str | None,
+        has_existing_assignee: bool,
+        github_adapter: Any,
+        storage: Any,
+        policy: MutationPolicy,
+        discord_writer: Any = None,
+        notification_config: Any = None,
+        github_org: str = "",
+        timeout: float = 300.0,  # 5 minutes
+        actor_discord_id: str | None = None,
+        issue_cache: TTLCache | None = None,
+    ) -> None:
+        super().__init__(timeout=timeout)
+        self.actor_discord_id = actor_discord_id
+        self.issue_cache = issue_cache
+        # Serialises button clicks and the timeout: a second click (e.g. a double-click during
+        # the verify-retry loop) waits, then finds the view finished instead of using adapters
+        # that _release() has already dropped.
+        self._action_lock = asyncio.Lock()
+        _active_assignment_views.add(self)
+        self.owner = owner
+        self.repo = repo
+        self.issue_number = issue_number
+        self.new_assignee_github = new_assignee_github
+        self.new_assignee_discord = new_assignee_discord
+        self.has_existing_assignee = has_existing_assignee
+        self.github_adapter = github_adapter
+        self.storage = storage
+        self.policy = policy
+        self.discord_writer = discord_writer
+        self.notification_config = notification_config
+        self.github_org = github_org
+        # Policy is fixed for the view's lifetime; resolve the skip reason once.
+        self._skip_reason_cached: str | None = (
+            None
+            if policy.allow_github_mutations
+            else SKIP_REASON_BY_MODE.get(policy.mode, "write disabled")
+        )
+    
+    async def on_timeout(self) -> None:
+        """Handle view timeout."""
+        async with self._action_lock:
+            for item in self.children:
+                item.disabled = True
+            if hasattr(self, "message") and self.message:
+                try:
+                    await self.message.edit(view=self)
+                except discord.NotFound:
+                    pass
+            self._release()
+
+    async def _run_action(
+        self,
+        interaction: discord.Interaction,
+        action: Callable[[discord.Interaction], Awaitable[None]],
+    ) -> None:
+        """Run a button action under the view lock, unless an earlier one finished the view."""
+        async with self._action_lock:
+            if self.is_finished():
+                await interaction.followup.send(
+                    "This assignment has already been handled.", ephemeral=True
+                )
+                return
+            await action(interaction)
+
+    def _forget_issue(self) -> None:
+        """Drop the cached issue after a write so later lookups see the new assignees."""
+        if self.issue_cache is not None:
+            self.issue_cache.invalidate((self.owner, self.repo, self.issue_number))
+
+    def _release(self) -> None:
+        """Stop listening and drop adapter/storage references once the view is finished."""
+        _active_assignment_views.discard(self)
+        self.stop()
+        self.github_adapter = None
+        self.storage = None
+        self.discord_writer = None
+    
+    async def on_error(
+        self, interaction: discord.Interaction, error: Exception, item: discord.ui.Item
+    ) -> None:
+        if isinstance(error, GitHubRateLimitError):
+            await _reply_rate_limited(interaction, error)
+            return
+        await super().on_error(interaction, error, item)
+
+    async def _skip_if_read_only(self, interaction: discord.Interaction) -> bool:
+        """Reply and audit when policy forbids GitHub writes; return True if the action is skipped."""
+        skip_reason = self._skip_reason_cached
+        if skip_reason is None:
+            return False
+        await interaction.followup.send(
+            f"❌ Assignment skipped ({skip_reason}). No changes made.",
+            ephemeral=True,
+        )
+        # Log audit event
+        await _append_audit(self.storage, {
+            "event_type": "issue_assignment_cancelled",
+            "context": {
+                "reason": skip_reason,
+                "issue": f"{self.owner}/{self.repo}#{self.issue_number}",
+                "proposed_assignee": self.new_assignee_github,
+                "actor_discord_id": _did_str(interaction.user.id),
+            },
+        })
+        return True
+
+    async def _recheck_issue(self, interaction: discord.Interaction) -> dict | None:
+        """Re-fetch the issue (TOCTOU protection); reply and return None if it is gone or closed."""
+        issue = await asyncio.to_thread(
+            fetch_issue_context, self.github_adapter, self.owner, self.repo, self.issue_number
+        )
+        if not issue:
+            await interaction.followup.send(
+                "❌ Issue not found or inaccessible. Assignment cancelled.",
+                ephemeral=True,
+            )
+            return None
+        if _is_closed(issue):
+            await interaction.followup.send(
+                "❌ Issue is closed. Assignment cancelled.",
+                ephemeral=True,
+            )
+            return None
+        return issue
+
+    @discord.ui.button(label="Confirm Assignment", style=discord.ButtonStyle.success, emoji="✅")
+    async def confirm_assignment(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        """Handle confirm assignment button."""
+        await interaction.response.defer(ephemeral=True)
+        await self._run_action(interaction, self._confirm_assignment)
+
+    async def _confirm_assignment(self, interaction: discord.Interaction) -> None:
+        # Policy gate first: a skipped write does not need the GitHub re-check.
+        if await self._skip_if_read_only(interaction):
+            return
+        
+        issue = await self._recheck_issue(interaction)
+        if issue is None:
+            return
+        
+        # Perform assignment
+        success = await asyncio.to_thread(
+            self.github_adapter.assign_issue,
+            self.owner, self.repo, self.issue_number, self.new_assignee_github
+        )
+        
+        if success:
+            self._forget_issue()
+            # Verify assignment on GitHub (re-fetch issue and check assignees)
+            # Retry a few times to handle GitHub replication lag
+            verified = False
+            assignee_logins_seen: list[str] = []
+            for attempt in range(3):
+                await asyncio.sleep(1.0 + attempt * 0.5)  # 1s, 1.5s, 2s
+                try:
+                    updated = await asyncio.to_thread(
+                        fetch_issue_context,
+                        self.github_adapter, self.owner, self.repo, self.issue_number
+                    )
+                    if updated and updated.get("assignees"):
+                        assignee_logins_seen = [
+                            (a.get("login") or "").lower()
+                            for a in updated["assignees"]
+                            if isinstance(a, dict)
+                        ]
+                        if (self.new_assignee_github or "").lower() in assignee_logins_seen:
+                            verified = True
+                            break
+                    else:
+                        assignee_logins_seen = []
+                except Exception:
+                    assignee_logins_seen = []
+            if not verified:
+                logger.warning(
+                    "Assignment verification failed after retries: expected_assignee=%s assignees_on_issue=%s",
+                    self.new_assignee_github,
+                    assignee_logins_seen,
+                    extra={
+                        "owner": self.owner,
+                        "repo": self.repo,
+                        "issue_number": self.issue_number,
+                    },
+                )
+                # GitHub returned 201 so we treat as success; notify user to check repo if assignee missing
+                await interaction.followup.send(
+                    "✅ Assignment was sent to GitHub. "
+                    "If the assignee does not appear on the issue, they may need to be a **member of the organization**, or the repo may restrict who can be assigned (Settings → General → Issues → Allow specified users to be assigned).",
+                    ephemeral=True,
+                )
+                # Fall through to log audit, send DM, and update embed
+            
+            # Log audit event
+            await _append_audit(self.storage, {
+                "event_type": "issue_assigned_from_discord",
+                "context": {
+                    "actor_discord_id": _did_str(interaction.user.id),
+                    "issue": f"{self.owner}/{self.repo}#{self.issue_number}",
+                    "new_assignee": self.new_assignee_github,
+                    "replaced": self.has_existing_assignee,
+                },
+            })
+            
+            # Send notification to assignee (if enabled and verified)
+            if self.notification_config and self.notification_config.enabled and self.notification_config.issue_assignment:
+                mentor_github = await asyncio.to_thread(
+                    resolve_discord_to_github, self.storage, _did_str(interaction.user.id)
+                )
+                issue_title = issue.get("title", "Untitled")
+                event = ContributionEvent(
+                    github_user=self.new_assignee_github,
+                    event_type="issue_assigned",
+                    repo=self.repo,
+                    created_at=datetime.now(timezone.utc),
+                    payload={
+                        "issue_number": self.issue_number,
+                        "title": issue_title,
+                        "assigned_by": mentor_github or _did_str(interaction.user.id),
+                    },
+                )
+                if self.discord_writer:
+                    await asyncio.to_thread(
+                        send_notification_for_event,
+                        event,
+                        self.storage,
+                        self.discord_writer,
+                        self.policy,
+                        self.notification_config,
+                        self.github_org,
+                    )
+            
+            if verified:
+                await interaction.followup.send(
+                    "✅ Issue assigned successfully!",
+                    ephemeral=True,
+                )
+            
+            # Update original message
+            if hasattr(self, "message") and self.message:
+                await _close_card(self.message, EMBED_ISSUE_ASSIGNED)
+            self._release()
+        else:
+            await interaction.followup.send(
+                "❌ Failed to assign issue. Please try again or check GitHub permissions.",
+                ephemeral=True,
+            )
+    
+    @discord.ui.button(label="Replace Assignee", style=discord.ButtonStyle.primary, emoji="🔁")
+    async def replace_assignee(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        """Handle replace assignee button."""
+        await interaction.response.defer(ephemeral=True)
+        await self._run_action(interaction, self._replace_assignee)
+
+    async def _replace_assignee(self, interaction: discord.Interaction) -> None:
+        # Policy gate first: a skipped write does not need the GitHub re-check.
+        if await self._skip_if_read_only(interaction):
+            return
+        
+        issue = await self._recheck_issue(interaction)
+        if issue is None:
+            return
+        
+        # Get current assignee
+        assignees = issue.get("assignees", [])
+        if not assignees:
+            await interaction.followup.send(
+                "❌ Issue has no current assignee. Use 'Confirm Assignment' instead.",
+                ephemeral=True,
+            )
+            return
+        
+        old_assignee = assignees[0].get("login", "")
+        
+        # Single PATCH sets the assignee list atomically; a failure leaves the old assignee.
+        if not await asyncio.to_thread(
+            self.github_adapter.replace_assignees,
+            self.owner, self.repo, self.issue_number, [self.new_assignee_github]
+        ):
+            await interaction.followup.send(
+                "❌ Reassignment failed (e.g. network or permissions). The current assignee was kept.",
+                ephemeral=True,
+            )
+            return
+        self._forget_issue()
+        # Verify new assignee appears on GitHub (retry for replication lag)
+        verified = False
+        assignee_logins_seen_repl: list[str] = []
+        for attempt in range(3):
+            await asyncio.sleep(1.0 + attempt * 0.5)
+            try:
+                updated = await asyncio.to_thread(
+                    fetch_issue_context,
+                    self.github_adapter, self.owner, self.repo, self.issue_number
+                )
+                if updated and updated.get("assignees"):
+                    assignee_logins_seen_repl = [
+                        (a.get("login") or "").lower()
+                        for a in updated["assignees"]
+                        if isinstance(a, dict)
+                    ]
+                    if (self.new_assignee_github or "").lower() in assignee_logins_seen_repl:
+                        verified = True
+                        break
+                else:
+                    assignee_logins_seen_repl = []
+            except Exception:
+                assignee_logins_seen_repl = []
+        if not verified:
+            logger.warning(
+                "Reassignment verification failed after retries: expected_assignee=%s assignees_on_issue=%s",
+                self.new_assignee_github,
+                assignee_logins_seen_repl,
+                extra={
+                    "owner": self.owner,
+                    "repo": self.repo,
+                    "issue_number": self.issue_number,
+                },
+            )
+            await interaction.followup.send(
+                "✅ Reassignment was sent to GitHub. "
+                "If the assignee does not appear on the issue, they may need to be a **member of the organization**, or the repo may restrict who can be assigned (Settings → General → Issues → Allow specified users to be assigned).",
+                ephemeral=True,
+            )
+        
+        # Log audit event
+        await _append_audit(self.storage, {
+            "event_type": "issue_reassigned_from_discord",
+            "context": {
+                "actor_discord_id": _did_str(interaction.user.id),
+                "issue": f"{self.owner}/{self.repo}#{self.issue_number}",
+                "old_assignee": old_assignee,
+                "new_assignee": self.new_assignee_github,
+            },
+        })
+        
+        # Send notification to new assignee (if enabled and verified)
+        if self.notification_config and self.notification_config.enabled and self.notification_config.issue_assignment:
+            mentor_github = await asyncio.to_thread(
+                resolve_discord_to_github, self.storage, _did_str(interaction.user.id)
+            )
+            issue_title = issue.get("title", "Untitled")
+            event = ContributionEvent(
+                github_user=self.new_assignee_github,
+                event_type="issue_assigned",
+                repo=self.repo,
+                created_at=datetime.now(timezone.utc),
+                payload={
+                    "issue_number": self.issue_number,
+                    "title": issue_title,
+                    "assigned_by": mentor_github or _did_str(interaction.user.id),
+                },
+            )
+            if self.discord_writer:
+                await asyncio.to_thread(
+                    send_notification_for_event,
+                    event,
+                    self.storage,
+                    self.discord_writer,
+                    self.policy,
+                    self.notification_config,
+                    self.github_org,
+                )
+        
+        if verified:
+            await interaction.followup.send(
+                "🔁 Issue reassigned successfully!",
+                ephemeral=True,
+            )
+        
+        # Update original message
+        if hasattr(self, "message") and self.message:
+            await _close_card(self.message, EMBED_ISSUE_REASSIGNED)
+        self._release()
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger, emoji="❌")
+    async def cancel_assignment(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        """Handle cancel button."""
+        await interaction.response.defer(ephemeral=True)
+        await self._run_action(interaction, self._cancel_assignment)
+
+    async def _cancel_assignment(self, interaction: discord.Interaction) -> None:
+        # Log audit event
+        await _append_audit(self.storage, {
+            "event_type": "issue_assignment_cancelled",
+            "context": {
+                "issue": f"{self.owner}/{self.repo}#{self.issue_number}",
+                "proposed_assignee": self.new_assignee_github,
+                "actor_discord_id": _did_str(interaction.user.id),
+            },
+        })
+        
+        await interaction.followup.send(
+            "❌ Assignment cancelled. No changes made.",
+            ephemeral=True,
+        )
+        
+        # Update original message
+        if hasattr(self, "message") and self.message:
+            await _close_card(self.message, EMBED_ASSIGNMENT_CANCELLED)
+        self._release()
+
 
 def run_bot(config_path: str) -> None:
     """Run the Discord bot with /link, /verify-link, /verify, /status, and /summary."""
     config = load_config(config_path)
     configure_logging(config.runtime.log_level)
-    logger = logging.getLogger("ghdcbot.bot")
     logger.info(
         "Using config: %s → data_dir: %s (identity links persist here)",
         config_path,
         config.runtime.data_dir,
     )
+    # Identity settings are fixed for the bot's lifetime; resolve them once for all handlers.
+    identity_cfg = getattr(config, "identity", None)
+    verified_max_age_days = getattr(identity_cfg, "verified_max_age_days", None)
+    unlink_cooldown_hours = getattr(identity_cfg, "unlink_cooldown_hours", 24) or 24
+    # Other config used by handlers, resolved once (config is not reloaded while the bot runs).
+    period_days = config.scoring.period_days
+    # Checked for every guild message in on_message; a frozenset makes it one hash lookup.
+    pr_preview_channels = frozenset(getattr(config.discord, "pr_preview_channels", None) or ())
+    notification_config = getattr(config.discord, "notifications", None)
+    bot_policy = MutationPolicy(
+        mode=config.runtime.mode,
+        github_write_allowed=config.github.permissions.write,
+        discord_write_allowed=config.discord.permissions.write,
+    )
     repo_contributor_roles = getattr(config, "repo_contributor_roles", None) or {}
     if repo_contributor_roles:
         logger.info(
@@ -83,11 +755,107 @@ def run_bot(config_path: str) -> None:
         data_dir=config.runtime.data_dir,
     )
     storage.init_schema()
+    # Optional storage capabilities (not part of the Storage protocol); probe once, not per interaction.
+    get_links_fn = getattr(storage, "get_identity_links_for_discord_user", None)
+    get_status_fn = getattr(storage, "get_identity_status", None)
+    get_overview_fn = getattr(storage, "get_identity_overview", None)
+    list_verified_fn = getattr(storage, "list_verified_identity_mappings", None)
+    list_pending_fn = getattr(storage, "list_pending_issue_requests", None)
+    get_issue_request_fn = getattr(storage, "get_issue_request", None)
+    insert_issue_request_fn = getattr(storage, "insert_issue_request", None)
     github_identity = GitHubIdentityReader(
         token=config.github.token,
-        api_base=str(config.github.api_base),
+        api_base=config.github.api_base,
     )
     service = IdentityLinkService(storage=storage, github_identity=github_identity)
+    # Short-lived per-user cache for identity reads; invalidated on link/verify/unlink.
+    identity_cache = TTLCache(IDENTITY_CACHE_TTL_SECONDS)
+
+    def cached_identity_links(discord_user_id: str) -> list[dict]:
+        return identity_cache.get_or_load(
+            ("links", discord_user_id), lambda: get_links_fn(discord_user_id)
+        )
+
+    def cached_identity_status(discord_user_id: str) -> dict:
+        return identity_cache.get_or_load(
+            ("status", discord_user_id),
+            lambda: get_status_fn(discord_user_id, max_age_days=verified_max_age_days),
+        )
+
+    def peek_identity_status(discord_user_id: str) -> dict | None:
+        """Cached identity status for the user, or None; never touches storage."""
+        overview = identity_cache.get(("overview", discord_user_id))
+        if overview is not None:
+            return overview["status"]
+        return identity_cache.get(("status", discord_user_id))
+
+    # Staleness can only trigger with a positive max age; otherwise /verify, /status and
+    # /summary skip the separate status read (their only use of it is the stale warning).
+    stale_checks_enabled = bool(verified_max_age_days and verified_max_age_days > 0)
+
+    def resolve_identity(discord_user_id: str, with_status: bool = True) -> IdentityView:
+        """Blocking identity read shared by the read-only identity commands (run via asyncio.to_thread).
+
+        with_status=False skips the status read when storage has no combined overview.
+        """
+        if get_overview_fn is not None:
+            # Links and status from one storage read, shared by back-to-back commands.
+            overview = identity_cache.get_or_load(
+                ("overview", discord_user_id),
+                lambda: get_overview_fn(discord_user_id, max_age_days=verified_max_age_days),
+            )
+            return build_identity_view(overview["links"], overview["status"])
+        links = None
+        if get_links_fn is not None:
+            links = cached_identity_links(discord_user_id)
+        elif list_verified_fn is not None:
+            github_user = resolve_discord_to_github(storage, discord_user_id)
+            links = [{"github_user": github_user, "verified": 1}] if github_user else []
+        status = None
+        if with_status and get_status_fn is not None:
+            status = cached_identity_status(discord_user_id)
+        return build_identity_view(links, status)
+
+    # PR authors repeat across previews; memoize the GitHub → Discord mention briefly.
+    mention_cache = TTLCache(MENTION_CACHE_TTL_SECONDS)
+
+    def discord_mention_for(github_user: str) -> str | None:
+        """Blocking lookup of the Discord mention for a verified GitHub user (PR previews)."""
+
+        def load() -> str | None:
+            discord_user_id = resolve_github_to_discord(storage, github_user)
+            return f"<@{discord_user_id}>" if discord_user_id else None
+
+        return mention_cache.get_or_load(github_user, load)
+
+    async def mention_for_author(github_user: str) -> str | None:
+        """Discord mention for a PR author; cache hits are served without a worker-thread hop."""
+        mention = mention_cache.get(github_user, _CACHE_MISS)
+        if mention is _CACHE_MISS:
+            mention = await asyncio.to_thread(discord_mention_for, github_user)
+        return mention
+
+    command_cooldown = Cooldown()
+
+    async def within_cooldown(interaction: discord.Interaction, command_name: str, seconds: float) -> bool:
+        """Return True if the user may run command_name now; otherwise reply (after defer) and return False."""
+        key = (interaction.user.id, command_name)
+        if command_cooldown.try_acquire(key, seconds):
+            return True
+        wait = math.ceil(command_cooldown.remaining(key, seconds))
+        await interaction.followup.send(
+            f"Please wait {wait}s before using `/{command_name}` again.",
+            ephemeral=True,
+        )
+        return False
+
+    def invalidate_identity(discord_user_id: str) -> None:
+        identity_cache.invalidate(("links", discord_user_id))
+        identity_cache.invalidate(("status", discord_user_id))
+        identity_cache.invalidate(("overview", discord_user_id))
+        # Keyed by GitHub user, which unlink does not report; links change rarely, so drop all.
+        mention_cache.clear()
+
     discord_reader = build_adapter(
         config.runtime.discord_adapter,
         token=config.discord.token,
@@ -97,16 +865,25 @@ def run_bot(config_path: str) -> None:
         config.runtime.github_adapter,
         token=config.github.token,
         org=config.github.org,
-        api_base=str(config.github.api_base),
+        api_base=config.github.api_base,
     )
 
     intents = discord.Intents.default()
     # Enable message content intent if passive PR preview is enabled
-    if getattr(config.discord, "pr_preview_channels", None):
+    if pr_preview_channels:
         intents.message_content = True
     client = discord.Client(intents=intents)
     tree = app_commands.CommandTree(client)
+
+    async def setup_hook() -> None:
+        # Blocking storage/metrics/GitHub work is offloaded with asyncio.to_thread; bound the pool.
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=BOT_WORKER_THREADS, thread_name_prefix="ghdcbot-worker")
+        )
+
+    client.setup_hook = setup_hook
     guild_id = int(config.discord.guild_id)
+    guild_obj = discord.Object(id=guild_id)
     
     # Wrapper to adapt discord_reader (has send_dm/send_message) to DiscordWriter interface for notifications
     class DiscordWriterAdapter:
@@ -120,237 +897,253 @@ def run_bot(config_path: str) -> None:
             return send_msg(channel_id, content) if callable(send_msg) else False
     discord_writer_adapter = DiscordWriterAdapter(discord_reader)
 
+    # list_member_roles() pages through every guild member; reuse the mapping briefly (TTL only:
+    # the default intents do not deliver member/role update events to invalidate it).
+    member_roles_cache = TTLCache(MEMBER_ROLES_CACHE_TTL_SECONDS)
+
+    def cached_member_roles() -> dict[str, list[str]]:
+        return member_roles_cache.get_or_load("member_roles", discord_reader.list_member_roles)
+
+    list_roles_for_member_fn = getattr(discord_reader, "list_roles_for_member", None)
+
+    def roles_for_member(discord_user_id: str) -> list[str]:
+        # Prefer a single-member fetch when the adapter supports it; else index the full mapping.
+        if list_roles_for_member_fn is not None:
+            return member_roles_cache.get_or_load(
+                ("member", discord_user_id), lambda: list_roles_for_member_fn(discord_user_id)
+            )
+        return list(cached_member_roles().get(discord_user_id, []))
+
+    issue_context_cache = TTLCache(ISSUE_CONTEXT_CACHE_TTL_SECONDS, maxsize=1024)
+    pr_context_cache = TTLCache(PR_CONTEXT_CACHE_TTL_SECONDS, maxsize=1024)
+
+    def cached_issue_context(owner: str, repo: str, issue_number: int) -> dict | None:
+        """Blocking issue read for display/validation; misses (None) are not cached."""
+        key = (owner, repo, issue_number)
+        issue = issue_context_cache.get(key)
+        if issue is None:
+            issue = fetch_issue_context(github_adapter, owner, repo, issue_number)
+            if issue:
+                issue_context_cache.set(key, issue)
+        return issue
+
+    def cached_pr_context(owner: str, repo: str, pr_number: int) -> tuple:
+        """Blocking fetch_pr_context for /pr-info and previews; inaccessible PRs are not cached."""
+        key = (owner, repo, pr_number)
+        context = pr_context_cache.get(key)
+        if context is None:
+            context = fetch_pr_context(github_adapter, owner, repo, pr_number)
+            if context[0]:
+                pr_context_cache.set(key, context)
+        return context
+
+    # /summary computes the 7- and 30-day windows for every contributor in one storage read.
+    scoring_weights = getattr(config.scoring, "weights", None) or {}
+
+    has_activity_fn = getattr(storage, "has_activity", None)
+
     @tree.command(
         name="link",
         description="Link your Discord account to a GitHub account (you get a verification code)",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
     @app_commands.describe(github_username="Your GitHub username")
+    @deferred(ephemeral=True)
     async def link_cmd(interaction: discord.Interaction, github_username: str) -> None:
-        await interaction.response.defer(ephemeral=True)
-        discord_user_id = str(interaction.user.id)
-        max_age_days = None
-        if getattr(config, "identity", None) is not None:
-            max_age_days = getattr(config.identity, "verified_max_age_days", None)
+        if not await within_cooldown(interaction, "link", LINK_COMMAND_COOLDOWN_SECONDS):
+            return
+        discord_user_id = _did_str(interaction.user.id)
         try:
-            claim = service.create_claim(discord_user_id, github_username, max_age_days=max_age_days)
+            claim = await asyncio.to_thread(
+                service.create_claim,
+                discord_user_id, github_username, max_age_days=verified_max_age_days
+            )
         except ValueError as e:
             await interaction.followup.send(
                 f"Cannot create link: {e}",
                 ephemeral=True,
             )
             return
-        msg = (
-            f"**Verification code:** `{claim.verification_code}`\n\n"
-            "1. Put this code in your **GitHub profile bio** or in a **public gist**.\n"
-            f"2. Run `/verify-link` with `{github_username}` here.\n\n"
-            f"Code expires at (UTC): {claim.expires_at.isoformat()}"
+        invalidate_identity(discord_user_id)
+        msg = LINK_CODE_MSG.format(
+            code=claim.verification_code,
+            github_user=github_username,
+            expires_at=claim.expires_at_iso,
         )
         await interaction.followup.send(msg, ephemeral=True)
 
     @tree.command(
         name="verify-link",
         description="Verify your GitHub link after adding the code to your bio or a gist",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
     @app_commands.describe(github_username="Your GitHub username")
+    @deferred(ephemeral=True)
     async def verify_link_cmd(interaction: discord.Interaction, github_username: str) -> None:
-        await interaction.response.defer(ephemeral=True)
-        discord_user_id = str(interaction.user.id)
+        if not await within_cooldown(interaction, "verify-link", LINK_COMMAND_COOLDOWN_SECONDS):
+            return
+        discord_user_id = _did_str(interaction.user.id)
+        # Repeat /verify-link after success: answer from the identity cache on the event loop.
+        known = peek_identity_status(discord_user_id)
+        if (
+            known
+            and known.get("status") == "verified"
+            and (known.get("github_user") or "").lower() == github_username.lower()
+        ):
+            await interaction.followup.send(
+                VERIFY_ALREADY_LINKED_MSG.format(github_user=github_username),
+                ephemeral=True,
+            )
+            return
         try:
-            ok, location = service.verify_claim(discord_user_id, github_username)
+            ok, location = await asyncio.to_thread(
+                service.verify_claim, discord_user_id, github_username
+            )
         except ValueError as e:
             await interaction.followup.send(
                 f"Verification failed: {e}",
                 ephemeral=True,
             )
             return
+        invalidate_identity(discord_user_id)
         if ok:
             if location == "already-verified":
                 await interaction.followup.send(
-                    f"Your account is already linked to **{github_username}**.",
+                    VERIFY_ALREADY_LINKED_MSG.format(github_user=github_username),
                     ephemeral=True,
                 )
             else:
                 await interaction.followup.send(
-                    f"Verified: **{github_username}** ↔ your Discord (found in {location}).",
+                    VERIFY_SUCCESS_MSG.format(github_user=github_username, location=location),
                     ephemeral=True,
                 )
         else:
             if location == "expired":
-                await interaction.followup.send(
-                    "Verification code expired. Run `/link` again to get a new code.",
-                    ephemeral=True,
-                )
+                await interaction.followup.send(VERIFY_EXPIRED_MSG, ephemeral=True)
             else:
-                await interaction.followup.send(
-                    "Code not found yet. Add the code to your GitHub bio or a public gist, then run `/verify-link` again.",
-                    ephemeral=True,
-                )
+                await interaction.followup.send(VERIFY_NOT_FOUND_MSG, ephemeral=True)
 
     @tree.command(
         name="verify",
         description="Show your GitHub link verification status (read-only)",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
+    @deferred(ephemeral=True)
     async def verify_cmd(interaction: discord.Interaction) -> None:
-        await interaction.response.defer(ephemeral=True)
-        discord_user_id = str(interaction.user.id)
-        get_links = getattr(storage, "get_identity_links_for_discord_user", None)
-        if callable(get_links):
-            try:
-                links = await asyncio.to_thread(get_links, discord_user_id)
-            except Exception as e:
-                logger.exception("verify: get_identity_links failed")
-                await interaction.followup.send(
-                    "Could not load link status. Please try again.",
-                    ephemeral=True,
-                )
-                return
-        else:
-            links = []
-            verified = getattr(storage, "list_verified_identity_mappings", None)
-            if callable(verified):
-                try:
-                    mappings = await asyncio.to_thread(lambda: list(verified()))
-                    for m in mappings:
-                        if m.discord_user_id == discord_user_id:
-                            links.append({"github_user": m.github_user, "verified": 1})
-                            break
-                except Exception as e:
-                    logger.exception("verify: list_verified failed")
-                    await interaction.followup.send(
-                        "Could not load link status. Please try again.",
-                        ephemeral=True,
-                    )
-                    return
-        if not links:
+        if not await within_cooldown(interaction, "verify", READ_COMMAND_COOLDOWN_SECONDS):
+            return
+        discord_user_id = _did_str(interaction.user.id)
+        try:
+            view = await asyncio.to_thread(resolve_identity, discord_user_id, stale_checks_enabled)
+        except Exception:
+            logger.exception("verify: identity lookup failed")
             await interaction.followup.send(
-                "Not linked. Use `/link` to start.",
+                "Could not load link status. Please try again.",
                 ephemeral=True,
             )
             return
-        verified_row = next((r for r in links if int(r.get("verified") or 0) == 1), None)
-        pending = [r for r in links if int(r.get("verified") or 0) == 0]
-        if verified_row:
-            msg = f"Linked to GitHub: **{verified_row.get('github_user', '?')}**."
-            # Check for stale status (run in thread to avoid blocking event loop)
-            get_status = getattr(storage, "get_identity_status", None)
-            if callable(get_status):
-                max_age_days = None
-                if getattr(config, "identity", None) is not None:
-                    max_age_days = getattr(config.identity, "verified_max_age_days", None)
-                try:
-                    status = await asyncio.to_thread(
-                        get_status, discord_user_id, max_age_days=max_age_days
-                    )
-                    if status.get("is_stale"):
-                        msg += "\n\n⚠️ **Warning:** Your identity verification is stale. Use `/verify-link` to refresh it."
-                except Exception:
-                    pass  # keep message without stale warning
+        if view.is_linked:
+            msg = LINKED_TO_MSG.format(github_user=view.github_user or "?")
+            if view.is_stale:
+                msg += STALE_IDENTITY_WARNING
             await interaction.followup.send(msg, ephemeral=True)
-        elif pending:
-            p = pending[0]
-            exp = p.get("expires_at") or "—"
+        elif view.pending_github_user is not None:
             await interaction.followup.send(
-                f"Pending: link to **{p.get('github_user', '?')}** (expires: {exp}). Run `/verify-link` to complete.",
+                PENDING_LINK_MSG.format(
+                    github_user=view.pending_github_user,
+                    expires_at=view.pending_expires_at or "—",
+                ),
                 ephemeral=True,
             )
         else:
-            await interaction.followup.send(
-                "Not linked. Use `/link` to start.",
-                ephemeral=True,
-            )
+            await interaction.followup.send(NOT_LINKED_MSG, ephemeral=True)
 
     @tree.command(
         name="status",
         description="Show verification state, activity window, and your roles (read-only)",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
+    @deferred(ephemeral=True)
     async def status_cmd(interaction: discord.Interaction) -> None:
-        await interaction.response.defer(ephemeral=True)
-        discord_user_id = str(interaction.user.id)
-        period_days = config.scoring.period_days
-        lines = [f"**Activity window:** last {period_days} days (from bot config)."]
-        get_links = getattr(storage, "get_identity_links_for_discord_user", None)
-        if callable(get_links):
-            links = get_links(discord_user_id)
-            verified_row = next((r for r in links if int(r.get("verified") or 0) == 1), None)
-            if verified_row:
-                lines.append(f"**Linked GitHub:** {verified_row.get('github_user', '?')}.")
-                # Check for stale status
-                get_status = getattr(storage, "get_identity_status", None)
-                if callable(get_status):
-                    max_age_days = None
-                    if getattr(config, "identity", None) is not None:
-                        max_age_days = getattr(config.identity, "verified_max_age_days", None)
-                    status = get_status(discord_user_id, max_age_days=max_age_days)
-                    if status.get("is_stale"):
-                        lines.append("⚠️ **Warning:** Identity verification is stale. Use `/verify-link` to refresh.")
-            else:
-                lines.append("**Linked GitHub:** not linked.")
-        else:
-            lines.append("**Linked GitHub:** (link status unavailable).")
-        member_roles = discord_reader.list_member_roles()
-        my_roles = member_roles.get(discord_user_id, [])
+        if not await within_cooldown(interaction, "status", READ_COMMAND_COOLDOWN_SECONDS):
+            return
+        discord_user_id = _did_str(interaction.user.id)
+        # Fixed layout: activity window, linked account, optional stale warning, roles.
+        view = await asyncio.to_thread(resolve_identity, discord_user_id, stale_checks_enabled)
+        linked_line = "**Linked GitHub:** (link status unavailable)."
+        stale_line = ""
+        if view.is_linked:
+            linked_line = f"**Linked GitHub:** {view.github_user or '?'}."
+            if view.is_stale:
+                stale_line = "\n⚠️ **Warning:** Identity verification is stale. Use `/verify-link` to refresh."
+        elif view.links_available:
+            linked_line = "**Linked GitHub:** not linked."
+        my_roles = await asyncio.to_thread(roles_for_member, discord_user_id)
         if my_roles:
-            lines.append(f"**Your roles:** {', '.join(my_roles)}.")
+            roles_line = f"**Your roles:** {', '.join(my_roles)}."
         else:
-            lines.append("**Your roles:** (none or unable to read).")
-        await interaction.followup.send("\n".join(lines), ephemeral=True)
+            roles_line = "**Your roles:** (none or unable to read)."
+        msg = (
+            f"**Activity window:** last {period_days} days (from bot config).\n"
+            f"{linked_line}{stale_line}\n{roles_line}"
+        )
+        await interaction.followup.send(msg, ephemeral=True)
 
     @tree.command(
         name="summary",
         description="Show your contribution metrics summary (last 7 and 30 days; read-only)",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
+    @deferred(ephemeral=True)
     async def summary_cmd(interaction: discord.Interaction) -> None:
-        await interaction.response.defer(ephemeral=True)
-        discord_user_id = str(interaction.user.id)
-        get_links = getattr(storage, "get_identity_links_for_discord_user", None)
-        if not callable(get_links):
+        if not await within_cooldown(interaction, "summary", READ_COMMAND_COOLDOWN_SECONDS):
+            return
+        discord_user_id = _did_str(interaction.user.id)
+        view = await asyncio.to_thread(resolve_identity, discord_user_id, stale_checks_enabled)
+        if not view.links_available:
             await interaction.followup.send(
                 "Link status unavailable. Use `/link` to link your GitHub account.",
                 ephemeral=True,
             )
             return
-        links = get_links(discord_user_id)
-        verified_row = next((r for r in links if int(r.get("verified") or 0) == 1), None)
-        if not verified_row:
+        if not view.is_linked:
             await interaction.followup.send(
                 "Link your account with `/link` and `/verify-link` to see your summary.",
                 ephemeral=True,
             )
             return
-        github_user = verified_row.get("github_user", "")
+        github_user = view.github_user
         if not github_user:
             await interaction.followup.send("Linked user unknown.", ephemeral=True)
             return
-        # Check for stale status
         stale_warning = ""
-        get_status = getattr(storage, "get_identity_status", None)
-        if callable(get_status):
-            max_age_days = None
-            if getattr(config, "identity", None) is not None:
-                max_age_days = getattr(config.identity, "verified_max_age_days", None)
-            status = get_status(discord_user_id, max_age_days=max_age_days)
-            if status.get("is_stale"):
-                stale_warning = "\n\n⚠️ **Warning:** Identity verification is stale. Use `/verify-link` to refresh it."
-        now = datetime.now(timezone.utc)
-        weights = getattr(config.scoring, "weights", None) or {}
-        parts = []
-        for days in (7, 30):
-            start = now - timedelta(days=days)
-            metrics_list = get_contribution_metrics(storage, start, now, weights)
-            user_metrics = next((m for m in metrics_list if m.github_user == github_user), None)
-            parts.append(f"**Last {days} days:**\n{format_metrics_summary(user_metrics)}")
-        ranked_30 = rank_by_activity(
-            get_contribution_metrics(storage, now - timedelta(days=30), now, weights)
+        if view.is_stale:
+            stale_warning = "\n\n⚠️ **Warning:** Identity verification is stale. Use `/verify-link` to refresh it."
+        # One clock read so both windows share the same end boundary.
+        now = discord.utils.utcnow()
+        # Dormant users: one indexed probe instead of aggregating both windows.
+        if has_activity_fn is not None and not await asyncio.to_thread(
+            has_activity_fn, github_user, now - timedelta(days=30)
+        ):
+            await interaction.followup.send(
+                "No activity in the last 30 days." + stale_warning, ephemeral=True
+            )
+            return
+        windows = await asyncio.to_thread(
+            get_contribution_metrics_windows, storage, now, (7, 30), scoring_weights
+        )
+        metrics_7, metrics_30 = windows[7], windows[30]
+        user_metrics_7 = index_metrics_by_user(metrics_7).get(github_user)
+        user_metrics_30 = index_metrics_by_user(metrics_30).get(github_user)
+        msg = (
+            f"**Last 7 days:**\n{format_metrics_summary(user_metrics_7)}\n\n"
+            f"**Last 30 days:**\n{format_metrics_summary(user_metrics_30)}"
         )
-        rank = get_rank_for_user(ranked_30, github_user)
+        # Reuse the 30-day window for ranking; only the caller's position is needed, so skip the sort.
+        rank = get_rank_for_user_direct(metrics_30, github_user)
         if rank is not None:
-            parts.append(f"Top contributors by activity (last 30 days): you're #{rank}.")
-        await interaction.followup.send("\n\n".join(parts) + stale_warning, ephemeral=True)
+            msg += f"\n\nTop contributors by activity (last 30 days): you're #{rank}."
+        await interaction.followup.send(msg + stale_warning, ephemeral=True)
 
     identity_group = app_commands.Group(
         name="identity",
@@ -361,22 +1154,20 @@ def run_bot(config_path: str) -> None:
         name="status",
         description="Show your linked GitHub account and verification status (read-only)",
     )
+    @deferred(ephemeral=True)
     async def identity_status_cmd(interaction: discord.Interaction) -> None:
-        await interaction.response.defer(ephemeral=True)
-        discord_user_id = str(interaction.user.id)
-        get_status = getattr(storage, "get_identity_status", None)
-        if not callable(get_status):
+        if not await within_cooldown(interaction, "identity status", READ_COMMAND_COOLDOWN_SECONDS):
+            return
+        discord_user_id = _did_str(interaction.user.id)
+        if get_status_fn is None:
             await interaction.followup.send(
                 "Identity status is unavailable.",
                 ephemeral=True,
             )
             return
-        max_age_days = None
-        if getattr(config, "identity", None) is not None:
-            max_age_days = getattr(config.identity, "verified_max_age_days", None)
-        status = get_status(discord_user_id, max_age_days=max_age_days)
-        github_user = status.get("github_user") or "—"
-        st = status.get("status") or "not_linked"
+        # Still backed by get_identity_status; resolve_identity shares the cached read with /verify.
+        view = await asyncio.to_thread(resolve_identity, discord_user_id)
+        st = view.status
         if st == "verified":
             status_label = "Verified ✅"
         elif st == "verified_stale":
@@ -385,38 +1176,29 @@ def run_bot(config_path: str) -> None:
             status_label = "Pending ⏳"
         else:
             status_label = "Not linked ❌"
-        verified_at = status.get("verified_at")
-        verified_at_str = verified_at if verified_at else "—"
-        if verified_at_str != "—":
-            try:
-                dt = datetime.fromisoformat(verified_at_str.replace("Z", "+00:00"))
-                verified_at_str = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-            except (ValueError, TypeError):
-                pass
-        msg = (
-            f"**GitHub user:** {github_user}\n"
-            f"**Status:** {status_label}\n"
-            f"**Verified at:** {verified_at_str}"
+        verified_at_str = _format_iso_utc(view.verified_at) if view.verified_at else "—"
+        msg = IDENTITY_STATUS_MSG.format(
+            github_user=view.status_github_user or "—",
+            status_label=status_label,
+            verified_at=verified_at_str,
         )
-        if status.get("is_stale"):
-            msg += "\n\n⚠️ **Warning:** Your identity verification is stale. Use `/verify-link` to refresh it."
+        if view.is_stale:
+            msg += STALE_IDENTITY_WARNING
         await interaction.followup.send(msg, ephemeral=True)
 
-    tree.add_command(identity_group, guild=discord.Object(id=guild_id))
+    tree.add_command(identity_group, guild=guild_obj)
 
     @tree.command(
         name="unlink",
         description="Unlink your verified GitHub identity (cooldown applies after verification)",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
+    @deferred(ephemeral=True)
     async def unlink_cmd(interaction: discord.Interaction) -> None:
-        await interaction.response.defer(ephemeral=True)
-        discord_user_id = str(interaction.user.id)
-        cooldown = 24
-        if getattr(config, "identity", None) is not None:
-            cooldown = getattr(config.identity, "unlink_cooldown_hours", 24) or 24
+        discord_user_id = _did_str(interaction.user.id)
         try:
-            service.unlink(discord_user_id, cooldown)
+            await asyncio.to_thread(service.unlink, discord_user_id, unlink_cooldown_hours)
+            invalidate_identity(discord_user_id)
             await interaction.followup.send(
                 "Identity unlinked. You can use `/link` again to relink.",
                 ephemeral=True,
@@ -427,12 +1209,11 @@ def run_bot(config_path: str) -> None:
     @tree.command(
         name="pr-info",
         description="Show PR context preview (repository, status, reviews, CI, mentor signal)",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
     @app_commands.describe(pr_url="GitHub Pull Request URL")
+    @deferred(ephemeral=False)
     async def pr_info_cmd(interaction: discord.Interaction, pr_url: str) -> None:
-        await interaction.response.defer(ephemeral=False)
-        
         # Parse PR URL
         parsed = parse_pr_url(pr_url)
         if not parsed:
@@ -443,9 +1224,12 @@ def run_bot(config_path: str) -> None:
         
         # Fetch PR context
         try:
-            pr, reviews, ci_status, last_commit_time = fetch_pr_context(
-                github_adapter, owner, repo, pr_number
+            pr, reviews, ci_status, last_commit_time = await asyncio.to_thread(
+                cached_pr_context, owner, repo, pr_number
             )
+        except GitHubRateLimitError as exc:
+            await _reply_rate_limited(interaction, exc)
+            return
         except Exception as exc:
             logger.exception("Failed to fetch PR context", extra={"owner": owner, "repo": repo, "pr_number": pr_number})
             await interaction.followup.send(
@@ -464,16 +1248,8 @@ def run_bot(config_path: str) -> None:
         # Get Discord mention if author is linked
         author_github = pr.get("user", {}).get("login", "")
         discord_mention = None
-        if author_github:
-            get_links = getattr(storage, "get_identity_links_for_discord_user", None)
-            if callable(get_links):
-                # Search verified mappings for this GitHub user
-                verified = getattr(storage, "list_verified_identity_mappings", None)
-                if callable(verified):
-                    for mapping in verified():
-                        if mapping.github_user == author_github:
-                            discord_mention = f"<@{mapping.discord_user_id}>"
-                            break
+        if author_github and get_links_fn is not None:
+            discord_mention = await mention_for_author(author_github)
         
         # Build embed
         embed_dict = build_pr_embed(
@@ -489,439 +1265,41 @@ def run_bot(config_path: str) -> None:
         embed = discord.Embed.from_dict(embed_dict)
         await interaction.followup.send(embed=embed, ephemeral=False)
 
-    # Issue assignment confirmation view
-    class IssueAssignmentView(discord.ui.View):
-        """View with buttons for confirming issue assignment."""
-        
-        def __init__(
-            self,
-            owner: str,
-            repo: str,
-            issue_number: int,
-            new_assignee_github: str,
-            new_assignee_discord: str | None,
-            has_existing_assignee: bool,
-            github_adapter: Any,
-            storage: Any,
-            policy: MutationPolicy,
-            discord_writer: Any = None,
-            notification_config: Any = None,
-            github_org: str = "",
-            timeout: float = 300.0,  # 5 minutes
-        ) -> None:
-            super().__init__(timeout=timeout)
-            self.owner = owner
-            self.repo = repo
-            self.issue_number = issue_number
-            self.new_assignee_github = new_assignee_github
-            self.new_assignee_discord = new_assignee_discord
-            self.has_existing_assignee = has_existing_assignee
-            self.github_adapter = github_adapter
-            self.storage = storage
-            self.policy = policy
-            self.discord_writer = discord_writer
-            self.notification_config = notification_config
-            self.github_org = github_org
-        
-        async def on_timeout(self) -> None:
-            """Handle view timeout."""
-            for item in self.children:
-                item.disabled = True
-            if hasattr(self, "message") and self.message:
-                try:
-                    await self.message.edit(view=self)
-                except discord.NotFound:
-                    pass
-        
-        @discord.ui.button(label="Confirm Assignment", style=discord.ButtonStyle.success, emoji="✅")
-        async def confirm_assignment(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-            """Handle confirm assignment button."""
-            await interaction.response.defer(ephemeral=True)
-            
-            # Re-check issue state (TOCTOU protection)
-            issue = fetch_issue_context(self.github_adapter, self.owner, self.repo, self.issue_number)
-            if not issue:
-                await interaction.followup.send(
-                    "❌ Issue not found or inaccessible. Assignment cancelled.",
-                    ephemeral=True,
-                )
-                return
-            
-            if issue.get("state", "").lower() == "closed":
-                await interaction.followup.send(
-                    "❌ Issue is closed. Assignment cancelled.",
-                    ephemeral=True,
-                )
-                return
-            
-            # Check if still allowed
-            if not self.policy.allow_github_mutations:
-                skip_reason = "dry-run" if self.policy.mode == RunMode.DRY_RUN else "observer mode" if self.policy.mode == RunMode.OBSERVER else "write disabled"
-                await interaction.followup.send(
-                    f"❌ Assignment skipped ({skip_reason}). No changes made.",
-                    ephemeral=True,
-                )
-                # Log audit event
-                if self.storage and hasattr(self.storage, "append_audit_event"):
-                    self.storage.append_audit_event({
-                        "event_type": "issue_assignment_cancelled",
-                        "context": {
-                            "reason": skip_reason,
-                            "issue": f"{self.owner}/{self.repo}#{self.issue_number}",
-                            "proposed_assignee": self.new_assignee_github,
-                            "actor_discord_id": str(interaction.user.id),
-                        },
-                    })
-                return
-            
-            # Perform assignment
-            success = self.github_adapter.assign_issue(
-                self.owner, self.repo, self.issue_number, self.new_assignee_github
-            )
-            
-            if success:
-                # Verify assignment on GitHub (re-fetch issue and check assignees)
-                # Retry a few times to handle GitHub replication lag
-                import asyncio
-                verified = False
-                assignee_logins_seen: list[str] = []
-                for attempt in range(3):
-                    await asyncio.sleep(1.0 + attempt * 0.5)  # 1s, 1.5s, 2s
-                    try:
-                        updated = fetch_issue_context(
-                            self.github_adapter, self.owner, self.repo, self.issue_number
-                        )
-                        if updated and updated.get("assignees"):
-                            assignee_logins_seen = [
-                                (a.get("login") or "").lower()
-                                for a in updated["assignees"]
-                                if isinstance(a, dict)
-                            ]
-                            if (self.new_assignee_github or "").lower() in assignee_logins_seen:
-                                verified = True
-                                break
-                        else:
-                            assignee_logins_seen = []
-                    except Exception:
-                        assignee_logins_seen = []
-                if not verified:
-                    logger.warning(
-                        "Assignment verification failed after retries: expected_assignee=%s assignees_on_issue=%s",
-                        self.new_assignee_github,
-                        assignee_logins_seen,
-                        extra={
-                            "owner": self.owner,
-                            "repo": self.repo,
-                            "issue_number": self.issue_number,
-                        },
-                    )
-                    # GitHub returned 201 so we treat as success; notify user to check repo if assignee missing
-                    await interaction.followup.send(
-                        "✅ Assignment was sent to GitHub. "
-                        "If the assignee does not appear on the issue, they may need to be a **member of the organization**, or the repo may restrict who can be assigned (Settings → General → Issues → Allow specified users to be assigned).",
-                        ephemeral=True,
-                    )
-                    # Fall through to log audit, send DM, and update embed
-                
-                # Log audit event
-                if self.storage and hasattr(self.storage, "append_audit_event"):
-                    self.storage.append_audit_event({
-                        "event_type": "issue_assigned_from_discord",
-                        "context": {
-                            "actor_discord_id": str(interaction.user.id),
-                            "issue": f"{self.owner}/{self.repo}#{self.issue_number}",
-                            "new_assignee": self.new_assignee_github,
-                            "replaced": self.has_existing_assignee,
-                        },
-                    })
-                
-                # Send notification to assignee (if enabled and verified)
-                if self.notification_config and self.notification_config.enabled and self.notification_config.issue_assignment:
-                    from ghdcbot.core.models import ContributionEvent
-                    mentor_github = resolve_discord_to_github(self.storage, str(interaction.user.id))
-                    issue_title = issue.get("title", "Untitled")
-                    event = ContributionEvent(
-                        github_user=self.new_assignee_github,
-                        event_type="issue_assigned",
-                        repo=self.repo,
-                        created_at=datetime.now(timezone.utc),
-                        payload={
-                            "issue_number": self.issue_number,
-                            "title": issue_title,
-                            "assigned_by": mentor_github or str(interaction.user.id),
-                        },
-                    )
-                    if self.discord_writer:
-                        send_notification_for_event(
-                            event,
-                            self.storage,
-                            self.discord_writer,
-                            self.policy,
-                            self.notification_config,
-                            self.github_org,
-                        )
-                
-                if verified:
-                    await interaction.followup.send(
-                        "✅ Issue assigned successfully!",
-                        ephemeral=True,
-                    )
-                
-                # Update original message
-                if hasattr(self, "message") and self.message:
-                    try:
-                        embed_dict = self.message.embeds[0].to_dict() if self.message.embeds else {}
-                        embed_dict["color"] = 0x10B981  # Green for success
-                        embed_dict["title"] = "✅ Issue Assigned"
-                        embed = discord.Embed.from_dict(embed_dict)
-                        await self.message.edit(embed=embed, view=None)
-                    except Exception:
-                        pass
-            else:
-                await interaction.followup.send(
-                    "❌ Failed to assign issue. Please try again or check GitHub permissions.",
-                    ephemeral=True,
-                )
-        
-        @discord.ui.button(label="Replace Assignee", style=discord.ButtonStyle.primary, emoji="🔁")
-        async def replace_assignee(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-            """Handle replace assignee button."""
-            await interaction.response.defer(ephemeral=True)
-            
-            # Re-check issue state (TOCTOU protection)
-            issue = fetch_issue_context(self.github_adapter, self.owner, self.repo, self.issue_number)
-            if not issue:
-                await interaction.followup.send(
-                    "❌ Issue not found or inaccessible. Assignment cancelled.",
-                    ephemeral=True,
-                )
-                return
-            
-            if issue.get("state", "").lower() == "closed":
-                await interaction.followup.send(
-                    "❌ Issue is closed. Assignment cancelled.",
-                    ephemeral=True,
-                )
-                return
-            
-            # Get current assignee
-            assignees = issue.get("assignees", [])
-            if not assignees:
-                await interaction.followup.send(
-                    "❌ Issue has no current assignee. Use 'Confirm Assignment' instead.",
-                    ephemeral=True,
-                )
-                return
-            
-            old_assignee = assignees[0].get("login", "")
-            
-            # Check if still allowed
-            if not self.policy.allow_github_mutations:
-                skip_reason = "dry-run" if self.policy.mode == RunMode.DRY_RUN else "observer mode" if self.policy.mode == RunMode.OBSERVER else "write disabled"
-                await interaction.followup.send(
-                    f"❌ Assignment skipped ({skip_reason}). No changes made.",
-                    ephemeral=True,
-                )
-                # Log audit event
-                if self.storage and hasattr(self.storage, "append_audit_event"):
-                    self.storage.append_audit_event({
-                        "event_type": "issue_assignment_cancelled",
-                        "context": {
-                            "reason": skip_reason,
-                            "issue": f"{self.owner}/{self.repo}#{self.issue_number}",
-                            "proposed_assignee": self.new_assignee_github,
-                            "actor_discord_id": str(interaction.user.id),
-                        },
-                    })
-                return
-            
-            # Unassign old assignee and assign new one; rollback if assign fails
-            unassign_success = self.github_adapter.unassign_issue(
-                self.owner, self.repo, self.issue_number, old_assignee
-            )
-            assign_success = self.github_adapter.assign_issue(
-                self.owner, self.repo, self.issue_number, self.new_assignee_github
-            )
-            if unassign_success and not assign_success:
-                # Rollback: restore old assignee to avoid leaving issue unassigned
-                rollback_ok = self.github_adapter.assign_issue(
-                    self.owner, self.repo, self.issue_number, old_assignee
-                )
-                if not rollback_ok:
-                    logger.warning(
-                        "Rollback failed after assign_issue failed; issue may be unassigned",
-                        extra={
-                            "owner": self.owner,
-                            "repo": self.repo,
-                            "issue_number": self.issue_number,
-                            "old_assignee": old_assignee,
-                            "new_assignee": self.new_assignee_github,
-                        },
-                    )
-                await interaction.followup.send(
-                    "❌ Reassignment failed (e.g. network or permissions). Old assignee was restored where possible.",
-                    ephemeral=True,
-                )
-                return
-            if not unassign_success:
-                await interaction.followup.send(
-                    "❌ Failed to unassign current assignee.",
-                    ephemeral=True,
-                )
-                return
-            if unassign_success and assign_success:
-                # Verify new assignee appears on GitHub (retry for replication lag)
-                import asyncio
-                verified = False
-                assignee_logins_seen_repl: list[str] = []
-                for attempt in range(3):
-                    await asyncio.sleep(1.0 + attempt * 0.5)
-                    try:
-                        updated = fetch_issue_context(
-                            self.github_adapter, self.owner, self.repo, self.issue_number
-                        )
-                        if updated and updated.get("assignees"):
-                            assignee_logins_seen_repl = [
-                                (a.get("login") or "").lower()
-                                for a in updated["assignees"]
-                                if isinstance(a, dict)
-                            ]
-                            if (self.new_assignee_github or "").lower() in assignee_logins_seen_repl:
-                                verified = True
-                                break
-                        else:
-                            assignee_logins_seen_repl = []
-                    except Exception:
-                        assignee_logins_seen_repl = []
-                if not verified:
-                    logger.warning(
-                        "Reassignment verification failed after retries: expected_assignee=%s assignees_on_issue=%s",
-                        self.new_assignee_github,
-                        assignee_logins_seen_repl,
-                        extra={
-                            "owner": self.owner,
-                            "repo": self.repo,
-                            "issue_number": self.issue_number,
-                        },
-                    )
-                    await interaction.followup.send(
-                        "✅ Reassignment was sent to GitHub. "
-                        "If the assignee does not appear on the issue, they may need to be a **member of the organization**, or the repo may restrict who can be assigned (Settings → General → Issues → Allow specified users to be assigned).",
-                        ephemeral=True,
-                    )
-                
-                # Log audit event
-                if self.storage and hasattr(self.storage, "append_audit_event"):
-                    self.storage.append_audit_event({
-                        "event_type": "issue_reassigned_from_discord",
-                        "context": {
-                            "actor_discord_id": str(interaction.user.id),
-                            "issue": f"{self.owner}/{self.repo}#{self.issue_number}",
-                            "old_assignee": old_assignee,
-                            "new_assignee": self.new_assignee_github,
-                        },
-                    })
-                
-                # Send notification to new assignee (if enabled and verified)
-                if self.notification_config and self.notification_config.enabled and self.notification_config.issue_assignment:
-                    from ghdcbot.core.models import ContributionEvent
-                    mentor_github = resolve_discord_to_github(self.storage, str(interaction.user.id))
-                    issue_title = issue.get("title", "Untitled")
-                    event = ContributionEvent(
-                        github_user=self.new_assignee_github,
-                        event_type="issue_assigned",
-                        repo=self.repo,
-                        created_at=datetime.now(timezone.utc),
-                        payload={
-                            "issue_number": self.issue_number,
-                            "title": issue_title,
-                            "assigned_by": mentor_github or str(interaction.user.id),
-                        },
-                    )
-                    if self.discord_writer:
-                        send_notification_for_event(
-                            event,
-                            self.storage,
-                            self.discord_writer,
-                            self.policy,
-                            self.notification_config,
-                            self.github_org,
-                        )
-                
-                if verified:
-                    await interaction.followup.send(
-                        "🔁 Issue reassigned successfully!",
-                        ephemeral=True,
-                    )
-                
-                # Update original message
-                if hasattr(self, "message") and self.message:
-                    try:
-                        embed_dict = self.message.embeds[0].to_dict() if self.message.embeds else {}
-                        embed_dict["color"] = 0x10B981  # Green for success
-                        embed_dict["title"] = "🔁 Issue Reassigned"
-                        embed = discord.Embed.from_dict(embed_dict)
-                        await self.message.edit(embed=embed, view=None)
-                    except Exception:
-                        pass
-
-        @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger, emoji="❌")
-        async def cancel_assignment(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-            """Handle cancel button."""
-            await interaction.response.defer(ephemeral=True)
-            
-            # Log audit event
-            if self.storage and hasattr(self.storage, "append_audit_event"):
-                self.storage.append_audit_event({
-                    "event_type": "issue_assignment_cancelled",
-                    "context": {
-                        "issue": f"{self.owner}/{self.repo}#{self.issue_number}",
-                        "proposed_assignee": self.new_assignee_github,
-                        "actor_discord_id": str(interaction.user.id),
-                    },
-                })
-            
-            await interaction.followup.send(
-                "❌ Assignment cancelled. No changes made.",
-                ephemeral=True,
-            )
-            
-            # Update original message
-            if hasattr(self, "message") and self.message:
-                try:
-                    embed_dict = self.message.embeds[0].to_dict() if self.message.embeds else {}
-                    embed_dict["color"] = 0xEF4444  # Red for cancelled
-                    embed_dict["title"] = "❌ Assignment Cancelled"
-                    embed = discord.Embed.from_dict(embed_dict)
-                    await self.message.edit(embed=embed, view=None)
-                except Exception:
-                    pass
-
     def command_permission_check(command_name: str):
         """Restrict slash commands via discord.command_permissions or legacy issue_assignees."""
 
+        # Config does not change while the bot runs; resolve the allow-lists once.
+        access = compile_command_access(config, command_name)
+
         def check(interaction: discord.Interaction) -> bool:
-            return slash_command_allowed(interaction, config, command_name)
+            return member_has_access(interaction.user, access)
 
         return check
 
     @tree.command(
         name="assign-issue",
         description="Assign a GitHub issue to a Discord user (mentor-only, requires confirmation)",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
     @app_commands.check(command_permission_check(SLASH_CMD_ASSIGN_ISSUE))
     @app_commands.describe(
         issue_url="GitHub issue URL (e.g., https://github.com/owner/repo/issues/123)",
         assignee="Discord user to assign the issue to"
     )
+    @deferred(ephemeral=False)
     async def assign_issue_cmd(
         interaction: discord.Interaction,
         issue_url: str,
         assignee: discord.Member,
     ) -> None:
-        await interaction.response.defer(ephemeral=False)
-        
+        actor_discord_id = _did_str(interaction.user.id)
+        if _open_assignment_views(actor_discord_id) >= MAX_OPEN_ASSIGNMENT_VIEWS_PER_USER:
+            await interaction.followup.send(
+                "❌ You already have several assignment confirmations open. "
+                "Confirm or cancel one before starting another.",
+                ephemeral=True,
+            )
+            return
         # Parse issue URL
         parsed = parse_issue_url(issue_url)
         if not parsed:
@@ -935,7 +1313,7 @@ def run_bot(config_path: str) -> None:
         
         # Fetch issue context
         try:
-            issue = fetch_issue_context(github_adapter, owner, repo, issue_number)
+            issue = await asyncio.to_thread(cached_issue_context, owner, repo, issue_number)
         except Exception as exc:
             logger.exception("Failed to fetch issue context", extra={"owner": owner, "repo": repo, "issue_number": issue_number})
             await interaction.followup.send(
@@ -952,7 +1330,7 @@ def run_bot(config_path: str) -> None:
             return
         
         # Check if issue is closed
-        if issue.get("state", "").lower() == "closed":
+        if _is_closed(issue):
             await interaction.followup.send(
                 "❌ Cannot assign closed issues.",
                 ephemeral=True,
@@ -961,7 +1339,9 @@ def run_bot(config_path: str) -> None:
         
         # Resolve Discord user to GitHub username
         assignee_discord_id = str(assignee.id)
-        assignee_github = resolve_discord_to_github(storage, assignee_discord_id)
+        assignee_github = await asyncio.to_thread(
+            resolve_discord_to_github, storage, assignee_discord_id
+        )
         
         # Log resolution for debugging
         logger.info(
@@ -990,7 +1370,9 @@ def run_bot(config_path: str) -> None:
         if assignees:
             has_existing_assignee = True
             current_assignee_github = assignees[0].get("login", "")
-            current_assignee_discord = resolve_github_to_discord(storage, current_assignee_github)
+            current_assignee_discord = await asyncio.to_thread(
+                resolve_github_to_discord, storage, current_assignee_github
+            )
             # Get activity (simplified for now)
             assignee_activity = "Unknown"
         
@@ -1011,13 +1393,6 @@ def run_bot(config_path: str) -> None:
         embed = discord.Embed.from_dict(embed_dict)
         
         # Create view with buttons
-        policy = MutationPolicy(
-            mode=config.runtime.mode,
-            github_write_allowed=config.github.permissions.write,
-            discord_write_allowed=config.discord.permissions.write,
-        )
-        
-        notification_config = getattr(config.discord, "notifications", None)
         view = IssueAssignmentView(
             owner=owner,
             repo=repo,
@@ -1027,10 +1402,12 @@ def run_bot(config_path: str) -> None:
             has_existing_assignee=has_existing_assignee,
             github_adapter=github_adapter,
             storage=storage,
-            policy=policy,
+            policy=bot_policy,
             discord_writer=discord_writer_adapter,
             notification_config=notification_config,
             github_org=config.github.org,
+            actor_discord_id=actor_discord_id,
+            issue_cache=issue_context_cache,
         )
         
         # Show appropriate buttons based on assignment state
@@ -1049,16 +1426,6 @@ def run_bot(config_path: str) -> None:
 
     # -------- Issue request flow: contributor requests, mentor reviews --------
 
-    def _request_created_at(req: dict) -> datetime:
-        """Parse created_at from request dict for sorting (oldest first)."""
-        v = req.get("created_at")
-        if v is None:
-            return datetime.max.replace(tzinfo=timezone.utc)
-        try:
-            return datetime.fromisoformat(str(v).replace("Z", "+00:00"))
-        except (ValueError, TypeError):
-            return datetime.max.replace(tzinfo=timezone.utc)
-
     class RepoSelectView(discord.ui.View):
         """Step 1: Mentor selects a repository to see pending issue requests."""
 
@@ -1081,18 +1448,19 @@ def run_bot(config_path: str) -> None:
             self.config = config
             self.discord_reader = discord_reader
             self.policy = policy
-            options = [
-                discord.SelectOption(
-                    label=f"{r['owner']}/{r['repo']}"[:100],
-                    value=f"{r['owner']}/{r['repo']}",
-                    description=f"{r['count']} request(s)",
-                )
-                for r in repo_list[:25]
-            ]
+            # (owner, repo) -> requests, oldest first; built once so a pick is a dict lookup.
+            self._by_repo: dict[tuple[str, str], list[dict]] = {}
+            for r in pending_requests:
+                self._by_repo.setdefault((r.get("owner"), r.get("repo")), []).append(r)
+            for reqs in self._by_repo.values():
+                reqs.sort(key=lambda r: (_request_created_at(r), r.get("request_id", "")))
+            options = _repo_select_options(
+                tuple((r["owner"], r["repo"], r["count"]) for r in itertools.islice(repo_list, 25))
+            )
             if options:
                 select = discord.ui.Select(
                     placeholder="Choose a repository",
-                    options=options,
+                    options=list(options),
                     custom_id="repo_select",
                 )
                 select.callback = self._on_select_callback
@@ -1112,14 +1480,10 @@ def run_bot(config_path: str) -> None:
                 await interaction.followup.send("Invalid repository selection.", ephemeral=True)
                 return
             owner, repo = parts[0], parts[1]
-            repo_requests = [
-                r for r in self.pending_requests
-                if r.get("owner") == owner and r.get("repo") == repo
-            ]
-            repo_requests.sort(key=lambda r: (_request_created_at(r), r.get("request_id", "")))
+            repo_requests = self._by_repo.get((owner, repo), [])
 
             async def send_repo_list_back(interaction_or_channel: Any) -> None:
-                pending = self.storage.list_pending_issue_requests()
+                pending = await asyncio.to_thread(self.storage.list_pending_issue_requests)
                 if not pending:
                     if isinstance(interaction_or_channel, discord.Interaction):
                         await interaction_or_channel.followup.send("No pending issue requests.", ephemeral=True)
@@ -1138,67 +1502,90 @@ def run_bot(config_path: str) -> None:
                 else:
                     await interaction_or_channel.send(embed=emb, view=v)
 
-            mentor_discord_id = str(interaction.user.id)
-
-            def _collect_mentor_review_rows() -> list[dict[str, Any]]:
-                if hasattr(self.storage, "append_audit_event"):
-                    self.storage.append_audit_event({
-                        "event_type": "issue_request_viewed_repo",
-                        "context": {
-                            "repo": repo_value,
-                            "mentor_discord_id": mentor_discord_id,
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                        },
-                    })
-                period_days = self.config.scoring.period_days
+            mentor_discord_id = _did_str(interaction.user.id)
+
+            def _prepare_review_context() -> tuple[int, datetime, datetime, list, dict]:
+                # One clock read per repo pick: audit timestamp, metrics window and the
+                # eligibility "now" for every row all share it.
                 period_end = datetime.now(timezone.utc)
+                period_days = self.config.scoring.period_days
                 period_start = period_end - timedelta(days=period_days)
                 mentor_roles = getattr(self.config, "assignments", None)
                 eligible_roles_config = (
                     getattr(mentor_roles, "issue_request_eligible_roles", []) if mentor_roles else []
                 )
-                member_roles_map = self.discord_reader.list_member_roles()
-                rows: list[dict[str, Any]] = []
-                for req in repo_requests:
-                    issue = fetch_issue_context(
-                        self.github_adapter, req["owner"], req["repo"], req["issue_number"]
-                    )
-                    if not issue:
-                        continue
-                    contributor_roles = member_roles_map.get(req["discord_user_id"], [])
-                    merged_count, last_merged_at = get_merged_pr_count_and_last_time(
-                        self.storage, req["github_user"], period_start, period_end
-                    )
-                    now = datetime.now(timezone.utc)
-                    verdict, reason = compute_eligibility(
-                        eligible_roles_config, contributor_roles, merged_count, last_merged_at, now
-                    )
-                    embed_dict = build_mentor_request_embed(
-                        request=req,
-                        issue=issue,
-                        contributor_discord_mention=f"<@{req['discord_user_id']}>",
-                        contributor_roles=contributor_roles,
-                        merged_count=merged_count,
-                        last_merged_at=last_merged_at,
-                        eligibility_verdict=verdict,
-                        eligibility_reason=reason,
-                        eligible_roles_config=eligible_roles_config,
-                        period_days=period_days,
-                        now=now,
-                    )
-                    assignees = issue.get("assignees") or []
-                    has_existing_assignee = any(
-                        isinstance(a, dict) and bool(a.get("login")) for a in assignees
-                    )
-                    rows.append({
-                        "req": req,
-                        "embed_dict": embed_dict,
-                        "has_existing_assignee": has_existing_assignee,
-                    })
-                return rows
+                # Shared with other commands; avoids paging the whole guild on every repo pick.
+                member_roles_map = cached_member_roles()
+                return period_days, period_start, period_end, eligible_roles_config, member_roles_map
+
+            def _build_review_row(req: dict, review_context: tuple) -> dict[str, Any] | None:
+                period_days, period_start, period_end, eligible_roles_config, member_roles_map = (
+                    review_context
+                )
+                issue = cached_issue_context(req["owner"], req["repo"], req["issue_number"])
+                if not issue:
+                    return None
+                contributor_roles = member_roles_map.get(req["discord_user_id"], [])
+                merged_count, last_merged_at = get_merged_pr_count_and_last_time(
+                    self.storage, req["github_user"], period_start, period_end
+                )
+                verdict, reason = compute_eligibility(
+                    eligible_roles_config, contributor_roles, merged_count, last_merged_at,
+                    period_end,
+                )
+                embed_dict = build_mentor_request_embed(
+                    request=req,
+                    issue=issue,
+                    contributor_discord_mention=f"<@{req['discord_user_id']}>",
+                    contributor_roles=contributor_roles,
+                    merged_count=merged_count,
+                    last_merged_at=last_merged_at,
+                    eligibility_verdict=verdict,
+                    eligibility_reason=reason,
+                    eligible_roles_config=eligible_roles_config,
+                    period_days=period_days,
+                    now=period_end,
+                )
+                assignees = issue.get("assignees") or []
+                has_existing_assignee = any(
+                    isinstance(a, dict) and bool(a.get("login")) for a in assignees
+                )
+                return {
+                    "req": req,
+                    "embed_dict": embed_dict,
+                    "has_existing_assignee": has_existing_assignee,
+                }
+
+            async def _collect_mentor_review_rows() -> list[dict[str, Any]]:
+                review_context = await asyncio.to_thread(_prepare_review_context)
+                # Informational only, so the issue fetches below do not wait on the write.
+                _append_audit_soon(self.storage, {
+                    "event_type": "issue_request_viewed_repo",
+                    "context": {
+                        "repo": repo_value,
+                        "mentor_discord_id": mentor_discord_id,
+                        "timestamp": review_context[2].isoformat(),
+                    },
+                })
+                # Issue fetch + merged-PR lookup per request run concurrently (bounded, like
+                # the worker pool), so a repo with N requests costs ~one GitHub round trip.
+                limit = asyncio.Semaphore(REVIEW_FETCH_CONCURRENCY)
+
+                async def build(req: dict) -> dict[str, Any] | None:
+                    async with limit:
+                        return await asyncio.to_thread(_build_review_row, req, review_context)
+
+                results = await asyncio.gather(
+                    *(build(req) for req in repo_requests[:MAX_REVIEW_CARDS]),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                return [row for row in results if row is not None]
 
             try:
-                review_rows = await asyncio.to_thread(_collect_mentor_review_rows)
+                review_rows = await _collect_mentor_review_rows()
             except Exception as exc:
                 logger.exception("issue-requests: failed after repo select")
                 await interaction.followup.send(
@@ -1207,33 +1594,41 @@ def run_bot(config_path: str) -> None:
                 )
                 return
 
-            for row in review_rows:
-                req = row["req"]
-                embed_dict = row["embed_dict"]
-                view = IssueRequestReviewView(
-                    request_id=req["request_id"],
-                    owner=req["owner"],
-                    repo=req["repo"],
-                    issue_number=req["issue_number"],
-                    requester_github=req["github_user"],
-                    requester_discord_id=req["discord_user_id"],
-                    github_adapter=self.github_adapter,
-                    storage=self.storage,
-                    policy=self.policy,
-                    discord_sender=self.discord_reader,
-                    back_callback=send_repo_list_back,
-                    has_existing_assignee=row["has_existing_assignee"],
+            # Build every card before the first send so the sends go out back to back.
+            cards = [
+                (
+                    discord.Embed.from_dict(row["embed_dict"]),
+                    IssueRequestReviewView(
+                        request_id=row["req"]["request_id"],
+                        owner=row["req"]["owner"],
+                        repo=row["req"]["repo"],
+                        issue_number=row["req"]["issue_number"],
+                        requester_github=row["req"]["github_user"],
+                        requester_discord_id=row["req"]["discord_user_id"],
+                        github_adapter=self.github_adapter,
+                        storage=self.storage,
+                        policy=self.policy,
+                        discord_sender=self.discord_reader,
+                        back_callback=send_repo_list_back,
+                        has_existing_assignee=row["has_existing_assignee"],
+                    ),
                 )
-                msg = await interaction.followup.send(
-                    embed=discord.Embed.from_dict(embed_dict),
-                    view=view,
-                    ephemeral=True,
+                for row in review_rows
+            ]
+            # Sequential on purpose: followups to one interaction share a webhook rate-limit
+            # bucket, and concurrent sends would lose the oldest-first order mentors rely on.
+            for embed, view in cards:
+                view.message = await interaction.followup.send(
+                    embed=embed, view=view, ephemeral=True
                 )
-                view.message = msg
-            await interaction.followup.send(
-                f"Showing **{len(repo_requests)}** request(s) for **{repo_value}** above.",
-                ephemeral=True,
-            )
+            if len(repo_requests) > MAX_REVIEW_CARDS:
+                summary = (
+                    f"Showing the oldest **{MAX_REVIEW_CARDS}** of **{len(repo_requests)}** "
+                    f"request(s) for **{repo_value}** above. Resolve these to see the rest."
+                )
+            else:
+                summary = f"Showing **{len(repo_requests)}** request(s) for **{repo_value}** above."
+            await interaction.followup.send(summary, ephemeral=True)
 
     class IssueRequestReviewView(discord.ui.View):
         """Mentor review: Approve, Replace, Reject, or Cancel for an issue request."""
@@ -1292,15 +1687,21 @@ def run_bot(config_path: str) -> None:
 
         async def _revalidate_and_assign(self, interaction: discord.Interaction, replace: bool) -> bool:
             """Re-fetch issue, re-validate, then assign. Returns True if assignment was done."""
-            req = getattr(self.storage, "get_issue_request", None) and self.storage.get_issue_request(self.request_id)
+            req = (
+                await asyncio.to_thread(get_issue_request_fn, self.request_id)
+                if get_issue_request_fn
+                else None
+            )
             if not req or req.get("status") != "pending":
                 await interaction.followup.send("❌ Request no longer pending or not found.", ephemeral=True)
                 return False
-            issue = fetch_issue_context(self.github_adapter, self.owner, self.repo, self.issue_number)
+            issue = await asyncio.to_thread(
+                fetch_issue_context, self.github_adapter, self.owner, self.repo, self.issue_number
+            )
             if not issue:
                 await interaction.followup.send("❌ Issue not found or inaccessible.", ephemeral=True)
                 return False
-            if issue.get("state", "").lower() == "closed":
+            if _is_closed(issue):
                 await interaction.followup.send("❌ Issue is closed. Request cancelled.", ephemeral=True)
                 return False
             if not self.policy.allow_github_mutations:
@@ -1309,28 +1710,24 @@ def run_bot(config_path: str) -> None:
                     ephemeral=True,
                 )
                 return False
-            assignees = issue.get("assignees", [])
-            old_assignee: str | None = None
             if replace:
-                if not assignees:
+                if not issue.get("assignees"):
                     await interaction.followup.send("❌ No existing assignee to replace.", ephemeral=True)
                     return False
-                old_assignee = assignees[0].get("login", "")
-                if not self.github_adapter.unassign_issue(self.owner, self.repo, self.issue_number, old_assignee):
-                    await interaction.followup.send("❌ Failed to unassign current assignee.", ephemeral=True)
-                    return False
-            if not self.github_adapter.assign_issue(self.owner, self.repo, self.issue_number, self.requester_github):
-                if old_assignee:
-                    rollback_ok = self.github_adapter.assign_issue(
-                        self.owner, self.repo, self.issue_number, old_assignee
-                    )
-                    if not rollback_ok:
-                        logger.warning(
-                            "Rollback failed after assign_issue failed in issue request flow",
-                            extra={"owner": self.owner, "repo": self.repo, "issue_number": self.issue_number},
-                        )
+                # Single PATCH swaps the assignee list; a failure keeps the current assignee.
+                assigned = await asyncio.to_thread(
+                    self.github_adapter.replace_assignees,
+                    self.owner, self.repo, self.issue_number, [self.requester_github],
+                )
+            else:
+                assigned = await asyncio.to_thread(
+                    self.github_adapter.assign_issue,
+                    self.owner, self.repo, self.issue_number, self.requester_github,
+                )
+            if not assigned:
                 await interaction.followup.send("❌ Failed to assign issue. Check GitHub permissions.", ephemeral=True)
                 return False
+            issue_context_cache.invalidate((self.owner, self.repo, self.issue_number))
             return True
 
         @discord.ui.button(label="Approve & Assign", style=discord.ButtonStyle.success, emoji="✅")
@@ -1338,24 +1735,29 @@ def run_bot(config_path: str) -> None:
             await interaction.response.defer(ephemeral=True)
             if not await self._revalidate_and_assign(interaction, replace=False):
                 return
-            self.storage.update_issue_request_status(self.request_id, "approved")
-            if hasattr(self.storage, "append_audit_event"):
-                self.storage.append_audit_event({
-                    "event_type": "issue_request_approved",
-                    "context": {
-                        "request_id": self.request_id,
-                        "repo": f"{self.owner}/{self.repo}",
-                        "issue_number": self.issue_number,
-                        "mentor_discord_id": str(interaction.user.id),
-                        "contributor_discord_id": self.requester_discord_id,
-                        "assignee": self.requester_github,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                })
+            now = datetime.now(timezone.utc)
+            await asyncio.to_thread(
+                self.storage.update_issue_request_status, self.request_id, "approved"
+            )
+            await _append_audit(self.storage, {
+                "event_type": "issue_request_approved",
+                "context": {
+                    "request_id": self.request_id,
+                    "repo": f"{self.owner}/{self.repo}",
+                    "issue_number": self.issue_number,
+                    "mentor_discord_id": _did_str(interaction.user.id),
+                    "contributor_discord_id": self.requester_discord_id,
+                    "assignee": self.requester_github,
+                    "timestamp": now.isoformat(),
+                },
+            })
             # Fetch issue to get title for better notification
-            issue = fetch_issue_context(self.github_adapter, self.owner, self.repo, self.issue_number)
+            issue = await asyncio.to_thread(
+                cached_issue_context, self.owner, self.repo, self.issue_number
+            )
             issue_title = issue.get("title", "Untitled")[:100] if issue else "Untitled"
-            self._dm_contributor(
+            await asyncio.to_thread(
+                self._dm_contributor,
                 f"📌 **Issue Assignment Approved!**\n\n"
                 f"Great news! Your request has been approved and you've been assigned to:\n"
                 f"**#{self.issue_number} – {issue_title}**\n\n"
@@ -1366,7 +1768,9 @@ def run_bot(config_path: str) -> None:
             
             # Mark notification as sent to prevent duplicate when /sync runs
             try:
-                mentor_github = resolve_discord_to_github(self.storage, str(interaction.user.id))
+                mentor_github = await asyncio.to_thread(
+                    resolve_discord_to_github, self.storage, _did_str(interaction.user.id)
+                )
                 payload = {
                     "issue_number": self.issue_number,
                     "title": issue_title,
@@ -1380,12 +1784,13 @@ def run_bot(config_path: str) -> None:
                     github_user=self.requester_github,
                     event_type="issue_assigned",
                     repo=self.repo,
-                    created_at=datetime.now(timezone.utc),
+                    created_at=now,
                     payload=payload,
                 )
                 
                 dedupe_key = _build_dedupe_key(event, self.requester_github)
-                _mark_notification_sent(
+                await asyncio.to_thread(
+                    _mark_notification_sent,
                     self.storage,
                     dedupe_key,
                     event,
@@ -1416,37 +1821,36 @@ def run_bot(config_path: str) -> None:
             
             await interaction.followup.send("✅ Request approved and issue assigned.", ephemeral=True)
             if hasattr(self, "message") and self.message:
-                try:
-                    embed_dict = self.message.embeds[0].to_dict() if self.message.embeds else {}
-                    embed_dict["color"] = 0x10B981
-                    embed_dict["title"] = "✅ Approved & assigned"
-                    await self.message.edit(embed=discord.Embed.from_dict(embed_dict), view=None)
-                except Exception:
-                    pass
+                await _close_card(self.message, EMBED_REQUEST_APPROVED)
 
         @discord.ui.button(label="Replace Existing Assignee", style=discord.ButtonStyle.primary, emoji="🔁")
         async def replace_assignee(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
             await interaction.response.defer(ephemeral=True)
             if not await self._revalidate_and_assign(interaction, replace=True):
                 return
-            self.storage.update_issue_request_status(self.request_id, "approved")
-            if hasattr(self.storage, "append_audit_event"):
-                self.storage.append_audit_event({
-                    "event_type": "issue_request_reassigned",
-                    "context": {
-                        "request_id": self.request_id,
-                        "repo": f"{self.owner}/{self.repo}",
-                        "issue_number": self.issue_number,
-                        "mentor_discord_id": str(interaction.user.id),
-                        "contributor_discord_id": self.requester_discord_id,
-                        "new_assignee": self.requester_github,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                })
+            now = datetime.now(timezone.utc)
+            await asyncio.to_thread(
+                self.storage.update_issue_request_status, self.request_id, "approved"
+            )
+            await _append_audit(self.storage, {
+                "event_type": "issue_request_reassigned",
+                "context": {
+                    "request_id": self.request_id,
+                    "repo": f"{self.owner}/{self.repo}",
+                    "issue_number": self.issue_number,
+                    "mentor_discord_id": _did_str(interaction.user.id),
+                    "contributor_discord_id": self.requester_discord_id,
+                    "new_assignee": self.requester_github,
+                    "timestamp": now.isoformat(),
+                },
+            })
             # Fetch issue to get title for better notification
-            issue = fetch_issue_context(self.github_adapter, self.owner, self.repo, self.issue_number)
+            issue = await asyncio.to_thread(
+                cached_issue_context, self.owner, self.repo, self.issue_number
+            )
             issue_title = issue.get("title", "Untitled")[:100] if issue else "Untitled"
-            self._dm_contributor(
+            await asyncio.to_thread(
+                self._dm_contributor,
                 f"📌 **Issue Assignment Approved!**\n\n"
                 f"Your request has been approved and you've been assigned to:\n"
                 f"**#{self.issue_number} – {issue_title}**\n\n"
@@ -1458,7 +1862,9 @@ def run_bot(config_path: str) -> None:
             
             # Mark notification as sent to prevent duplicate when /sync runs
             try:
-                mentor_github = resolve_discord_to_github(self.storage, str(interaction.user.id))
+                mentor_github = await asyncio.to_thread(
+                    resolve_discord_to_github, self.storage, _did_str(interaction.user.id)
+                )
                 payload = {
                     "issue_number": self.issue_number,
                     "title": issue_title,
@@ -1472,12 +1878,13 @@ def run_bot(config_path: str) -> None:
                     github_user=self.requester_github,
                     event_type="issue_assigned",
                     repo=self.repo,
-                    created_at=datetime.now(timezone.utc),
+                    created_at=now,
                     payload=payload,
                 )
                 
                 dedupe_key = _build_dedupe_key(event, self.requester_github)
-                _mark_notification_sent(
+                await asyncio.to_thread(
+                    _mark_notification_sent,
                     self.storage,
                     dedupe_key,
                     event,
@@ -1508,47 +1915,41 @@ def run_bot(config_path: str) -> None:
             
             await interaction.followup.send("🔁 Replaced assignee and assigned contributor.", ephemeral=True)
             if hasattr(self, "message") and self.message:
-                try:
-                    embed_dict = self.message.embeds[0].to_dict() if self.message.embeds else {}
-                    embed_dict["color"] = 0x10B981
-                    embed_dict["title"] = "🔁 Reassigned"
-                    await self.message.edit(embed=discord.Embed.from_dict(embed_dict), view=None)
-                except Exception:
-                    pass
+                await _close_card(self.message, EMBED_REQUEST_REASSIGNED)
 
         @discord.ui.button(label="Reject Request", style=discord.ButtonStyle.danger, emoji="❌")
         async def reject_request(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
             await interaction.response.defer(ephemeral=True)
-            req = getattr(self.storage, "get_issue_request", None) and self.storage.get_issue_request(self.request_id)
+            req = (
+                await asyncio.to_thread(get_issue_request_fn, self.request_id)
+                if get_issue_request_fn
+                else None
+            )
             if not req or req.get("status") != "pending":
                 await interaction.followup.send("❌ Request no longer pending or not found.", ephemeral=True)
                 return
-            self.storage.update_issue_request_status(self.request_id, "rejected")
-            if hasattr(self.storage, "append_audit_event"):
-                self.storage.append_audit_event({
-                    "event_type": "issue_request_rejected",
-                    "context": {
-                        "request_id": self.request_id,
-                        "repo": f"{self.owner}/{self.repo}",
-                        "issue_number": self.issue_number,
-                        "mentor_discord_id": str(interaction.user.id),
-                        "contributor_discord_id": self.requester_discord_id,
-                        "requester": self.requester_github,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                })
-            self._dm_contributor(
+            await asyncio.to_thread(
+                self.storage.update_issue_request_status, self.request_id, "rejected"
+            )
+            await _append_audit(self.storage, {
+                "event_type": "issue_request_rejected",
+                "context": {
+                    "request_id": self.request_id,
+                    "repo": f"{self.owner}/{self.repo}",
+                    "issue_number": self.issue_number,
+                    "mentor_discord_id": _did_str(interaction.user.id),
+                    "contributor_discord_id": self.requester_discord_id,
+                    "requester": self.requester_github,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                },
+            })
+            await asyncio.to_thread(
+                self._dm_contributor,
                 f"Your request to work on {self.owner}/{self.repo}#{self.issue_number} was declined. You can ask a mentor for feedback or pick another issue."
             )
             await interaction.followup.send("❌ Request rejected; contributor DM’d.", ephemeral=True)
             if hasattr(self, "message") and self.message:
-                try:
-                    embed_dict = self.message.embeds[0].to_dict() if self.message.embeds else {}
-                    embed_dict["color"] = 0xEF4444
-                    embed_dict["title"] = "❌ Rejected"
-                    await self.message.edit(embed=discord.Embed.from_dict(embed_dict), view=None)
-                except Exception:
-                    pass
+                await _close_card(self.message, EMBED_REQUEST_REJECTED)
 
         @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary, emoji="🚫")
         async def cancel_action(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
@@ -1573,11 +1974,11 @@ def run_bot(config_path: str) -> None:
     @tree.command(
         name="request-issue",
         description="Request to be assigned to a GitHub issue (contributor)",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
     @app_commands.describe(issue_url="GitHub issue URL")
+    @deferred(ephemeral=True)
     async def request_issue_cmd(interaction: discord.Interaction, issue_url: str) -> None:
-        await interaction.response.defer(ephemeral=True)
         parsed = parse_issue_url(issue_url)
         if not parsed:
             await interaction.followup.send(
@@ -1592,15 +1993,15 @@ def run_bot(config_path: str) -> None:
                 ephemeral=True,
             )
             return
-        issue = fetch_issue_context(github_adapter, owner, repo, issue_number)
+        issue = await asyncio.to_thread(cached_issue_context, owner, repo, issue_number)
         if not issue:
             await interaction.followup.send("❌ Issue not found or inaccessible.", ephemeral=True)
             return
-        if issue.get("state", "").lower() == "closed":
+        if _is_closed(issue):
             await interaction.followup.send("❌ Cannot request assignment to a closed issue.", ephemeral=True)
             return
-        discord_user_id = str(interaction.user.id)
-        github_user = resolve_discord_to_github(storage, discord_user_id)
+        discord_user_id = _did_str(interaction.user.id)
+        github_user = await asyncio.to_thread(resolve_discord_to_github, storage, discord_user_id)
         if not github_user:
             await interaction.followup.send(
                 "❌ You must link your GitHub account first. Use `/link` and `/verify-link`.",
@@ -1609,20 +2010,20 @@ def run_bot(config_path: str) -> None:
             return
         request_id = str(uuid.uuid4())
         issue_url_clean = issue.get("html_url", f"https://github.com/{owner}/{repo}/issues/{issue_number}")
-        if hasattr(storage, "insert_issue_request"):
-            storage.insert_issue_request(
+        if insert_issue_request_fn:
+            await asyncio.to_thread(
+                insert_issue_request_fn,
                 request_id, discord_user_id, github_user, owner, repo, issue_number, issue_url_clean
             )
-        if hasattr(storage, "append_audit_event"):
-            storage.append_audit_event({
-                "event_type": "issue_request_created",
-                "context": {
-                    "request_id": request_id,
-                    "discord_user_id": discord_user_id,
-                    "github_user": github_user,
-                    "issue": f"{owner}/{repo}#{issue_number}",
-                },
-            })
+        await _append_audit(storage, {
+            "event_type": "issue_request_created",
+            "context": {
+                "request_id": request_id,
+                "discord_user_id": discord_user_id,
+                "github_user": github_user,
+                "issue": f"{owner}/{repo}#{issue_number}",
+            },
+        })
         await interaction.followup.send(
             f"✅ Request recorded. Mentors will review and decide on assignment for **{owner}/{repo}#{issue_number}**.",
             ephemeral=True,
@@ -1631,27 +2032,21 @@ def run_bot(config_path: str) -> None:
     @tree.command(
         name="issue-requests",
         description="List pending issue assignment requests (mentor-only); pick a repo first.",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
     @app_commands.check(command_permission_check(SLASH_CMD_ISSUE_REQUESTS))
+    @deferred(ephemeral=True)
     async def issue_requests_cmd(interaction: discord.Interaction) -> None:
-        await interaction.response.defer(ephemeral=True)
-        pending = getattr(storage, "list_pending_issue_requests", None)
-        if not callable(pending):
+        if list_pending_fn is None:
             await interaction.followup.send("❌ Request list unavailable.", ephemeral=True)
             return
-        requests_list = pending()
+        requests_list = await asyncio.to_thread(list_pending_fn)
         if not requests_list:
             await interaction.followup.send("No pending issue requests.", ephemeral=True)
             return
         repo_list = group_pending_requests_by_repo(requests_list)
         now = datetime.now(timezone.utc)
         embed_dict = build_repo_selection_embed(repo_list, now)
-        policy = MutationPolicy(
-            mode=config.runtime.mode,
-            github_write_allowed=config.github.permissions.write,
-            discord_write_allowed=config.discord.permissions.write,
-        )
         view = RepoSelectView(
             requests_list,
             repo_list,
@@ -1659,7 +2054,7 @@ def run_bot(config_path: str) -> None:
             github_adapter,
             config,
             discord_reader,
-            policy,
+            bot_policy,
         )
         await interaction.followup.send(
             embed=discord.Embed.from_dict(embed_dict),
@@ -1674,18 +2069,16 @@ def run_bot(config_path: str) -> None:
         if message.author.bot:
             return
         
-        # Check if passive detection is enabled
-        pr_preview_channels = getattr(config.discord, "pr_preview_channels", None)
+        # Passive detection only in configured channels (DMs have no channel name)
         if not pr_preview_channels:
             return
-        
-        # Check if message is in a configured channel
-        channel_name = message.channel.name if hasattr(message.channel, "name") else None
-        if channel_name not in pr_preview_channels:
+        if getattr(message.channel, "name", None) not in pr_preview_channels:
             return
         
-        # Look for PR URLs in message content
-        content = message.content or ""
+        # Look for PR URLs in message content (parse_pr_url rejects non-PR text before its regex)
+        content = message.content
+        if not content:
+            return
         parsed = parse_pr_url(content)
         if not parsed:
             return
@@ -1694,8 +2087,8 @@ def run_bot(config_path: str) -> None:
         
         # Fetch and send PR preview
         try:
-            pr, reviews, ci_status, last_commit_time = fetch_pr_context(
-                github_adapter, owner, repo, pr_number
+            pr, reviews, ci_status, last_commit_time = await asyncio.to_thread(
+                cached_pr_context, owner, repo, pr_number
             )
         except Exception:
             logger.exception(
@@ -1712,12 +2105,7 @@ def run_bot(config_path: str) -> None:
         author_github = pr.get("user", {}).get("login", "")
         discord_mention = None
         if author_github:
-            verified = getattr(storage, "list_verified_identity_mappings", None)
-            if callable(verified):
-                for mapping in verified():
-                    if mapping.github_user == author_github:
-                        discord_mention = f"<@{mapping.discord_user_id}>"
-                        break
+            discord_mention = await mention_for_author(author_github)
         
         # Build and send embed
         embed_dict = build_pr_embed(
@@ -1736,13 +2124,12 @@ def run_bot(config_path: str) -> None:
     @tree.command(
         name="sync",
         description="Sync GitHub events and send notifications (mentor-only)",
-        guild=discord.Object(id=guild_id),
+        guild=guild_obj,
     )
     @app_commands.check(command_permission_check(SLASH_CMD_SYNC))
+    @deferred(ephemeral=True)
     async def sync_cmd(interaction: discord.Interaction) -> None:
         """Manually trigger run-once to sync GitHub events and send notifications."""
-        await interaction.response.defer(ephemeral=True)
-
         status_msg = None
         try:
             # Build orchestrator and run once
@@ -1752,7 +2139,7 @@ def run_bot(config_path: str) -> None:
                 config.runtime.github_adapter,
                 token=config.github.token,
                 org=config.github.org,
-                api_base=str(config.github.api_base),
+                api_base=config.github.api_base,
             )
             discord_reader_for_sync = build_adapter(
                 config.runtime.discord_adapter,
@@ -1763,7 +2150,7 @@ def run_bot(config_path: str) -> None:
                 config.runtime.github_adapter,
                 token=config.github.token,
                 org=config.github.org,
-                api_base=str(config.github.api_base),
+                api_base=config.github.api_base,
             )
             discord_writer_for_sync = build_adapter(
                 config.runtime.discord_adapter,
@@ -1814,6 +2201,10 @@ def run_bot(config_path: str) -> None:
     @tree.error
     async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
         """Handle app command errors, including check failures."""
+        original = getattr(error, "original", error)
+        if isinstance(original, GitHubRateLimitError):
+            await _reply_rate_limited(interaction, original)
+            return
         if isinstance(error, app_commands.CheckFailure):
             try:
                 cmd_name = interaction.command.name if interaction.command else "unknown"
@@ -1854,11 +2245,34 @@ def run_bot(config_path: str) -> None:
 
     @client.event
     async def on_ready() -> None:
-        synced = await tree.sync(guild=discord.Object(id=guild_id))
+        # Guild command sync sits in a small rate-limit bucket; skip it when nothing changed
+        # since the last successful sync (on_ready also fires again after reconnects).
+        sync_key = _command_sync_key(tree, guild_obj, client.application_id)
+        sync_state = Path(config.runtime.data_dir) / SLASH_SYNC_STATE_FILE
+        try:
+            previous_key = sync_state.read_text(encoding="utf-8").strip()
+        except OSError:
+            previous_key = None
+        if previous_key == sync_key:
+            cmd_names = [c.name for c in tree.get_commands(guild=guild_obj)]
+            logger.info("Bot ready; slash commands unchanged for guild %s: %s", guild_id, cmd_names)
+            return
+        synced = await tree.sync(guild=guild_obj)
         cmd_names = [c.name for c in synced]
         logger.info("Bot ready; slash commands synced for guild %s: %s", guild_id, cmd_names)
+        try:
+            sync_state.write_text(sync_key, encoding="utf-8")
+        except OSError:
+            logger.warning("Could not record slash command sync state", exc_info=True)
 
-    client.run(config.discord.token)
+    try:
+        client.run(config.discord.token)
+    finally:
+        # Release pooled GitHub/SQLite connections once the gateway loop has shut down.
+        for resource in (github_identity, github_adapter, storage):
+            close = getattr(resource, "close", None)
+            if callable(close):
+                close()
 
 
 def main(config_path: str) -> None:
@@ -1,22 +1,35 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import csv
 import io
 import json
 import logging
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, TextIO
 
-from ghdcbot.config.loader import load_config
 from ghdcbot.core.errors import AdapterError, ConfigError
-from ghdcbot.adapters.github.identity import GitHubIdentityReader
-from ghdcbot.engine.identity_linking import IdentityLinkService
-from ghdcbot.engine.orchestrator import Orchestrator
 from ghdcbot.logging.setup import configure_logging
 from ghdcbot.plugins.registry import build_adapter
+from ghdcbot.utils.jsonl import iter_jsonl
+
+# Engine and GitHub client modules are imported inside the commands that use them, so
+# e.g. `identity status` or `export-audit` does not pay for httpx and the orchestrator.
+# The config loader (pydantic models) is deferred too: --help and usage errors skip it.
+if TYPE_CHECKING:
+    from ghdcbot.adapters.github.identity import GitHubIdentityReader
+    from ghdcbot.config.models import BotConfig
+    from ghdcbot.core.interfaces import Storage
+    from ghdcbot.engine.identity_linking import IdentityLinkService
+    from ghdcbot.engine.orchestrator import Orchestrator
 
 
 def build_orchestrator(config_path: str) -> Orchestrator:
+    from ghdcbot.config.loader import load_config
+    from ghdcbot.engine.orchestrator import Orchestrator
+
     config = load_config(config_path)
     configure_logging(config.runtime.log_level)
     logger = logging.getLogger("CLI")
@@ -26,7 +39,7 @@ def build_orchestrator(config_path: str) -> Orchestrator:
         config.runtime.github_adapter,
         token=config.github.token,
         org=config.github.org,
-        api_base=str(config.github.api_base),
+        api_base=config.github.api_base,
     )
     discord_adapter = build_adapter(
         config.runtime.discord_adapter,
@@ -49,40 +62,74 @@ def build_orchestrator(config_path: str) -> Orchestrator:
 
 
 def _build_identity_service(
-    config_path: str,
-) -> tuple[IdentityLinkService, Orchestrator, GitHubIdentityReader]:
-    """Build an IdentityLinkService using the same config + storage.
+    config: BotConfig,
+) -> tuple[IdentityLinkService, Storage, GitHubIdentityReader]:
+    """Build an IdentityLinkService from an already-loaded config.
 
-    Returns the service and an orchestrator for cleanup (close()).
+    Only storage and the identity reader are built; link/verify/unlink never touch the
+    GitHub org or Discord adapters. The caller closes the returned identity reader.
     """
-    orchestrator = build_orchestrator(config_path)
+    from ghdcbot.adapters.github.identity import GitHubIdentityReader
+    from ghdcbot.engine.identity_linking import IdentityLinkService
+
+    storage_adapter = build_adapter(
+        config.runtime.storage_adapter,
+        data_dir=config.runtime.data_dir,
+    )
+    storage_adapter.init_schema()
     github_identity = GitHubIdentityReader(
-        token=orchestrator.config.github.token,
-        api_base=str(orchestrator.config.github.api_base),
+        token=config.github.token,
+        api_base=config.github.api_base,
     )
-    service = IdentityLinkService(storage=orchestrator.storage, github_identity=github_identity)
-    return service, orchestrator, github_identity
+    service = IdentityLinkService(storage=storage_adapter, github_identity=github_identity)
+    return service, storage_adapter, github_identity
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Discord-GitHub automation engine")
-    parser.add_argument("--config", required=True, help="Path to config YAML file")
-    sub = parser.add_subparsers(dest="command", required=True)
+@contextlib.contextmanager
+def _export_output(output: str | None) -> Iterator[TextIO]:
+    """Yield the export destination: the --output file, or stdout (newline-terminated, as print)."""
+    if output:
+        with Path(output).open("w", encoding="utf-8") as fp:
+            yield fp
+    else:
+        yield sys.stdout
+        sys.stdout.write("\n")
+
+
+def _add_run_once(sub: argparse._SubParsersAction) -> None:
     sub.add_parser("run-once", help="Run a single orchestration cycle")
+
+
+def _add_link(sub: argparse._SubParsersAction) -> None:
     link_p = sub.add_parser("link", help="Create a GitHub identity link claim (phase-1 verification)")
     link_p.add_argument("--discord-user-id", required=True, help="Discord user ID (numeric)")
     link_p.add_argument("github_user", help="GitHub username to claim")
+
+
+def _add_verify_link(sub: argparse._SubParsersAction) -> None:
     verify_p = sub.add_parser("verify-link", help="Verify a pending identity claim")
     verify_p.add_argument("--discord-user-id", required=True, help="Discord user ID (numeric)")
     verify_p.add_argument("github_user", help="GitHub username to verify")
+
+
+def _add_unlink(sub: argparse._SubParsersAction) -> None:
     unlink_p = sub.add_parser("unlink", help="Unlink your verified GitHub identity (Discord-initiated, cooldown applies)")
     unlink_p.add_argument("--discord-user-id", required=True, help="Discord user ID (numeric)")
+
+
+def _add_identity(sub: argparse._SubParsersAction) -> None:
     identity_p = sub.add_parser("identity", help="Identity status (read-only)")
     identity_sub = identity_p.add_subparsers(dest="identity_command", required=True)
     identity_status_p = identity_sub.add_parser("status", help="Show linked GitHub account and verification status")
     identity_status_p.add_argument("--discord-user-id", required=True, help="Discord user ID (numeric)")
     identity_sub.add_parser("list", help="List all verified contributors (Discord ID ↔ GitHub username)")
+
+
+def _add_bot(sub: argparse._SubParsersAction) -> None:
     sub.add_parser("bot", help="Run Discord bot with /link and /verify-link slash commands")
+
+
+def _add_export_audit(sub: argparse._SubParsersAction) -> None:
     export_p = sub.add_parser("export-audit", help="Export append-only audit events (JSON, CSV, or Markdown)")
     export_p.add_argument("--format", choices=("json", "csv", "md"), default="json", help="Output format")
     export_p.add_argument("--output", type=str, default=None, help="Output file (default: stdout)")
@@ -91,10 +138,59 @@ def main() -> None:
     export_p.add_argument("--from", dest="from_time", type=str, default=None, help="Filter from time (ISO-8601 UTC)")
     export_p.add_argument("--to", dest="to_time", type=str, default=None, help="Filter to time (ISO-8601 UTC)")
 
-    args = parser.parse_args()
+
+# Subcommand -> builder, in --help order.
+_SUBCOMMANDS = {
+    "run-once": _add_run_once,
+    "link": _add_link,
+    "verify-link": _add_verify_link,
+    "unlink": _add_unlink,
+    "identity": _add_identity,
+    "bot": _add_bot,
+    "export-audit": _add_export_audit,
+}
+
+
+def _requested_command(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv (skipping the --config value), or None."""
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif arg == "--config":
+            skip_next = True
+        elif arg in _SUBCOMMANDS:
+            return arg
+        elif not arg.startswith("-"):
+            return None
+    return None
+
+
+def build_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    When argv names a subcommand only that subparser is built; otherwise (no command,
+    ``--help``, typos) every subcommand is registered so help and errors list them all.
+    """
+    parser = argparse.ArgumentParser(description="Discord-GitHub automation engine")
+    parser.add_argument("--config", required=True, help="Path to config YAML file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    command = _requested_command(argv) if argv is not None else None
+    builders = [_SUBCOMMANDS[command]] if command else _SUBCOMMANDS.values()
+    for add_subcommand in builders:
+        add_subcommand(sub)
+    return parser
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    args = build_parser(argv).parse_args(argv)
+    from ghdcbot.config.loader import load_config
+
     orchestrator = None
+    identity_reader = None
+    identity_storage = None
     try:
-        identity_reader = None
         if args.command == "run-once":
             orchestrator = build_orchestrator(args.config)
             orchestrator.run_once()
@@ -105,8 +201,8 @@ def main() -> None:
             from datetime import datetime as dt
             from ghdcbot.engine.audit_export import (
                 filter_audit_events,
-                format_audit_csv,
-                format_audit_markdown,
+                write_audit_csv,
+                write_audit_markdown,
             )
             config = load_config(args.config)
             configure_logging(config.runtime.log_level)
@@ -115,22 +211,16 @@ def main() -> None:
                 config.runtime.storage_adapter,
                 data_dir=config.runtime.data_dir,
             )
+            # Stream events into the filter; only matches are held in memory.
+            iter_events = getattr(storage_adapter, "iter_audit_events", None)
             list_events = getattr(storage_adapter, "list_audit_events", None)
-            if callable(list_events):
+            if callable(iter_events):
+                events = iter_events()
+            elif callable(list_events):
                 events = list_events()
             else:
                 # Fallback to direct file read (backward compatible)
-                path = Path(config.runtime.data_dir) / "audit_events.jsonl"
-                events = []
-                if path.exists():
-                    with path.open(encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            if line:
-                                try:
-                                    events.append(json.loads(line))
-                                except json.JSONDecodeError:
-                                    continue
+                events = iter_jsonl(Path(config.runtime.data_dir) / "audit_events.jsonl")
             # Parse time filters
             from_time = None
             to_time = None
@@ -154,17 +244,14 @@ def main() -> None:
                 from_time=from_time,
                 to_time=to_time,
             )
-            # Format output
-            if args.format == "json":
-                out = json.dumps(filtered, indent=2)
-            elif args.format == "csv":
-                out = format_audit_csv(filtered)
-            else:  # md
-                out = format_audit_markdown(filtered)
-            if args.output:
-                Path(args.output).write_text(out, encoding="utf-8")
-            else:
-                print(out)
+            # Format output straight into the destination instead of building one big string
+            with _export_output(args.output) as fp:
+                if args.format == "json":
+                    json.dump(filtered, fp, indent=2)
+                elif args.format == "csv":
+                    write_audit_csv(fp, filtered)
+                else:  # md
+                    write_audit_markdown(fp, filtered)
         elif args.command == "identity":
             config = load_config(args.config)
             configure_logging(config.runtime.log_level)
@@ -178,11 +265,19 @@ def main() -> None:
                 if not callable(list_verified):
                     logging.getLogger("CLI").error("identity list is not available for this storage")
                     raise SystemExit(1)
-                mappings = list_verified()
-                if not mappings:
+                # Stream rows when the storage supports it, so large orgs are not held in memory.
+                count_verified = getattr(storage_adapter, "count_verified_identity_mappings", None)
+                iter_verified = getattr(storage_adapter, "iter_verified_identity_mappings", None)
+                if callable(count_verified) and callable(iter_verified):
+                    total = count_verified()
+                    mappings = iter_verified()
+                else:
+                    mappings = list_verified()
+                    total = len(mappings)
+                if not total:
                     print("No verified contributors yet.")
                 else:
-                    print(f"Verified contributors ({len(mappings)}):")
+                    print(f"Verified contributors ({total}):")
                     for m in mappings:
                         print(f"  Discord: {m.discord_user_id}  ↔  GitHub: {m.github_user}")
             elif args.identity_command == "status":
@@ -217,7 +312,7 @@ def main() -> None:
         elif args.command == "unlink":
             config = load_config(args.config)
             configure_logging(config.runtime.log_level)
-            service, orchestrator, identity_reader = _build_identity_service(args.config)
+            service, identity_storage, identity_reader = _build_identity_service(config)
             cooldown = (config.identity.unlink_cooldown_hours if config.identity else 24)
             try:
                 service.unlink(args.discord_user_id, cooldown)
@@ -227,7 +322,7 @@ def main() -> None:
         elif args.command in {"link", "verify-link"}:
             config = load_config(args.config)
             configure_logging(config.runtime.log_level)
-            service, orchestrator, identity_reader = _build_identity_service(args.config)
+            service, identity_storage, identity_reader = _build_identity_service(config)
             if args.command == "link":
                 max_age_days = None
                 if config.identity is not None:
@@ -270,8 +365,8 @@ def main() -> None:
     finally:
         if orchestrator is not None:
             orchestrator.close()
-        if "identity_reader" in locals() and identity_reader is not None:
-            close = getattr(identity_reader, "close", None)
+        for resource in (identity_reader, identity_storage):
+            close = getattr(resource, "close", None)
             if callable(close):
                 close()
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import re
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -12,18 +13,48 @@ from pydantic import ValidationError
 from ghdcbot.config.models import BotConfig
 from ghdcbot.core.errors import ConfigError
 
+try:  # libyaml-backed parser when PyYAML was built with it; same safe semantics.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
 _ACTIVE_CONFIG: BotConfig | None = None
 _ENV_PATTERN = re.compile(r"\$\{([A-Z0-9_]+)\}")
+_ENV_NAME_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+_CONFIG_CACHE_MAXSIZE = 100
+# resolved path -> (mtime_ns, size, {env var: value used}, config). Entries are reused only
+# while the file is unchanged and every ${VAR} it references still has the same value.
+_CONFIG_CACHE: OrderedDict[str, tuple[int, int, dict[str, str | None], BotConfig]] = OrderedDict()
 
 
 def load_config(path: str) -> BotConfig:
+    """Load and validate the YAML config at path.
+
+    Repeated loads of an unchanged file return the same (shared, read-only) BotConfig.
+    """
+    global _ACTIVE_CONFIG
     load_dotenv()
     config_path = Path(path)
     if not config_path.exists() or not config_path.is_file():
         raise ConfigError(f"Config file does not exist: {path}")
     try:
-        raw_text = config_path.read_text(encoding="utf-8")
-        raw: Any = yaml.safe_load(raw_text)
+        stat = config_path.stat()
+        cache_key = str(config_path.resolve())
+    except OSError as exc:
+        raise ConfigError(f"Failed to read config file: {path}") from exc
+    cached = _CONFIG_CACHE.get(cache_key)
+    if (
+        cached is not None
+        and cached[0] == stat.st_mtime_ns
+        and cached[1] == stat.st_size
+        and all(os.getenv(name) == value for name, value in cached[2].items())
+    ):
+        _CONFIG_CACHE.move_to_end(cache_key)
+        _ACTIVE_CONFIG = cached[3]
+        return cached[3]
+    try:
+        # Bytes go straight to the (lib)yaml reader, which decodes UTF-8 itself.
+        raw: Any = yaml.load(config_path.read_bytes(), Loader=_YamlLoader)
     except OSError as exc:
         raise ConfigError(f"Failed to read config file: {path}") from exc
     except yaml.YAMLError as exc:
@@ -32,14 +63,23 @@ def load_config(path: str) -> BotConfig:
     if raw is None:
         raise ConfigError("Config file is empty")
 
+    env_used: dict[str, str | None] = {}
+    expanded = _expand_env_vars(raw, env_used)
+    missing = [name for name, value in env_used.items() if value is None]
+    if len(missing) == 1:
+        raise ConfigError(f"Missing required environment variable: {missing[0]}")
+    if missing:
+        raise ConfigError(f"Missing required environment variables: {', '.join(missing)}")
     try:
-        expanded = _expand_env_vars(raw)
         config = BotConfig.model_validate(expanded)
-        global _ACTIVE_CONFIG
-        _ACTIVE_CONFIG = config
-        return config
     except ValidationError as exc:
         raise ConfigError(f"Invalid configuration: {exc}") from exc
+    _CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, env_used, config)
+    _CONFIG_CACHE.move_to_end(cache_key)
+    while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAXSIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    _ACTIVE_CONFIG = config
+    return config
 
 
 def get_active_config() -> BotConfig | None:
@@ -47,20 +87,32 @@ def get_active_config() -> BotConfig | None:
     return _ACTIVE_CONFIG
 
 
-def _expand_env_vars(value: Any) -> Any:
-    """Recursively expand ${VAR} in strings using environment variables."""
+def _expand_env_vars(value: Any, env: dict[str, str | None]) -> Any:
+    """Recursively expand ${VAR} in strings using environment variables.
+
+    env collects every referenced variable (None when unset), so each is read from the
+    environment once per load and the caller can report all missing ones together.
+    """
     if isinstance(value, dict):
-        return {key: _expand_env_vars(val) for key, val in value.items()}
+        return {key: _expand_env_vars(val, env) for key, val in value.items()}
     if isinstance(value, list):
-        return [_expand_env_vars(item) for item in value]
+        return [_expand_env_vars(item, env) for item in value]
     if isinstance(value, str):
-        return _ENV_PATTERN.sub(_replace_env_var, value)
+        if "${" not in value:
+            return value
+        # Common case: the whole value is one placeholder (token: ${GITHUB_TOKEN}).
+        name = value[2:-1]
+        if value.startswith("${") and value.endswith("}") and _is_env_name(name):
+            return _resolve_env_var(name, env)
+        return _ENV_PATTERN.sub(lambda match: _resolve_env_var(match[1], env), value)
     return value
 
 
-def _replace_env_var(match: re.Match[str]) -> str:
-    env_key = match.group(1)
-    env_value = os.getenv(env_key)
-    if env_value is None:
-        raise ConfigError(f"Missing required environment variable: {env_key}")
-    return env_value
+def _is_env_name(name: str) -> bool:
+    return bool(name) and _ENV_NAME_CHARS.issuperset(name)
+
+
+def _resolve_env_var(name: str, env: dict[str, str | None]) -> str:
+    if name not in env:
+        env[name] = os.getenv(name)
+    return env[name] or ""
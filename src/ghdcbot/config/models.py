@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ghdcbot.core.modes import RunMode
 
 
-class PermissionConfig(BaseModel):
+class _ConfigModel(BaseModel):
+    """Base for config sections. Frozen: load_config hands the same cached instance to
+    every caller, so fields must not be reassigned after validation."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class PermissionConfig(_ConfigModel):
     read: bool = True
     write: bool = False
 
 
-class RepoFilterConfig(BaseModel):
+class RepoFilterConfig(_ConfigModel):
     mode: str
     names: list[str]
 
@@ -29,7 +38,7 @@ class RepoFilterConfig(BaseModel):
         return value
 
 
-class RuntimeConfig(BaseModel):
+class RuntimeConfig(_ConfigModel):
     mode: RunMode = RunMode.DRY_RUN
     log_level: str = "INFO"
     data_dir: str
@@ -49,16 +58,24 @@ class RuntimeConfig(BaseModel):
         return value.upper()
 
 
-class GitHubConfig(BaseModel):
+class GitHubConfig(_ConfigModel):
     org: str
     token: str
-    api_base: HttpUrl = Field(default="https://api.github.com")
+    api_base: str = "https://api.github.com"
     permissions: PermissionConfig = Field(default_factory=PermissionConfig)
     repos: RepoFilterConfig | None = None
     user_fallback: bool = False
 
+    @field_validator("api_base")
+    @classmethod
+    def validate_api_base(cls, value: str) -> str:
+        parts = urlsplit(value)
+        if parts.scheme not in {"http", "https"} or not parts.netloc:
+            raise ValueError("github.api_base must be an http(s) URL")
+        return value
+
 
-class SlashCommandPermissionRule(BaseModel):
+class SlashCommandPermissionRule(_ConfigModel):
     """Who may run a restricted slash command (e.g. assign-issue, issue-requests, sync).
 
     If a command is omitted from ``discord.command_permissions``, the bot falls back to
@@ -70,7 +87,7 @@ class SlashCommandPermissionRule(BaseModel):
     allow_discord_administrators: bool = False
 
 
-class NotificationConfig(BaseModel):
+class NotificationConfig(_ConfigModel):
     """Configuration for verified-only GitHub → Discord notifications."""
     enabled: bool = True
     issue_assignment: bool = True
@@ -91,7 +108,7 @@ class NotificationConfig(BaseModel):
         return value
 
 
-class DiscordConfig(BaseModel):
+class DiscordConfig(_ConfigModel):
     guild_id: str
     token: str
     permissions: PermissionConfig = Field(default_factory=PermissionConfig)
@@ -107,7 +124,7 @@ class DiscordConfig(BaseModel):
     unrestricted_slash_commands: bool = False
 
 
-class QualityAdjustmentsConfig(BaseModel):
+class QualityAdjustmentsConfig(_ConfigModel):
     """Optional quality adjustments for contribution scoring."""
     penalties: dict[str, int] = Field(default_factory=dict)
     bonuses: dict[str, int] = Field(default_factory=dict)
@@ -121,7 +138,7 @@ class QualityAdjustmentsConfig(BaseModel):
         return value
 
 
-class ScoringConfig(BaseModel):
+class ScoringConfig(_ConfigModel):
     period_days: int = 30
     weights: dict[str, int]
     difficulty_weights: dict[str, int] | None = None
@@ -144,12 +161,12 @@ class ScoringConfig(BaseModel):
         return value
 
 
-class RoleMappingConfig(BaseModel):
+class RoleMappingConfig(_ConfigModel):
     discord_role: str
     min_score: int = 0
 
 
-class MergeRoleRuleConfig(BaseModel):
+class MergeRoleRuleConfig(_ConfigModel):
     """Single rule for merge-based role assignment."""
     discord_role: str
     min_merged_prs: int
@@ -162,7 +179,7 @@ class MergeRoleRuleConfig(BaseModel):
         return value
 
 
-class MergeRoleRulesConfig(BaseModel):
+class MergeRoleRulesConfig(_ConfigModel):
     """Optional merge-based role assignment rules."""
     enabled: bool = False
     rules: list[MergeRoleRuleConfig] = Field(default_factory=list)
@@ -176,19 +193,19 @@ class MergeRoleRulesConfig(BaseModel):
         return value
 
 
-class AssignmentConfig(BaseModel):
+class AssignmentConfig(_ConfigModel):
     review_roles: list[str] = Field(default_factory=list)
     issue_assignees: list[str] = Field(default_factory=list)
     # Roles that make a contributor eligible for issue assignment (for /request-issue review). Empty = any verified user.
     issue_request_eligible_roles: list[str] = Field(default_factory=list)
 
 
-class IdentityMapping(BaseModel):
+class IdentityMapping(_ConfigModel):
     github_user: str
     discord_user_id: str
 
 
-class IdentityConfig(BaseModel):
+class IdentityConfig(_ConfigModel):
     """Optional identity settings. Backward compatible: missing section uses defaults."""
     unlink_cooldown_hours: int = 24
     verified_max_age_days: int | None = None
@@ -208,7 +225,7 @@ class IdentityConfig(BaseModel):
         return value
 
 
-class SnapshotConfig(BaseModel):
+class SnapshotConfig(_ConfigModel):
     """Configuration for GitHub-backed JSON snapshots."""
     enabled: bool = False
     repo_path: str = ""  # Format: "owner/repo" (e.g., "org/gitcord-data")
@@ -216,7 +233,7 @@ class SnapshotConfig(BaseModel):
     branch: str | None = None
 
 
-class BotConfig(BaseModel):
+class BotConfig(_ConfigModel):
     runtime: RuntimeConfig
     github: GitHubConfig
     discord: DiscordConfig
@@ -1,3 +1,8 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+
 class ConfigError(RuntimeError):
     """Configuration validation or loading error."""
 
@@ -8,3 +13,19 @@ class GitcordPermissionError(RuntimeError):
 
 class AdapterError(RuntimeError):
     """Raised for adapter initialization failures."""
+
+
+class GitHubRateLimitError(RuntimeError):
+    """Raised when the GitHub API budget is exhausted; retry after reset_at (UTC)."""
+
+    def __init__(self, reset_at: datetime | None) -> None:
+        reset = reset_at.isoformat() if reset_at else "unknown"
+        super().__init__(f"GitHub rate limit reached (resets at {reset})")
+        self.reset_at = reset_at
+
+    def retry_after_seconds(self, now: datetime | None = None) -> int:
+        """Whole seconds until the budget resets (0 if unknown or already past)."""
+        if self.reset_at is None:
+            return 0
+        now = now or datetime.now(timezone.utc)
+        return max(0, int((self.reset_at - now).total_seconds()))
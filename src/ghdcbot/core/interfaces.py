@@ -11,6 +11,10 @@ from ghdcbot.core.models import (
     Score,
 )
 
+# These protocols are for static typing only and are deliberately not @runtime_checkable:
+# isinstance() against a Protocol walks every member on each call. Adapters are resolved by
+# dotted path (plugins.registry) and optional methods are probed once with getattr.
+
 
 class GitHubReader(Protocol):
     def list_contributions(self, since: datetime) -> Iterable[ContributionEvent]:
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContributionEvent:
     github_user: str
     event_type: str
@@ -14,7 +14,7 @@ class ContributionEvent:
     payload: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContributionSummary:
     github_user: str
     issues_opened: int
@@ -26,7 +26,7 @@ class ContributionSummary:
     period_end: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Score:
     github_user: str
     period_start: datetime
@@ -34,27 +34,27 @@ class Score:
     points: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoleMapping:
     discord_role: str
     min_score: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssignmentPlan:
     issue_number: int
     repo: str
     assignee: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewPlan:
     pr_number: int
     repo: str
     reviewer: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscordRolePlan:
     discord_user_id: str
     role: str
@@ -63,7 +63,7 @@ class DiscordRolePlan:
     source: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GitHubAssignmentPlan:
     repo: str
     target_number: int
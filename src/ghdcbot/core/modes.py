@@ -10,7 +10,7 @@ class RunMode(str, Enum):
     ACTIVE = "active"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MutationPolicy:
     mode: RunMode
     github_write_allowed: bool
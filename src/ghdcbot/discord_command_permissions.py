@@ -2,40 +2,27 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import discord
 
 from ghdcbot.config.models import BotConfig, SlashCommandPermissionRule
 
 
-def _legacy_issue_assignee_allowed(member: discord.Member, config: BotConfig) -> bool:
-    """Backward compatible: assignments.issue_assignees matched by role name."""
-    mentor_roles = getattr(config, "assignments", None)
-    if not mentor_roles:
-        return False
-    issue_assignee_roles = getattr(mentor_roles, "issue_assignees", [])
-    if not issue_assignee_roles:
-        return False
-    user_roles = [role.name for role in member.roles]
-    return any(role in issue_assignee_roles for role in user_roles)
+@dataclass(frozen=True)
+class CommandAccess:
+    """Precomputed allow-lists for one slash command; build once with compile_command_access."""
 
-
-def _is_guild_member_like(user: object) -> bool:
-    """True for Discord Member in a guild (has roles + guild_permissions). Duck-typed for tests."""
-    return hasattr(user, "roles") and hasattr(user, "guild_permissions")
+    unrestricted: bool
+    role_ids: frozenset[int]
+    role_names: frozenset[str]
+    allow_discord_administrators: bool
 
 
-def slash_command_allowed(
-    interaction: discord.Interaction,
-    config: BotConfig,
-    command_name: str,
-) -> bool:
-    """Return True if the member may run this slash command."""
-    member = interaction.user
-    if not _is_guild_member_like(member):
-        return False
-
+def compile_command_access(config: BotConfig, command_name: str) -> CommandAccess:
+    """Resolve who may run command_name from config (explicit rule or legacy issue_assignees)."""
     if getattr(config.discord, "unrestricted_slash_commands", False):
-        return True
+        return CommandAccess(True, frozenset(), frozenset(), False)
 
     perms = getattr(config.discord, "command_permissions", None)
     rule: SlashCommandPermissionRule | None = None
@@ -43,23 +30,48 @@ def slash_command_allowed(
         rule = perms[command_name]
 
     if rule is None:
-        return _legacy_issue_assignee_allowed(member, config)
+        # Backward compatible: assignments.issue_assignees matched by role name.
+        mentor_roles = getattr(config, "assignments", None)
+        issue_assignee_roles = getattr(mentor_roles, "issue_assignees", []) if mentor_roles else []
+        return CommandAccess(False, frozenset(), frozenset(issue_assignee_roles or ()), False)
 
-    if rule.allow_discord_administrators and member.guild_permissions.administrator:
-        return True
+    # Discord role IDs are integers (snowflakes); config keeps them as strings.
+    role_ids = frozenset(
+        int(rid) for rid in (str(r).strip() for r in rule.role_ids) if rid.isdigit()
+    )
+    return CommandAccess(
+        False, role_ids, frozenset(rule.role_names), rule.allow_discord_administrators
+    )
 
-    id_allow = {str(rid).strip() for rid in rule.role_ids if str(rid).strip()}
-    for role in member.roles:
-        if str(role.id) in id_allow:
-            return True
 
-    if rule.role_names:
-        allowed_names = set(rule.role_names)
-        user_role_names = {r.name for r in member.roles}
-        if user_role_names & allowed_names:
-            return True
+def _is_guild_member_like(user: object) -> bool:
+    """True for Discord Member in a guild (has roles + guild_permissions). Duck-typed for tests."""
+    return hasattr(user, "roles") and hasattr(user, "guild_permissions")
 
-    return False
+
+def member_has_access(member: object, access: CommandAccess) -> bool:
+    """Return True if member satisfies access (set lookups, no per-call config parsing)."""
+    if not _is_guild_member_like(member):
+        return False
+    if access.unrestricted:
+        return True
+    if access.allow_discord_administrators and member.guild_permissions.administrator:
+        return True
+    roles = member.roles
+    if access.role_ids and not access.role_ids.isdisjoint(role.id for role in roles):
+        return True
+    return bool(access.role_names) and not access.role_names.isdisjoint(
+        role.name for role in roles
+    )
+
+
+def slash_command_allowed(
+    interaction: discord.Interaction,
+    config: BotConfig,
+    command_name: str,
+) -> bool:
+    """Return True if the member may run this slash command."""
+    return member_has_access(interaction.user, compile_command_access(config, command_name))
 
 
 def format_slash_command_permission_denied(config: BotConfig, command_name: str) -> str:
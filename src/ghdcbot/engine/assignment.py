@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections import deque
+from itertools import cycle
 from typing import Iterable, Sequence
 
 from ghdcbot.core.interfaces import AssignmentStrategy
@@ -17,6 +17,10 @@ class RoleBasedAssignmentStrategy(AssignmentStrategy):
         self._role_to_github = role_to_github_users
         self._issue_roles = issue_roles
         self._review_roles = review_roles
+        # Roles and the role map are fixed for the strategy's (per-run) lifetime, so the
+        # eligible pools are resolved once instead of on every plan call.
+        self._issue_eligible = self._eligible_users(issue_roles)
+        self._review_eligible = self._eligible_users(review_roles)
 
     def _eligible_users(self, roles: Sequence[str]) -> list[str]:
         eligible: list[str] = []
@@ -28,43 +32,24 @@ class RoleBasedAssignmentStrategy(AssignmentStrategy):
     def plan_issue_assignments(
         self, issues: Iterable[dict], _scores: Sequence[Score]
     ) -> Sequence[AssignmentPlan]:
-        eligible = self._eligible_users(self._issue_roles)
+        eligible = self._issue_eligible
         if not eligible:
             return []
-        queue = deque(eligible)
-        plans: list[AssignmentPlan] = []
-        for issue in issues:
-            # Skip issues that already have assignees (don't overwrite existing assignments)
-            assignees = issue.get("assignees", [])
-            if assignees:
-                continue
-            assignee = queue[0]
-            queue.rotate(-1)
-            plans.append(
-                AssignmentPlan(
-                    issue_number=issue["number"],
-                    repo=issue["repo"],
-                    assignee=assignee,
-                )
-            )
-        return plans
+        # Skip issues that already have assignees (don't overwrite existing assignments);
+        # the rest take eligible users round-robin.
+        unassigned = (issue for issue in issues if not issue.get("assignees", []))
+        return [
+            AssignmentPlan(issue_number=issue["number"], repo=issue["repo"], assignee=assignee)
+            for issue, assignee in zip(unassigned, cycle(eligible))
+        ]
 
     def plan_review_requests(
         self, pull_requests: Iterable[dict], _scores: Sequence[Score]
     ) -> Sequence[ReviewPlan]:
-        eligible = self._eligible_users(self._review_roles)
+        eligible = self._review_eligible
         if not eligible:
             return []
-        queue = deque(eligible)
-        plans: list[ReviewPlan] = []
-        for pr in pull_requests:
-            reviewer = queue[0]
-            queue.rotate(-1)
-            plans.append(
-                ReviewPlan(
-                    pr_number=pr["number"],
-                    repo=pr["repo"],
-                    reviewer=reviewer,
-                )
-            )
-        return plans
+        return [
+            ReviewPlan(pr_number=pr["number"], repo=pr["repo"], reviewer=reviewer)
+            for pr, reviewer in zip(pull_requests, cycle(eligible))
+        ]
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import csv
+import io
+import json
 from datetime import datetime, timezone
+from typing import Iterable, TextIO
 
 
 def filter_audit_events(
-    events: list[dict],
+    events: Iterable[dict],
     *,
     user: str | None = None,
     event_type: str | None = None,
@@ -16,7 +20,7 @@ def filter_audit_events(
     """Filter audit events by user, event_type, and time range.
     
     Args:
-        events: List of audit event dicts
+        events: Audit event dicts; any iterable, consumed once (e.g. a streaming reader)
         user: Match github_user in context OR actor_id (discord_user_id)
         event_type: Exact match on event_type field
         from_time: Inclusive lower bound (UTC)
@@ -25,36 +29,26 @@ def filter_audit_events(
     Returns:
         Filtered list of events (same structure, no mutation)
     """
-    filtered = events
-    if user:
-        filtered = [
-            e
-            for e in filtered
-            if (
-                e.get("actor_id") == user
-                or e.get("context", {}).get("github_user") == user
-            )
-        ]
-    if event_type:
-        filtered = [e for e in filtered if e.get("event_type") == event_type]
-    if from_time:
-        from_time_utc = _ensure_utc(from_time)
-        max_datetime = datetime.max.replace(tzinfo=timezone.utc)
-        filtered = [
-            e
-            for e in filtered
-            if _parse_timestamp(e.get("timestamp", "")) != max_datetime
-            and _parse_timestamp(e.get("timestamp", "")) >= from_time_utc
-        ]
-    if to_time:
-        to_time_utc = _ensure_utc(to_time)
-        max_datetime = datetime.max.replace(tzinfo=timezone.utc)
-        filtered = [
-            e
-            for e in filtered
-            if _parse_timestamp(e.get("timestamp", "")) != max_datetime
-            and _parse_timestamp(e.get("timestamp", "")) <= to_time_utc
-        ]
+    from_time_utc = _ensure_utc(from_time) if from_time else None
+    to_time_utc = _ensure_utc(to_time) if to_time else None
+    max_datetime = datetime.max.replace(tzinfo=timezone.utc)
+    filtered = []
+    for e in events:
+        if user and not (
+            e.get("actor_id") == user or e.get("context", {}).get("github_user") == user
+        ):
+            continue
+        if event_type and e.get("event_type") != event_type:
+            continue
+        if from_time_utc or to_time_utc:
+            ts = _parse_timestamp(e.get("timestamp", ""))
+            if ts == max_datetime:
+                continue
+            if from_time_utc and ts < from_time_utc:
+                continue
+            if to_time_utc and ts > to_time_utc:
+                continue
+        filtered.append(e)
     return filtered
 
 
@@ -63,12 +57,14 @@ def format_audit_csv(events: list[dict]) -> str:
     
     Columns: ts, event_type, github_user, discord_user_id, repo, target, details
     """
-    import csv
-    import io
-    import json
-    
     buf = io.StringIO()
-    w = csv.writer(buf)
+    write_audit_csv(buf, events)
+    return buf.getvalue()
+
+
+def write_audit_csv(stream: TextIO, events: Iterable[dict]) -> None:
+    """Write audit events as CSV to stream row by row (same output as format_audit_csv)."""
+    w = csv.writer(stream)
     w.writerow(["ts", "event_type", "github_user", "discord_user_id", "repo", "target", "details"])
     for e in events:
         context = e.get("context", {})
@@ -86,7 +82,6 @@ def format_audit_csv(events: list[dict]) -> str:
             target,
             details,
         ])
-    return buf.getvalue()
 
 
 def format_audit_markdown(events: list[dict]) -> str:
@@ -94,22 +89,30 @@ def format_audit_markdown(events: list[dict]) -> str:
     
     Groups events by event_type, sorts by timestamp ascending.
     """
-    if not events:
-        return "# Audit Events\n\nNo events found.\n"
-    
+    buf = io.StringIO()
+    write_audit_markdown(buf, events)
+    return buf.getvalue()
+
+
+def write_audit_markdown(stream: TextIO, events: Iterable[dict]) -> None:
+    """Write the format_audit_markdown document to stream line by line."""
     # Group by event_type
     by_type: dict[str, list[dict]] = {}
     for e in events:
         et = e.get("event_type", "unknown")
         by_type.setdefault(et, []).append(e)
+    if not by_type:
+        stream.write("# Audit Events\n\nNo events found.\n")
+        return
     
-    # Sort event types, then sort events within each group by timestamp
-    lines = ["# Audit Events\n"]
+    # Sort event types, then sort events within each group by timestamp.
+    # Lines are newline-separated (no newline after the final blank line).
+    stream.write("# Audit Events\n")
     for event_type in sorted(by_type.keys()):
         group_events = sorted(by_type[event_type], key=lambda x: x.get("timestamp", ""))
-        lines.append(f"## {event_type}\n")
-        lines.append("| Timestamp | Actor | GitHub User | Details |")
-        lines.append("|-----------|-------|-------------|---------|")
+        stream.write(f"\n## {event_type}\n")
+        stream.write("\n| Timestamp | Actor | GitHub User | Details |")
+        stream.write("\n|-----------|-------|-------------|---------|")
         for e in group_events:
             context = e.get("context", {})
             github_user = context.get("github_user", "")
@@ -122,9 +125,8 @@ def format_audit_markdown(events: list[dict]) -> str:
                     details_parts.append(f"{k}={v}")
             details = ", ".join(details_parts) or "—"
             ts = e.get("timestamp", "")
-            lines.append(f"| {ts} | {actor} | {github_user} | {details} |")
-        lines.append("")
-    return "\n".join(lines)
+            stream.write(f"\n| {ts} | {actor} | {github_user} | {details} |")
+        stream.write("\n")
 
 
 def _ensure_utc(value: datetime) -> datetime:
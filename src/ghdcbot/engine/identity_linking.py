@@ -10,12 +10,57 @@ from ghdcbot.adapters.github.identity import GitHubIdentityReader, VerificationM
 from ghdcbot.adapters.storage.sqlite import SqliteStorage
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LinkClaim:
     discord_user_id: str
     github_user: str
     verification_code: str
     expires_at: datetime
+    expires_at_iso: str
+
+
+@dataclass(frozen=True, slots=True)
+class IdentityView:
+    """Read-only identity state for one Discord user, shared by /verify, /status, /summary and /identity status.
+
+    ``links_available`` is False when the storage cannot list link rows. ``status`` is the
+    ``get_identity_status`` value (verified, verified_stale, pending, not_linked).
+    """
+
+    links_available: bool
+    is_linked: bool
+    github_user: str | None
+    pending_github_user: str | None
+    pending_expires_at: str | None
+    status: str
+    status_github_user: str | None
+    verified_at: str | None
+    is_stale: bool
+
+
+def build_identity_view(links: list[dict] | None, status: dict | None) -> IdentityView:
+    """Combine identity link rows and identity status into an IdentityView (single pass over links)."""
+    verified_row = None
+    pending_row = None
+    for row in links or ():
+        # Storage returns verified as a 0/1 int; no per-row coercion needed.
+        if row["verified"]:
+            if verified_row is None:
+                verified_row = row
+        elif pending_row is None:
+            pending_row = row
+    status = status or {}
+    return IdentityView(
+        links_available=links is not None,
+        is_linked=verified_row is not None,
+        github_user=verified_row.get("github_user") if verified_row else None,
+        pending_github_user=pending_row.get("github_user", "?") if pending_row else None,
+        pending_expires_at=pending_row.get("expires_at") if pending_row else None,
+        status=status.get("status") or "not_linked",
+        status_github_user=status.get("github_user"),
+        verified_at=status.get("verified_at"),
+        is_stale=bool(status.get("is_stale")),
+    )
 
 
 class IdentityLinkService:
@@ -36,6 +81,7 @@ class IdentityLinkService:
     def create_claim(self, discord_user_id: str, github_user: str, *, max_age_days: int | None = None) -> LinkClaim:
         code = _generate_verification_code()
         expires_at = datetime.now(timezone.utc) + self._ttl
+        expires_at_iso = expires_at.isoformat()
         # Ensure schema exists for identity_links before writing.
         try:
             self._storage.init_schema()
@@ -55,14 +101,14 @@ class IdentityLinkService:
                 "actor_type": "discord_user",
                 "actor_id": discord_user_id,
                 "event_type": "identity_claim_created",
-                "context": {"github_user": github_user, "expires_at": expires_at.isoformat()},
+                "context": {"github_user": github_user, "expires_at": expires_at_iso},
             })
         self._logger.info(
             "Created identity claim",
             extra={
                 "discord_user_id": discord_user_id,
                 "github_user": github_user,
-                "expires_at": expires_at.isoformat(),
+                "expires_at": expires_at_iso,
             },
         )
         return LinkClaim(
@@ -70,6 +116,7 @@ class IdentityLinkService:
             github_user=github_user,
             verification_code=code,
             expires_at=expires_at,
+            expires_at_iso=expires_at_iso,
         )
 
     def verify_claim(self, discord_user_id: str, github_user: str) -> tuple[bool, str | None]:
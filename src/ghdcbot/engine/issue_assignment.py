@@ -10,6 +10,14 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
+# GitHub issue URLs; compiled once at import rather than on every call. Same bounded
+# owner/repo classes as pr_context._PR_URL_RE.
+_ISSUE_URL_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?github\.com/"
+    r"([A-Za-z0-9._-]{1,39})/([A-Za-z0-9._-]{1,100})/issues/(\d{1,10})"
+)
+
+
 def parse_issue_url(url: str) -> tuple[str, str, int] | None:
     """Parse GitHub issue URL into (owner, repo, issue_number).
     
@@ -20,17 +28,11 @@ def parse_issue_url(url: str) -> tuple[str, str, int] | None:
     
     Returns None if URL is invalid.
     """
-    # Match GitHub issue URLs
-    pattern = r"(?:https?://)?(?:www\.)?github\.com/([^/]+)/([^/]+)/issues/(\d+)"
-    match = re.search(pattern, url)
-    if not match:
-        return None
-    owner, repo, issue_num_str = match.groups()
-    try:
-        issue_number = int(issue_num_str)
-        return (owner, repo, issue_number)
-    except ValueError:
+    if "github.com" not in url:
         return None
+    match = _ISSUE_URL_RE.search(url)
+    # The number group is \d+, so int() cannot fail.
+    return (match[1], match[2], int(match[3])) if match else None
 
 
 def fetch_issue_context(
@@ -55,15 +57,15 @@ def resolve_discord_to_github(
     
     Returns GitHub username if verified, None otherwise.
     """
+    lookup = getattr(storage, "get_verified_mapping_by_discord", None)
+    if callable(lookup):
+        mapping = lookup(discord_user_id)
+        return mapping.github_user if mapping else None
     verified = getattr(storage, "list_verified_identity_mappings", None)
     if not callable(verified):
         return None
-    
-    for mapping in verified():
-        if mapping.discord_user_id == discord_user_id:
-            return mapping.github_user
-    
-    return None
+    mapping = next((m for m in verified() if m.discord_user_id == discord_user_id), None)
+    return mapping.github_user if mapping else None
 
 
 def resolve_github_to_discord(
@@ -74,6 +76,9 @@ def resolve_github_to_discord(
     
     Returns Discord user ID if verified, None otherwise.
     """
+    lookup = getattr(storage, "get_discord_user_for_github_user", None)
+    if callable(lookup):
+        return lookup(github_user)
     verified = getattr(storage, "list_verified_identity_mappings", None)
     if not callable(verified):
         return None
@@ -8,10 +8,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
     from ghdcbot.core.interfaces import Storage
+    from ghdcbot.core.models import ContributionEvent
 
 
 # Documented, stable, non-competitive formula for issue engagement (informational only).
@@ -54,37 +55,76 @@ def get_contribution_metrics(
     since = period_start
     events = storage.list_contributions(since)
     # Filter to window (list_contributions returns all since `since`)
-    in_window = [
-        e
-        for e in events
-        if period_start <= e.created_at <= period_end
-    ]
-    # Aggregate per user
     buckets: dict[str, dict[str, int | float]] = {}
-    for e in in_window:
-        b = buckets.setdefault(
-            e.github_user,
-            {
-                "prs_opened": 0,
-                "prs_merged": 0,
-                "reviews_submitted": 0,
-                "issues_opened": 0,
-                "comments": 0,
-                "total_score": 0,
-            },
-        )
-        if e.event_type == "pr_opened":
-            b["prs_opened"] += 1
-        elif e.event_type == "pr_merged":
-            b["prs_merged"] += 1
-        elif e.event_type == "pr_reviewed":
-            b["reviews_submitted"] += 1
-        elif e.event_type == "issue_opened":
-            b["issues_opened"] += 1
-        elif e.event_type == "comment":
-            b["comments"] += 1
-        b["total_score"] += weights.get(e.event_type, 0)
+    for e in events:
+        if period_start <= e.created_at <= period_end:
+            _add_event(buckets, e, weights)
+    return _build_user_metrics(buckets, period_start, period_end)
+
 
+def get_contribution_metrics_windows(
+    storage: Storage,
+    period_end: datetime,
+    window_days: Sequence[int],
+    weights: dict[str, int] | None = None,
+) -> dict[int, list[UserMetrics]]:
+    """Compute get_contribution_metrics for several windows ending at period_end.
+
+    Reads storage once (from the widest window's start) and aggregates every window
+    in a single pass. Returns {days: metrics_list}; each list equals
+    get_contribution_metrics(storage, period_end - timedelta(days=days), period_end, weights).
+    """
+    weights = weights or {}
+    starts = {days: period_end - timedelta(days=days) for days in window_days}
+    if not starts:
+        return {}
+    events = storage.list_contributions(min(starts.values()))
+    buckets: dict[int, dict[str, dict[str, int | float]]] = {days: {} for days in starts}
+    for e in events:
+        if e.created_at > period_end:
+            continue
+        for days, start in starts.items():
+            if start <= e.created_at:
+                _add_event(buckets[days], e, weights)
+    return {
+        days: _build_user_metrics(buckets[days], starts[days], period_end) for days in starts
+    }
+
+
+def _add_event(
+    buckets: dict[str, dict[str, int | float]],
+    e: ContributionEvent,
+    weights: dict[str, int],
+) -> None:
+    b = buckets.setdefault(
+        e.github_user,
+        {
+            "prs_opened": 0,
+            "prs_merged": 0,
+            "reviews_submitted": 0,
+            "issues_opened": 0,
+            "comments": 0,
+            "total_score": 0,
+        },
+    )
+    if e.event_type == "pr_opened":
+        b["prs_opened"] += 1
+    elif e.event_type == "pr_merged":
+        b["prs_merged"] += 1
+    elif e.event_type == "pr_reviewed":
+        b["reviews_submitted"] += 1
+    elif e.event_type == "issue_opened":
+        b["issues_opened"] += 1
+    elif e.event_type == "comment":
+        b["comments"] += 1
+    b["total_score"] += weights.get(e.event_type, 0)
+
+
+def _build_user_metrics(
+    buckets: dict[str, dict[str, int | float]],
+    period_start: datetime,
+    period_end: datetime,
+) -> list[UserMetrics]:
     result = []
     for user, b in sorted(buckets.items(), key=lambda x: x[0]):
         issues = int(b["issues_opened"])
@@ -110,6 +150,11 @@ def get_contribution_metrics(
     return result
 
 
+def index_metrics_by_user(metrics: list[UserMetrics]) -> dict[str, UserMetrics]:
+    """Return {github_user: metrics} for O(1) per-user lookup (e.g. /summary)."""
+    return {m.github_user: m for m in metrics}
+
+
 def rank_by_activity(metrics: list[UserMetrics]) -> list[UserMetrics]:
     """Return metrics sorted by total_score descending (top contributors by activity).
     Informational only; no gamification. Same order as audit report.
@@ -125,6 +170,24 @@ def get_rank_for_user(ranked: list[UserMetrics], github_user: str) -> int | None
     return None
 
 
+def get_rank_for_user_direct(metrics: list[UserMetrics], github_user: str) -> int | None:
+    """Return the user's 1-based rank_by_activity position without sorting, or None.
+
+    O(N): counts entries ordered before the user by (-total_score, github_user),
+    matching rank_by_activity tie-breaking.
+    """
+    target = next((m for m in metrics if m.github_user == github_user), None)
+    if target is None:
+        return None
+    ahead = sum(
+        1
+        for m in metrics
+        if m.total_score > target.total_score
+        or (m.total_score == target.total_score and m.github_user < github_user)
+    )
+    return ahead + 1
+
+
 def format_metrics_summary(metrics: UserMetrics | None) -> str:
     """Format a single user's metrics for display (e.g. /summary)."""
     if metrics is None:
@@ -153,9 +216,5 @@ def metrics_for_windows(
     main_end = now
     main_start = now - timedelta(days=period_days)
     main = get_contribution_metrics(storage, main_start, main_end, weights)
-    by_window: dict[int, list[UserMetrics]] = {}
-    for w in window_days_list or [7, 30]:
-        end = now
-        start = now - timedelta(days=w)
-        by_window[w] = get_contribution_metrics(storage, start, end, weights)
+    by_window = get_contribution_metrics_windows(storage, now, window_days_list or [7, 30], weights)
     return main, by_window
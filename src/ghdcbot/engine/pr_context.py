@@ -10,6 +10,15 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
+# GitHub PR URLs; compiled once since passive PR previews parse every message.
+# Owner/repo are bounded to GitHub's allowed characters and lengths (not [^/]+, which
+# also spans spaces and newlines), so arbitrary chat text cannot make the search backtrack.
+_PR_URL_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?github\.com/"
+    r"([A-Za-z0-9._-]{1,39})/([A-Za-z0-9._-]{1,100})/pull/(\d{1,10})"
+)
+
+
 def parse_pr_url(url: str) -> tuple[str, str, int] | None:
     """Parse GitHub PR URL into (owner, repo, pr_number).
     
@@ -20,17 +29,12 @@ def parse_pr_url(url: str) -> tuple[str, str, int] | None:
     
     Returns None if URL is invalid.
     """
-    # Match GitHub PR URLs
-    pattern = r"(?:https?://)?(?:www\.)?github\.com/([^/]+)/([^/]+)/pull/(\d+)"
-    match = re.search(pattern, url)
-    if not match:
-        return None
-    owner, repo, pr_num_str = match.groups()
-    try:
-        pr_number = int(pr_num_str)
-        return (owner, repo, pr_number)
-    except ValueError:
+    if "/pull/" not in url or "github.com" not in url:
+        # Cheap substring checks; most chat messages never reach the regex.
         return None
+    match = _PR_URL_RE.search(url)
+    # The number group is \d+, so int() cannot fail.
+    return (match[1], match[2], int(match[3])) if match else None
 
 
 def format_relative_time(timestamp: datetime | None, now: datetime) -> str:
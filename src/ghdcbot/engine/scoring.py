@@ -27,6 +27,15 @@ class WeightedScoreStrategy(ScoreStrategy):
         self._quality_adjustments = quality_adjustments or {}
         self._penalties = self._quality_adjustments.get("penalties", {})
         self._bonuses = self._quality_adjustments.get("bonuses", {})
+        # Event types that can change a score under this configuration; everything else
+        # (opens, comments, issues, ...) is skipped before any field beyond event_type is read.
+        self._scored_event_types = frozenset(
+            ["pr_merged"]
+            + (["pr_reverted"] if "reverted_pr" in self._penalties else [])
+            + (["pr_merged_with_failed_ci"] if "failed_ci_merge" in self._penalties else [])
+            + (["pr_reviewed"] if "pr_review" in self._bonuses else [])
+            + (["helpful_comment"] if "helpful_comment" in self._bonuses else [])
+        )
 
     def compute_scores(
         self, contributions: Sequence[ContributionEvent], period_end: datetime
@@ -41,7 +50,10 @@ class WeightedScoreStrategy(ScoreStrategy):
         reverted_prs: set[tuple[str, str, int]] = set()  # (user, repo, pr_number) -> already penalized
         failed_ci_prs: set[tuple[str, str, int]] = set()  # (user, repo, pr_number) -> already penalized
         
+        scored_event_types = self._scored_event_types
         for event in contributions:
+            if event.event_type not in scored_event_types:
+                continue
             if event.created_at < period_start or event.created_at > period_end:
                 continue
             
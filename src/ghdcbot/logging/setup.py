@@ -21,10 +21,23 @@ class JsonFormatter(logging.Formatter):
         return json.dumps(payload)
 
 
+# The JSON handler installed by configure_logging; reused so repeat calls are cheap.
+_HANDLER: logging.Handler | None = None
+
+
 def configure_logging(level: str) -> None:
+    """Route root logging through one JSON stream handler at level.
+
+    Idempotent: when the handler is already the root's only handler, only the level changes.
+    """
+    global _HANDLER
+    root = logging.getLogger()
+    if _HANDLER is not None and root.handlers == [_HANDLER]:
+        root.setLevel(level)
+        return
     handler = logging.StreamHandler()
     handler.setFormatter(JsonFormatter())
-    root = logging.getLogger()
     root.handlers.clear()
     root.setLevel(level)
     root.addHandler(handler)
+    _HANDLER = handler
@@ -0,0 +1,78 @@
+"""Small in-process caches for the long-running bot.
+
+No external dependencies; entries expire after a fixed TTL (monotonic clock) and the
+cache is bounded, evicting least-recently-used entries so memory stays flat over long uptimes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+DEFAULT_MAXSIZE = 10_000
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire ``ttl_seconds`` after being set.
+
+    Holds at most ``maxsize`` entries; the least recently used entry is evicted first.
+    Values are computed by callers; use ``get_or_load`` to fill on miss. Safe to use from
+    ``asyncio.to_thread`` workers.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        *,
+        maxsize: int = DEFAULT_MAXSIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader() and caching its result on miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,31 @@
+"""Streaming reader for append-only JSON Lines files (e.g. audit_events.jsonl)."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+
+def iter_jsonl(path: Path) -> Iterator[Any]:
+    """Yield one parsed value per line without reading the whole file into memory.
+
+    Blank and malformed lines are skipped; a missing file yields nothing.
+    """
+    if not path.exists():
+        return
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap cannot map an empty file
+        # Map the file read-only: lines are sliced straight from the page cache as bytes and
+        # handed to json.loads, with no buffered-reader copy or text decode layer in between.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:  # JSONDecodeError or invalid UTF-8
+                    continue
@@ -0,0 +1,49 @@
+"""Per-key cooldowns for bounding how often a user can trigger expensive commands."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from ghdcbot.utils.cache import DEFAULT_MAXSIZE
+
+
+class Cooldown:
+    """In-memory cooldown tracker keyed by e.g. (discord_user_id, command_name).
+
+    ``try_acquire`` records the attempt and returns True when the key has not been
+    used within ``seconds``; otherwise it returns False and leaves the timestamp as is.
+    At most ``maxsize`` keys are tracked; the least recently used key is dropped first.
+    """
+
+    def __init__(
+        self, *, maxsize: int = DEFAULT_MAXSIZE, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._maxsize = maxsize
+        self._clock = clock
+        self._last_used: OrderedDict[Hashable, float] = OrderedDict()
+
+    def try_acquire(self, key: Hashable, seconds: float) -> bool:
+        now = self._clock()
+        last = self._last_used.get(key)
+        if last is not None and now - last < seconds:
+            return False
+        self._last_used[key] = now
+        self._last_used.move_to_end(key)
+        while len(self._last_used) > self._maxsize:
+            self._last_used.popitem(last=False)
+        return True
+
+    def remaining(self, key: Hashable, seconds: float) -> float:
+        """Seconds until ``key`` may acquire again (0.0 when it already can)."""
+        last = self._last_used.get(key)
+        if last is None:
+            return 0.0
+        return max(0.0, seconds - (self._clock() - last))
+
+    def reset(self, key: Hashable) -> None:
+        self._last_used.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._last_used)
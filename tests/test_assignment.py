@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from ghdcbot.engine.assignment import RoleBasedAssignmentStrategy
+
+
+def _strategy() -> RoleBasedAssignmentStrategy:
+    return RoleBasedAssignmentStrategy(
+        {"maintainer": ["bob", "alice"], "reviewer": ["carol", "alice"]},
+        issue_roles=["maintainer", "reviewer"],
+        review_roles=["reviewer"],
+    )
+
+
+def test_issue_assignments_round_robin_and_skip_assigned_issues() -> None:
+    issues = [
+        {"number": 1, "repo": "r"},
+        {"number": 2, "repo": "r", "assignees": ["someone"]},
+        {"number": 3, "repo": "r", "assignees": []},
+        {"number": 4, "repo": "r"},
+        {"number": 5, "repo": "r"},
+    ]
+    plans = _strategy().plan_issue_assignments(iter(issues), [])
+    assert [(p.issue_number, p.assignee) for p in plans] == [
+        (1, "alice"),
+        (3, "bob"),
+        (4, "carol"),
+        (5, "alice"),
+    ]
+
+
+def test_review_requests_round_robin() -> None:
+    prs = [{"number": n, "repo": "r"} for n in range(1, 4)]
+    plans = _strategy().plan_review_requests(prs, [])
+    assert [(p.pr_number, p.reviewer) for p in plans] == [(1, "alice"), (2, "carol"), (3, "alice")]
+
+
+def test_no_eligible_users_plans_nothing() -> None:
+    strategy = RoleBasedAssignmentStrategy({}, issue_roles=["x"], review_roles=["y"])
+    assert strategy.plan_issue_assignments([{"number": 1, "repo": "r"}], []) == []
+    assert strategy.plan_review_requests([{"number": 1, "repo": "r"}], []) == []
+
+
+def test_eligible_pools_are_resolved_once() -> None:
+    strategy = _strategy()
+    calls = []
+    strategy._eligible_users = lambda roles: calls.append(roles) or []
+    strategy.plan_issue_assignments([{"number": 1, "repo": "r"}], [])
+    strategy.plan_review_requests([{"number": 1, "repo": "r"}], [])
+    assert calls == []
@@ -12,6 +12,8 @@ from ghdcbot.engine.audit_export import (
     filter_audit_events,
     format_audit_csv,
     format_audit_markdown,
+    write_audit_csv,
+    write_audit_markdown,
 )
 
 
@@ -193,6 +195,21 @@ def test_format_audit_markdown_empty_events(tmp_path: Path) -> None:
     assert "No events found" in md_output
 
 
+def test_write_audit_streams_match_string_formatters() -> None:
+    import io
+
+    events = [
+        {"event_type": "b", "timestamp": "2026-01-02T00:00:00Z", "context": {"github_user": "a"}},
+        {"event_type": "a", "timestamp": "2026-01-01T00:00:00Z", "actor_id": "1", "context": {}},
+    ]
+    pairs = ((write_audit_csv, format_audit_csv), (write_audit_markdown, format_audit_markdown))
+    for write, fmt in pairs:
+        for evs in (events, []):
+            buf = io.StringIO()
+            write(buf, iter(evs))
+            assert buf.getvalue() == fmt(evs)
+
+
 def test_storage_list_audit_events_reads_file(tmp_path: Path) -> None:
     storage = SqliteStorage(data_dir=str(tmp_path))
     # Write some events directly
@@ -216,12 +233,39 @@ def test_storage_list_audit_events_reads_file(tmp_path: Path) -> None:
     assert read_events[0]["event_type"] == "identity_verified"
 
 
+def test_storage_iter_audit_events_streams_into_filter(tmp_path: Path) -> None:
+    storage = SqliteStorage(data_dir=str(tmp_path))
+    audit_path = Path(tmp_path) / "audit_events.jsonl"
+    audit_path.write_text(
+        '{"event_type": "identity_verified", "context": {"github_user": "alice"}}\n'
+        "\n"
+        "not json\n"
+        '{"event_type": "identity_unlinked", "context": {"github_user": "alice"}}\n',
+        encoding="utf-8",
+    )
+    events = storage.iter_audit_events()
+    assert not isinstance(events, list)
+    filtered = filter_audit_events(events, user="alice", event_type="identity_unlinked")
+    assert [e["event_type"] for e in filtered] == ["identity_unlinked"]
+
+
 def test_storage_list_audit_events_empty_when_no_file(tmp_path: Path) -> None:
     storage = SqliteStorage(data_dir=str(tmp_path))
     events = storage.list_audit_events()
     assert events == []
 
 
+def test_storage_iter_audit_events_handles_empty_file_and_unterminated_line(
+    tmp_path: Path,
+) -> None:
+    storage = SqliteStorage(data_dir=str(tmp_path))
+    audit_path = Path(tmp_path) / "audit_events.jsonl"
+    audit_path.write_bytes(b"")
+    assert list(storage.iter_audit_events()) == []
+    audit_path.write_bytes(b'\xff\xfe\n{"event_type": "a"}\n{"event_type": "b"}')
+    assert [e["event_type"] for e in storage.iter_audit_events()] == ["a", "b"]
+
+
 def test_cli_export_audit_csv_no_filters(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     from ghdcbot.cli import main
     import sys
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from ghdcbot.bot import (
+    IssueAssignmentView,
+    EMBED_REQUEST_REJECTED,
+    _append_audit,
+    _append_audit_soon,
+    _command_sync_key,
+    _background_tasks,
+    _close_card,
+    _did_str,
+    _format_iso_utc,
+    _open_assignment_views,
+    _repo_select_options,
+    _request_created_at,
+    deferred,
+)
+from ghdcbot.core.modes import MutationPolicy, RunMode
+from ghdcbot.utils.cache import TTLCache
+
+
+class _Response:
+    def __init__(self, calls: list) -> None:
+        self._calls = calls
+
+    async def defer(self, *, ephemeral: bool) -> None:
+        self._calls.append(("defer", ephemeral))
+
+
+class _Followup:
+    def __init__(self, calls: list) -> None:
+        self._calls = calls
+
+    async def send(self, content: str, *, ephemeral: bool) -> None:
+        self._calls.append(("send", content))
+
+
+class _User:
+    id = 42
+
+
+class _Interaction:
+    command = None
+
+    def __init__(self) -> None:
+        self.calls: list = []
+        self.response = _Response(self.calls)
+        self.followup = _Followup(self.calls)
+        self.user = _User()
+
+
+def test_deferred_acks_before_handler_runs() -> None:
+    @deferred(ephemeral=False)
+    async def handler(interaction: _Interaction, pr_url: str) -> None:
+        interaction.calls.append(("handler", pr_url))
+
+    interaction = _Interaction()
+    asyncio.run(handler(interaction, "https://github.com/o/r/pull/1"))
+    assert interaction.calls == [("defer", False), ("handler", "https://github.com/o/r/pull/1")]
+    assert handler.__name__ == "handler"
+
+
+def test_deferred_logs_timing_even_when_handler_fails(caplog) -> None:
+    @deferred()
+    async def broken(interaction: _Interaction) -> None:
+        raise RuntimeError("boom")
+
+    with caplog.at_level(logging.DEBUG, logger="ghdcbot.bot"):
+        try:
+            asyncio.run(broken(_Interaction()))
+        except RuntimeError:
+            pass
+    timing = [r for r in caplog.records if r.getMessage() == "Slash command timing"]
+    assert len(timing) == 1
+    assert timing[0].command == "broken"
+    assert timing[0].total_ms >= timing[0].ack_ms
+
+
+def test_request_created_at_sorts_undated_requests_last() -> None:
+    reqs = [
+        {"request_id": "c"},
+        {"request_id": "b", "created_at": "2024-05-02T10:00:00+00:00"},
+        {"request_id": "x", "created_at": "not-a-date"},
+        {"request_id": "a", "created_at": "2024-05-01T10:00:00Z"},
+    ]
+    reqs.sort(key=lambda r: (_request_created_at(r), r["request_id"]))
+    assert [r["request_id"] for r in reqs] == ["a", "b", "c", "x"]
+
+
+def test_repo_select_options_are_reused_for_the_same_repo_list() -> None:
+    repos = (("org", "api", 3), ("org", "web", 1))
+    options = _repo_select_options(repos)
+    assert [(o.value, o.description) for o in options] == [
+        ("org/api", "3 request(s)"),
+        ("org/web", "1 request(s)"),
+    ]
+    assert _repo_select_options((("org", "api", 3), ("org", "web", 1))) is options
+
+
+def test_dry_run_assignment_skips_issue_recheck() -> None:
+    github = MagicMock()
+    storage = MagicMock()
+
+    async def press() -> _Interaction:
+        view = IssueAssignmentView(
+            owner="org",
+            repo="repo",
+            issue_number=3,
+            new_assignee_github="alice",
+            new_assignee_discord="1",
+            has_existing_assignee=False,
+            github_adapter=github,
+            storage=storage,
+            policy=MutationPolicy(
+                mode=RunMode.DRY_RUN, github_write_allowed=True, discord_write_allowed=True
+            ),
+        )
+        interaction = _Interaction()
+        await view.confirm_assignment.callback(interaction)
+        return interaction
+
+    interaction = asyncio.run(press())
+    assert interaction.calls[1] == ("send", "❌ Assignment skipped (dry-run). No changes made.")
+    github.get_issue.assert_not_called()
+    github.assign_issue.assert_not_called()
+    event = storage.append_audit_event.call_args.args[0]
+    assert event["context"]["reason"] == "dry-run"
+
+
+def test_format_iso_utc_accepts_trailing_z() -> None:
+    assert _format_iso_utc("2024-05-01T12:30:00Z") == "2024-05-01 12:30:00 UTC"
+    assert _format_iso_utc("2024-05-01T12:30:00+00:00") == "2024-05-01 12:30:00 UTC"
+    assert _format_iso_utc("not a date") == "not a date"
+
+
+def test_did_str_reuses_string_for_same_user() -> None:
+    uid = 123456789012345678
+    assert _did_str(uid) == "123456789012345678"
+    assert _did_str(uid) is _did_str(uid)
+
+
+def test_cancel_releases_assignment_view() -> None:
+    async def run() -> tuple[int, int, IssueAssignmentView]:
+        view = IssueAssignmentView(
+            owner="org",
+            repo="repo",
+            issue_number=3,
+            new_assignee_github="alice",
+            new_assignee_discord="1",
+            has_existing_assignee=False,
+            github_adapter=MagicMock(),
+            storage=MagicMock(),
+            policy=MutationPolicy(
+                mode=RunMode.ACTIVE, github_write_allowed=True, discord_write_allowed=True
+            ),
+            actor_discord_id="mentor-1",
+        )
+        before = _open_assignment_views("mentor-1")
+        await view.cancel_assignment.callback(_Interaction())
+        return before, _open_assignment_views("mentor-1"), view
+
+    before, after, view = asyncio.run(run())
+    assert (before, after) == (1, 0)
+    assert view.is_finished()
+    assert view.github_adapter is None and view.storage is None
+
+
+def test_second_click_waits_and_does_not_touch_released_adapters() -> None:
+    async def run() -> tuple[_Interaction, _Interaction, MagicMock]:
+        storage = MagicMock()
+        view = IssueAssignmentView(
+            owner="org",
+            repo="repo",
+            issue_number=3,
+            new_assignee_github="alice",
+            new_assignee_discord="1",
+            has_existing_assignee=False,
+            github_adapter=MagicMock(),
+            storage=storage,
+            policy=MutationPolicy(
+                mode=RunMode.ACTIVE, github_write_allowed=True, discord_write_allowed=True
+            ),
+        )
+        first, second = _Interaction(), _Interaction()
+        await asyncio.gather(
+            view.cancel_assignment.callback(first), view.cancel_assignment.callback(second)
+        )
+        return first, second, storage
+
+    first, second, storage = asyncio.run(run())
+    assert first.calls[-1] == ("send", "❌ Assignment cancelled. No changes made.")
+    assert second.calls[-1] == ("send", "This assignment has already been handled.")
+    assert storage.append_audit_event.call_count == 1
+
+
+def test_assignment_view_forgets_cached_issue_after_write() -> None:
+    cache = TTLCache(30.0)
+    cache.set(("org", "repo", 3), {"number": 3, "assignees": []})
+    cache.set(("org", "repo", 4), {"number": 4, "assignees": []})
+
+    async def run() -> None:
+        view = IssueAssignmentView(
+            owner="org",
+            repo="repo",
+            issue_number=3,
+            new_assignee_github="alice",
+            new_assignee_discord="1",
+            has_existing_assignee=False,
+            github_adapter=MagicMock(),
+            storage=MagicMock(),
+            policy=MutationPolicy(
+                mode=RunMode.ACTIVE, github_write_allowed=True, discord_write_allowed=True
+            ),
+            issue_cache=cache,
+        )
+        view._forget_issue()
+
+    asyncio.run(run())
+    assert cache.get(("org", "repo", 3)) is None
+    assert cache.get(("org", "repo", 4)) is not None
+
+
+def test_append_audit_swallows_storage_failures(caplog) -> None:
+    storage = MagicMock()
+    storage.append_audit_event.side_effect = RuntimeError("database is locked")
+
+    with caplog.at_level(logging.WARNING, logger="ghdcbot.bot"):
+        asyncio.run(_append_audit(storage, {"event_type": "issue_request_rejected"}))
+        asyncio.run(_append_audit(None, {"event_type": "issue_request_rejected"}))
+
+    storage.append_audit_event.assert_called_once()
+    assert [r.event_type for r in caplog.records] == ["issue_request_rejected"]
+
+
+def test_close_card_mutates_original_embed_in_place() -> None:
+    embed = discord.Embed(title="Request", description="body", colour=0x3B82F6)
+    message = MagicMock(embeds=[embed])
+    message.edit = AsyncMock(side_effect=RuntimeError("Unknown Message"))
+
+    asyncio.run(_close_card(message, EMBED_REQUEST_REJECTED))
+
+    sent = message.edit.call_args.kwargs
+    assert sent["embed"] is embed and sent["view"] is None
+    assert (embed.colour.value, embed.title) == EMBED_REQUEST_REJECTED
+    assert embed.description == "body"
+
+
+def test_append_audit_soon_returns_before_the_write() -> None:
+    storage = MagicMock()
+
+    async def run() -> bool:
+        _append_audit_soon(storage, {"event_type": "issue_request_viewed_repo"})
+        written_before_yield = storage.append_audit_event.called
+        await asyncio.gather(*_background_tasks)
+        return written_before_yield
+
+    assert asyncio.run(run()) is False
+    storage.append_audit_event.assert_called_once_with({"event_type": "issue_request_viewed_repo"})
+    assert not _background_tasks
+
+
+def test_command_sync_key_changes_only_with_the_command_set() -> None:
+    guild = discord.Object(id=123)
+
+    def build_tree(description: str) -> discord.app_commands.CommandTree:
+        tree = discord.app_commands.CommandTree(discord.Client(intents=discord.Intents.none()))
+
+        @tree.command(name="summary", description=description, guild=guild)
+        async def summary(interaction: discord.Interaction) -> None:
+            pass
+
+        return tree
+
+    key = _command_sync_key(build_tree("Show activity"), guild, 42)
+    assert _command_sync_key(build_tree("Show activity"), guild, 42) == key
+    assert _command_sync_key(build_tree("Show recent activity"), guild, 42) != key
+    assert _command_sync_key(build_tree("Show activity"), guild, 43) != key
@@ -0,0 +1,58 @@
+"""Tests for the in-process TTL cache used by the bot (utils/cache.py)."""
+
+from ghdcbot.utils.cache import TTLCache
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_returns_value_until_expiry() -> None:
+    clock = _FakeClock()
+    cache = TTLCache(10.0, clock=clock)
+    cache.set("k", 1)
+    clock.now = 9.9
+    assert cache.get("k") == 1
+    clock.now = 10.0
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_get_or_load_calls_loader_once() -> None:
+    clock = _FakeClock()
+    cache = TTLCache(60.0, clock=clock)
+    calls = []
+
+    def loader() -> list[dict]:
+        calls.append(1)
+        return []
+
+    assert cache.get_or_load("links", loader) == []
+    assert cache.get_or_load("links", loader) == []
+    assert len(calls) == 1
+    clock.now = 61.0
+    cache.get_or_load("links", loader)
+    assert len(calls) == 2
+
+
+def test_ttl_cache_invalidate_forces_reload() -> None:
+    cache = TTLCache(60.0)
+    cache.set(("status", "d1"), {"status": "pending"})
+    cache.invalidate(("status", "d1"))
+    assert cache.get(("status", "d1")) is None
+    assert cache.get_or_load(("status", "d1"), lambda: {"status": "verified"}) == {"status": "verified"}
+
+
+def test_ttl_cache_evicts_least_recently_used_over_maxsize() -> None:
+    cache = TTLCache(60.0, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
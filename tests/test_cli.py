@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import sys
+
+from ghdcbot.cli import _SUBCOMMANDS, build_parser
+from ghdcbot.logging.setup import configure_logging
+
+
+def _choices(parser) -> list[str]:
+    return list(parser._subparsers._group_actions[0].choices)
+
+
+def test_build_parser_registers_only_the_requested_subcommand() -> None:
+    argv = ["--config", "bot", "link", "--discord-user-id", "1", "octocat"]
+    parser = build_parser(argv)
+    assert _choices(parser) == ["link"]
+    args = parser.parse_args(argv)
+    assert (args.config, args.command, args.github_user) == ("bot", "link", "octocat")
+
+
+def test_build_parser_registers_everything_without_a_known_command() -> None:
+    for argv in (["--help"], ["--config", "c.yaml"], ["--config", "c.yaml", "lnk"], None):
+        assert _choices(build_parser(argv)) == list(_SUBCOMMANDS)
+
+
+def test_configure_logging_is_idempotent() -> None:
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    try:
+        configure_logging("INFO")
+        handler = root.handlers[0]
+        configure_logging("DEBUG")
+        assert root.handlers == [handler]
+        assert root.level == logging.DEBUG
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+
+def test_importing_cli_defers_config_models() -> None:
+    """--help and usage errors must not pay for building the pydantic config models."""
+    code = "import sys, ghdcbot.cli; print('ghdcbot.config.models' in sys.modules)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    assert result.stdout.strip() == "False"
@@ -6,7 +6,9 @@ from types import SimpleNamespace
 
 from ghdcbot.config.models import BotConfig, SlashCommandPermissionRule
 from ghdcbot.discord_command_permissions import (
+    compile_command_access,
     format_slash_command_permission_denied,
+    member_has_access,
     slash_command_allowed,
 )
 
@@ -219,3 +221,20 @@ def test_config_accepts_command_permissions_in_yaml_shape() -> None:
     rule = config.discord.command_permissions["assign-issue"]
     assert rule.role_names == ["Mentor"]
     assert rule.allow_discord_administrators is True
+
+
+def test_compiled_access_matches_per_call_check() -> None:
+    config = BotConfig.model_validate(
+        _minimal_config_payload(
+            command_permissions={
+                "sync": SlashCommandPermissionRule(role_ids=[" 999 "], role_names=["Lead"]),
+            },
+        ),
+    )
+    access = compile_command_access(config, "sync")
+    assert access.role_ids == frozenset({999})
+    for member in (_member((999, "X")), _member((1, "Lead")), _member((1, "Mentor"))):
+        assert member_has_access(member, access) == slash_command_allowed(
+            _interaction(member), config, "sync"
+        )
+    assert member_has_access(SimpleNamespace(id=1), access) is False
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import httpx
+
+from ghdcbot.adapters.discord.api import DiscordApiAdapter
+
+
+class _MockClient:
+    def __init__(self, routes: dict[str, tuple[int, object]]) -> None:
+        self._routes = routes
+        self.paths: list[str] = []
+
+    def request(self, method: str, path: str, params: dict | None = None) -> httpx.Response:
+        self.paths.append(path)
+        status, data = self._routes.get(path, (404, {}))
+        return httpx.Response(status, json=data, headers={"X-RateLimit-Remaining": "10"})
+
+
+def test_list_roles_for_member_fetches_single_member() -> None:
+    adapter = DiscordApiAdapter(token="t", guild_id="1")
+    client = _MockClient(
+        {
+            "/guilds/1/roles": (200, [{"id": "10", "name": "Mentor"}, {"id": "11", "name": "Apprentice"}]),
+            "/guilds/1/members/42": (200, {"user": {"id": "42"}, "roles": ["11", "10", "99"]}),
+        }
+    )
+    adapter._client = client
+
+    assert adapter.list_roles_for_member("42") == ["Apprentice", "Mentor"]
+    assert "/guilds/1/members" not in client.paths
+
+
+def test_list_roles_for_member_unknown_member_returns_empty() -> None:
+    adapter = DiscordApiAdapter(token="t", guild_id="1")
+    adapter._client = _MockClient({"/guilds/1/roles": (200, [{"id": "10", "name": "Mentor"}])})
+
+    assert adapter.list_roles_for_member("404") == []
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import httpx
+
+from ghdcbot.adapters.github.identity import GitHubIdentityReader
+
+
+def _reader(handler) -> GitHubIdentityReader:
+    reader = GitHubIdentityReader(token="t")
+    reader._client = httpx.Client(
+        base_url="https://api.github.com", transport=httpx.MockTransport(handler)
+    )
+    return reader
+
+
+def test_bio_lookup_revalidates_with_etag() -> None:
+    seen_if_none_match: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/users/alice":
+            seen_if_none_match.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"bio": "code ABC123"}, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=[])
+
+    reader = _reader(handler)
+
+    assert reader.search_verification_code("alice", "ABC123").location == "bio"
+    assert reader.search_verification_code("alice", "ABC123").location == "bio"
+    assert seen_if_none_match == [None, '"v1"']
+
+
+def test_close_releases_the_pooled_client() -> None:
+    reader = _reader(lambda request: httpx.Response(404))
+    reader.close()
+    assert reader._client.is_closed
+
+
+def test_gist_list_is_fetched_alongside_bio() -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/users/alice":
+            return httpx.Response(200, json={"bio": "hello"})
+        if request.url.path == "/users/alice/gists":
+            return httpx.Response(200, json=[{"id": "g1", "description": "verify XYZ789"}])
+        return httpx.Response(404)
+
+    reader = _reader(handler)
+    try:
+        match = reader.search_verification_code("alice", "XYZ789")
+    finally:
+        reader.close()
+
+    assert match.location == "gist:g1:description"
+    assert sorted(paths) == ["/users/alice", "/users/alice/gists"]
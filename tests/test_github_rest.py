@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from ghdcbot.adapters.github.rest import GitHubRestAdapter
+from ghdcbot.core.errors import GitHubRateLimitError
+
+
+def test_replace_assignees_sends_single_patch() -> None:
+    seen: list[tuple[str, str, bytes]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path, request.content))
+        return httpx.Response(200, json={"number": 7, "assignees": [{"login": "bob"}]})
+
+    adapter = GitHubRestAdapter(token="t", org="org", api_base="https://api.github.com")
+    adapter._client = httpx.Client(
+        base_url="https://api.github.com", transport=httpx.MockTransport(handler)
+    )
+
+    assert adapter.replace_assignees("owner", "repo", 7, ["bob"]) is True
+    assert len(seen) == 1
+    method, path, body = seen[0]
+    assert (method, path) == ("PATCH", "/repos/owner/repo/issues/7")
+    assert json.loads(body) == {"assignees": ["bob"]}
+
+
+def test_replace_assignees_returns_false_on_error() -> None:
+    adapter = GitHubRestAdapter(token="t", org="org", api_base="https://api.github.com")
+    adapter._client = httpx.Client(
+        base_url="https://api.github.com",
+        transport=httpx.MockTransport(lambda request: httpx.Response(422, text="Invalid")),
+    )
+    assert adapter.replace_assignees("owner", "repo", 7, ["bob"]) is False
+
+
+def test_get_issue_raises_when_rate_limit_exhausted() -> None:
+    reset = int(datetime.now(timezone.utc).timestamp()) + 600
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(
+            403,
+            json={"message": "API rate limit exceeded"},
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)},
+        )
+
+    adapter = GitHubRestAdapter(token="t", org="org", api_base="https://api.github.com")
+    adapter._client = httpx.Client(
+        base_url="https://api.github.com", transport=httpx.MockTransport(handler)
+    )
+
+    with pytest.raises(GitHubRateLimitError) as excinfo:
+        adapter.get_issue("owner", "repo", 5)
+    assert 0 < excinfo.value.retry_after_seconds() <= 600
+    # Budget is known to be exhausted: the next read does not hit GitHub at all.
+    with pytest.raises(GitHubRateLimitError):
+        adapter.get_pull_request("owner", "repo", 1)
+    assert calls == ["/repos/owner/repo/issues/5"]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import httpx
+
+from ghdcbot.adapters.github.rest import GitHubRestAdapter
+
+
+def test_get_pull_request_revalidates_with_etag() -> None:
+    seen_if_none_match: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_if_none_match.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"pr1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"number": 1, "state": "open"}, headers={"ETag": '"pr1"'})
+
+    adapter = GitHubRestAdapter(token="t", org="org", api_base="https://api.github.com")
+    adapter._client = httpx.Client(
+        base_url="https://api.github.com", transport=httpx.MockTransport(handler)
+    )
+
+    assert adapter.get_pull_request("owner", "repo", 1) == {"number": 1, "state": "open"}
+    assert adapter.get_pull_request("owner", "repo", 1) == {"number": 1, "state": "open"}
+    assert seen_if_none_match == [None, '"pr1"']
+
+
+def test_not_modified_tolerates_entry_evicted_during_request() -> None:
+    adapter = GitHubRestAdapter(token="t", org="org", api_base="https://api.github.com")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"pr1"':
+            adapter._etag_cache.clear()  # another worker thread evicted the entry meanwhile
+            return httpx.Response(304)
+        return httpx.Response(200, json={"number": 1}, headers={"ETag": '"pr1"'})
+
+    adapter._client = httpx.Client(
+        base_url="https://api.github.com", transport=httpx.MockTransport(handler)
+    )
+
+    assert adapter.get_pull_request("owner", "repo", 1) == {"number": 1}
+    assert adapter.get_pull_request("owner", "repo", 1) == {"number": 1}
+
+
+def test_get_issue_returns_none_when_not_found() -> None:
+    adapter = GitHubRestAdapter(token="t", org="org", api_base="https://api.github.com")
+    adapter._client = httpx.Client(
+        base_url="https://api.github.com",
+        transport=httpx.MockTransport(lambda request: httpx.Response(404, text="Not Found")),
+    )
+    assert adapter.get_issue("owner", "repo", 5) is None
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
 from ghdcbot.adapters.github.identity import VerificationMatch
-from ghdcbot.adapters.storage.sqlite import SqliteStorage
+from ghdcbot.adapters.storage.sqlite import READ_POOL_SIZE, SqliteStorage
 from ghdcbot.config.models import (
     AssignmentConfig,
     BotConfig,
@@ -17,7 +18,7 @@ from ghdcbot.config.models import (
     RuntimeConfig,
     ScoringConfig,
 )
-from ghdcbot.engine.identity_linking import IdentityLinkService
+from ghdcbot.engine.identity_linking import IdentityLinkService, build_identity_view
 from ghdcbot.engine.orchestrator import Orchestrator
 
 
@@ -44,6 +45,7 @@ def test_verification_code_generated_and_stored(tmp_path: Path, monkeypatch: pyt
     assert row["verification_code"] == "Z" * 10
     assert claim.verification_code == "Z" * 10
     assert row["expires_at"].endswith("+00:00")
+    assert claim.expires_at_iso == claim.expires_at.isoformat()
 
 
 def test_impersonation_attempt_fails_when_github_user_already_verified(tmp_path: Path) -> None:
@@ -599,6 +601,89 @@ def test_create_claim_rejects_refresh_when_not_stale(tmp_path: Path) -> None:
         svc.create_claim("d1", "alice", max_age_days=30)
 
 
+def test_get_discord_user_for_github_user_only_returns_verified(tmp_path: Path) -> None:
+    storage = SqliteStorage(data_dir=str(tmp_path))
+    storage.init_schema()
+    svc = IdentityLinkService(storage=storage, github_identity=_GitHubIdentityAlways(True, "bio"))
+    svc.create_claim("d1", "alice")
+    assert storage.get_discord_user_for_github_user("alice") is None
+    svc.verify_claim("d1", "alice")
+    assert storage.get_discord_user_for_github_user("alice") == "d1"
+    assert storage.get_discord_user_for_github_user("bob") is None
+
+
+def test_get_verified_mapping_by_discord(tmp_path: Path) -> None:
+    storage = SqliteStorage(data_dir=str(tmp_path))
+    storage.init_schema()
+    svc = IdentityLinkService(storage=storage, github_identity=_GitHubIdentityAlways(True, "bio"))
+    svc.create_claim("d1", "alice")
+    assert storage.get_verified_mapping_by_discord("d1") is None
+    svc.verify_claim("d1", "alice")
+    mapping = storage.get_verified_mapping_by_discord("d1")
+    assert mapping == IdentityMapping(github_user="alice", discord_user_id="d1")
+    assert storage.get_verified_mapping_by_discord("d2") is None
+
+
+def test_identity_overview_matches_separate_reads(tmp_path: Path) -> None:
+    storage = SqliteStorage(data_dir=str(tmp_path))
+    storage.init_schema()
+    svc = IdentityLinkService(storage=storage, github_identity=_GitHubIdentityAlways(True, "bio"))
+
+    def assert_consistent() -> None:
+        overview = storage.get_identity_overview("d1", max_age_days=30)
+        assert overview["links"] == storage.get_identity_links_for_discord_user("d1")
+        assert overview["status"] == storage.get_identity_status("d1", max_age_days=30)
+
+    assert_consistent()
+    svc.create_claim("d1", "alice")
+    assert_consistent()
+    svc.verify_claim("d1", "alice")
+    assert_consistent()
+    svc.unlink("d1", cooldown_hours=0)
+    assert_consistent()
+    assert storage.get_identity_overview("d1")["status"]["status"] == "not_linked"
+
+
+def test_build_identity_view_from_storage(tmp_path: Path) -> None:
+    storage = SqliteStorage(data_dir=str(tmp_path))
+    storage.init_schema()
+    svc = IdentityLinkService(storage=storage, github_identity=_GitHubIdentityAlways(True, "bio"))
+    svc.create_claim("d1", "alice")
+    view = build_identity_view(
+        storage.get_identity_links_for_discord_user("d1"), storage.get_identity_status("d1")
+    )
+    assert not view.is_linked
+    assert view.pending_github_user == "alice"
+    assert view.status == "pending"
+
+    svc.verify_claim("d1", "alice")
+    view = build_identity_view(
+        storage.get_identity_links_for_discord_user("d1"), storage.get_identity_status("d1")
+    )
+    assert view.is_linked and view.github_user == "alice"
+    assert view.status == "verified" and view.verified_at
+    assert not view.is_stale
+
+
+def test_build_identity_view_picks_first_verified_and_pending_rows() -> None:
+    links = [
+        {"github_user": "alice", "verified": 1, "expires_at": None},
+        {"github_user": "bob", "verified": 0, "expires_at": "2030-01-01T00:00:00+00:00"},
+        {"github_user": "carol", "verified": 0, "expires_at": None},
+    ]
+    view = build_identity_view(links, {"status": "verified", "github_user": "alice"})
+    assert view.is_linked and view.github_user == "alice"
+    assert view.pending_github_user == "bob"
+    assert view.pending_expires_at == "2030-01-01T00:00:00+00:00"
+
+
+def test_build_identity_view_without_link_rows() -> None:
+    view = build_identity_view(None, None)
+    assert not view.links_available
+    assert not view.is_linked
+    assert view.status == "not_linked"
+
+
 def _parse_utc(value: str) -> datetime:
     """Helper to parse UTC timestamp."""
     parsed = datetime.fromisoformat(value)
@@ -606,3 +691,45 @@ def _parse_utc(value: str) -> datetime:
         return parsed.replace(tzinfo=timezone.utc)
     return parsed.astimezone(timezone.utc)
 
+
+def test_identity_reads_use_pooled_wal_connections(tmp_path: Path) -> None:
+    storage = SqliteStorage(data_dir=str(tmp_path))
+    storage.init_schema()
+    storage.create_identity_claim(
+        "d1", "octocat", "Z" * 10, datetime.now(timezone.utc) + timedelta(minutes=10)
+    )
+    assert storage.get_identity_status("d1")["status"] == "pending"
+
+    # A write after the reader was pooled is visible to it on the next read.
+    storage.mark_identity_verified("d1", "octocat")
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(storage.get_identity_status("d1")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [r["status"] for r in results] == ["verified"] * 8
+    assert 1 <= storage._readers_opened <= READ_POOL_SIZE
+
+    with storage._reader() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    storage.close()
+    assert storage._readers_opened == 0
+
+
+def test_iter_verified_identity_mappings_matches_list_in_batches(tmp_path: Path) -> None:
+    storage = SqliteStorage(data_dir=str(tmp_path))
+    storage.init_schema()
+    expires = datetime.now(timezone.utc) + timedelta(minutes=10)
+    for discord_id, github_user in (("d3", "carol"), ("d1", "alice"), ("d2", "bob")):
+        storage.create_identity_claim(discord_id, github_user, "Z" * 10, expires)
+        if github_user != "bob":
+            storage.mark_identity_verified(discord_id, github_user)
+
+    assert storage.count_verified_identity_mappings() == 2
+    streamed = list(storage.iter_verified_identity_mappings(batch_size=1))
+    assert streamed == storage.list_verified_identity_mappings()
+    assert [m.discord_user_id for m in streamed] == ["d1", "d3"]
@@ -65,7 +65,7 @@ def test_fetch_issue_context_not_found() -> None:
 
 def test_resolve_discord_to_github() -> None:
     """Test resolving Discord user ID to GitHub username."""
-    mock_storage = MagicMock()
+    mock_storage = MagicMock(spec=["list_verified_identity_mappings"])
     
     class MockMapping:
         def __init__(self, discord_id: str, github_user: str) -> None:
@@ -86,7 +86,7 @@ def test_resolve_discord_to_github() -> None:
 
 def test_resolve_github_to_discord() -> None:
     """Test resolving GitHub username to Discord user ID."""
-    mock_storage = MagicMock()
+    mock_storage = MagicMock(spec=["list_verified_identity_mappings"])
     
     class MockMapping:
         def __init__(self, discord_id: str, github_user: str) -> None:
@@ -105,6 +105,16 @@ def test_resolve_github_to_discord() -> None:
     assert discord_id is None
 
 
+def test_resolve_github_to_discord_uses_indexed_lookup() -> None:
+    """Storage with a direct lookup is used instead of scanning all mappings."""
+    mock_storage = MagicMock()
+    mock_storage.get_discord_user_for_github_user.return_value = "123456789"
+
+    assert resolve_github_to_discord(mock_storage, "testuser") == "123456789"
+    mock_storage.get_discord_user_for_github_user.assert_called_once_with("testuser")
+    mock_storage.list_verified_identity_mappings.assert_not_called()
+
+
 def test_build_assignment_confirmation_embed_unassigned() -> None:
     """Test building confirmation embed for unassigned issue."""
     now = datetime.now(timezone.utc)
@@ -338,3 +338,29 @@ def test_deterministic_scoring(tmp_path) -> None:
     scores1_dict = {s.github_user: s.points for s in scores1}
     scores2_dict = {s.github_user: s.points for s in scores2}
     assert scores1_dict == scores2_dict
+
+
+def test_bonus_event_types_count_only_when_configured() -> None:
+    """Events are skipped up front unless the configuration can score them."""
+    period_end = datetime.now(timezone.utc)
+    events = [
+        ContributionEvent(
+            github_user="helper",
+            event_type="helpful_comment",
+            repo="test",
+            created_at=period_end - timedelta(days=1),
+            payload={"issue_number": 7},
+        ),
+    ]
+
+    plain = WeightedScoreStrategy(weights={"pr_merged": 10}, period_days=30)
+    assert plain.compute_scores(events, period_end) == []
+
+    with_bonus = WeightedScoreStrategy(
+        weights={"pr_merged": 10},
+        period_days=30,
+        quality_adjustments={"bonuses": {"helpful_comment": 1}},
+    )
+    assert [(s.github_user, s.points) for s in with_bonus.compute_scores(events, period_end)] == [
+        ("helper", 1)
+    ]
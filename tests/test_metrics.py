@@ -6,7 +6,10 @@ from ghdcbot.adapters.storage.sqlite import SqliteStorage
 from ghdcbot.core.models import ContributionEvent
 from ghdcbot.engine.metrics import (
     get_contribution_metrics,
+    get_contribution_metrics_windows,
     get_rank_for_user,
+    get_rank_for_user_direct,
+    index_metrics_by_user,
     rank_by_activity,
 )
 
@@ -113,3 +116,108 @@ def test_rank_by_activity_and_get_rank_for_user(tmp_path) -> None:
     assert get_rank_for_user(ranked, "a") == 2
     assert get_rank_for_user(ranked, "b") == 3
     assert get_rank_for_user(ranked, "z") is None
+
+
+def test_index_metrics_by_user(tmp_path) -> None:
+    storage = SqliteStorage(str(tmp_path))
+    storage.init_schema()
+    period_end = datetime(2024, 1, 31, tzinfo=timezone.utc)
+    period_start = period_end - timedelta(days=30)
+    storage.record_contributions([
+        ContributionEvent("a", "pr_opened", "r", period_end - timedelta(days=1), {}),
+        ContributionEvent("b", "comment", "r", period_end - timedelta(days=1), {}),
+    ])
+    metrics = get_contribution_metrics(storage, period_start, period_end)
+    by_user = index_metrics_by_user(metrics)
+    assert set(by_user) == {"a", "b"}
+    assert by_user["a"].prs_opened == 1
+    assert by_user.get("z") is None
+
+
+def test_get_rank_for_user_direct_matches_sorted_rank(tmp_path) -> None:
+    storage = SqliteStorage(str(tmp_path))
+    storage.init_schema()
+    period_end = datetime(2024, 1, 31, tzinfo=timezone.utc)
+    period_start = period_end - timedelta(days=30)
+    weights = {"pr_merged": 10, "comment": 1}
+    storage.record_contributions([
+        ContributionEvent("d", "pr_merged", "r", period_end - timedelta(days=1), {}),
+        ContributionEvent("a", "pr_merged", "r", period_end - timedelta(days=1), {}),
+        ContributionEvent("b", "comment", "r", period_end - timedelta(days=1), {}),
+        ContributionEvent("c", "pr_merged", "r", period_end - timedelta(days=1), {}),
+        ContributionEvent("c", "pr_merged", "r", period_end - timedelta(days=2), {}),
+    ])
+    metrics = get_contribution_metrics(storage, period_start, period_end, weights)
+    ranked = rank_by_activity(metrics)
+    for user in ("a", "b", "c", "d", "z"):
+        assert get_rank_for_user_direct(metrics, user) == get_rank_for_user(ranked, user)
+
+
+def test_get_contribution_metrics_windows_matches_separate_calls(tmp_path) -> None:
+    storage = SqliteStorage(str(tmp_path))
+    storage.init_schema()
+    now = datetime(2024, 1, 31, tzinfo=timezone.utc)
+    weights = {"pr_merged": 10, "comment": 1}
+    storage.record_contributions([
+        ContributionEvent("a", "pr_merged", "r", now - timedelta(days=1), {}),
+        ContributionEvent("a", "comment", "r", now - timedelta(days=10), {}),
+        ContributionEvent("b", "pr_opened", "r", now - timedelta(days=20), {}),
+        ContributionEvent("c", "comment", "r", now - timedelta(days=40), {}),
+        ContributionEvent("d", "comment", "r", now + timedelta(days=1), {}),
+    ])
+    windows = get_contribution_metrics_windows(storage, now, (7, 30), weights)
+    for days in (7, 30):
+        assert windows[days] == get_contribution_metrics(
+            storage, now - timedelta(days=days), now, weights
+        )
+    assert [m.github_user for m in windows[7]] == ["a"]
+    assert [m.github_user for m in windows[30]] == ["a", "b"]
+
+
+def test_has_activity_probes_user_since(tmp_path) -> None:
+    storage = SqliteStorage(str(tmp_path))
+    storage.init_schema()
+    now = datetime(2024, 1, 31, tzinfo=timezone.utc)
+    storage.record_contributions([
+        ContributionEvent("a", "comment", "r", now - timedelta(days=10), {}),
+        ContributionEvent("c", "comment", "r", now - timedelta(days=40), {}),
+    ])
+    since = now - timedelta(days=30)
+    assert storage.has_activity("a", since)
+    assert not storage.has_activity("c", since)
+    assert not storage.has_activity("nobody", since)
+
+
+def test_init_schema_runs_ddl_once_per_database(tmp_path) -> None:
+    import sqlite3
+
+    from ghdcbot.adapters.storage.sqlite import SCHEMA_VERSION
+
+    storage = SqliteStorage(str(tmp_path))
+    storage.init_schema()
+    with sqlite3.connect(tmp_path / "state.db") as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    fresh = SqliteStorage(str(tmp_path))
+    calls = []
+    fresh._create_schema = lambda conn: calls.append(conn)
+    fresh.init_schema()
+    fresh.init_schema()
+    assert calls == []
+    assert fresh.has_activity("alice", datetime.now(timezone.utc)) is False
+
+
+def test_list_contributions_shares_repeated_strings(tmp_path) -> None:
+    storage = SqliteStorage(str(tmp_path))
+    storage.init_schema()
+    now = datetime.now(timezone.utc)
+    storage.record_contributions(
+        [
+            ContributionEvent("alice", "comment", "org/repo", now - timedelta(hours=h), {"n": h})
+            for h in (1, 2)
+        ]
+    )
+    first, second = storage.list_contributions(now - timedelta(days=1))
+    assert first.github_user is second.github_user
+    assert first.event_type is second.event_type
+    assert first.repo is second.repo
@@ -1,5 +1,6 @@
 """Tests for PR context preview feature."""
 
+import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
@@ -358,3 +359,11 @@ def test_build_pr_embed_long_title() -> None:
     
     title_field = next(f for f in embed["fields"] if f["name"] == "Title")
     assert len(title_field["value"]) <= 256  # Discord limit
+
+
+def test_parse_pr_url_in_long_unmatched_text_is_fast() -> None:
+    text = "github.com/" + "a/" * 20000 + " no pull here"
+    start = time.perf_counter()
+    assert parse_pr_url(text) is None
+    assert time.perf_counter() - start < 1.0
+    assert parse_pr_url("see https://github.com/o-1/r.x_y/pull/7 please") == ("o-1", "r.x_y", 7)
@@ -0,0 +1,51 @@
+"""Tests for per-user command cooldowns (utils/ratelimit.py)."""
+
+from ghdcbot.utils.ratelimit import Cooldown
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cooldown_blocks_within_window_and_allows_after() -> None:
+    clock = _FakeClock()
+    cooldown = Cooldown(clock=clock)
+    assert cooldown.try_acquire(("u1", "summary"), 5.0) is True
+    clock.now += 4.9
+    assert cooldown.try_acquire(("u1", "summary"), 5.0) is False
+    clock.now += 0.1
+    assert cooldown.try_acquire(("u1", "summary"), 5.0) is True
+
+
+def test_cooldown_is_per_key() -> None:
+    cooldown = Cooldown(clock=_FakeClock())
+    assert cooldown.try_acquire(("u1", "summary"), 5.0) is True
+    assert cooldown.try_acquire(("u2", "summary"), 5.0) is True
+    assert cooldown.try_acquire(("u1", "status"), 5.0) is True
+    assert cooldown.try_acquire(("u1", "summary"), 5.0) is False
+    cooldown.reset(("u1", "summary"))
+    assert cooldown.try_acquire(("u1", "summary"), 5.0) is True
+
+
+def test_cooldown_tracks_at_most_maxsize_keys() -> None:
+    cooldown = Cooldown(maxsize=2, clock=_FakeClock())
+    for user in ("u1", "u2", "u3"):
+        assert cooldown.try_acquire((user, "summary"), 5.0) is True
+    assert len(cooldown) == 2
+    # The oldest key was dropped, so it is no longer throttled.
+    assert cooldown.try_acquire(("u1", "summary"), 5.0) is True
+
+
+def test_cooldown_reports_remaining_wait() -> None:
+    clock = _FakeClock()
+    cooldown = Cooldown(clock=clock)
+    assert cooldown.remaining(("u1", "link"), 30.0) == 0.0
+    cooldown.try_acquire(("u1", "link"), 30.0)
+    clock.now += 12.5
+    assert cooldown.remaining(("u1", "link"), 30.0) == 17.5
+    clock.now += 20.0
+    assert cooldown.remaining(("u1", "link"), 30.0) == 0.0
@@ -9,9 +9,11 @@ completes without error, and audit reports are written.
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from ghdcbot.cli import build_orchestrator
-from ghdcbot.config.loader import load_config
+from ghdcbot.config.loader import _expand_env_vars, load_config
+from ghdcbot.config.models import GitHubConfig
 from ghdcbot.core.errors import ConfigError
 
 
@@ -49,6 +51,8 @@ def test_load_config_fails_without_env_vars(monkeypatch: pytest.MonkeyPatch) ->
     with pytest.raises(ConfigError) as excinfo:
         load_config(str(EXAMPLE_CONFIG_PATH))
     assert "GITHUB_TOKEN" in str(excinfo.value) or "DISCORD_TOKEN" in str(excinfo.value)
+    # Every missing variable is reported at once, not just the first one hit.
+    assert "GITHUB_TOKEN" in str(excinfo.value) and "DISCORD_TOKEN" in str(excinfo.value)
 
 
 def test_readme_setup_run_once_completes_and_writes_reports(
@@ -87,3 +91,62 @@ def test_readme_setup_run_once_completes_and_writes_reports(
     assert audit_md.exists(), "README: audit.md should be written"
     assert audit_json.read_text()
     assert "dry-run" in audit_md.read_text() or "Summary" in audit_md.read_text()
+
+
+def test_load_config_reuses_unchanged_file_and_reloads_on_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unchanged file + env returns the cached config; edits or new token values reload."""
+    monkeypatch.setenv("GITHUB_TOKEN", "token-a")
+    monkeypatch.setenv("DISCORD_TOKEN", "test-token-discord")
+    config_path = tmp_path / "ghdcbot-config.yaml"
+    config_path.write_text(EXAMPLE_CONFIG_PATH.read_text())
+
+    first = load_config(str(config_path))
+    assert load_config(str(config_path)) is first
+
+    monkeypatch.setenv("GITHUB_TOKEN", "token-b")
+    second = load_config(str(config_path))
+    assert second is not first
+    assert second.github.token == "token-b"
+
+    config_path.write_text(
+        EXAMPLE_CONFIG_PATH.read_text().replace("example-org", "other-org")
+    )
+    assert load_config(str(config_path)).github.org == "other-org"
+
+    # Cached instances are shared between callers, so config models are frozen.
+    with pytest.raises(ValidationError):
+        first.github.org = "mutated"
+
+
+def test_expand_env_vars_whole_and_embedded_placeholders(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("GHDC_A", "a")
+    monkeypatch.delenv("GHDC_MISSING", raising=False)
+    env: dict[str, str | None] = {}
+    value = {
+        "whole": "${GHDC_A}",
+        "embedded": "x-${GHDC_A}-${GHDC_A}",
+        "plain": "no placeholders",
+        "not_a_name": "${lower}",
+        "missing": "${GHDC_MISSING}",
+    }
+    assert _expand_env_vars(value, env) == {
+        "whole": "a",
+        "embedded": "x-a-a",
+        "plain": "no placeholders",
+        "not_a_name": "${lower}",
+        "missing": "",
+    }
+    assert env == {"GHDC_A": "a", "GHDC_MISSING": None}
+
+
+def test_github_api_base_is_a_validated_plain_string() -> None:
+    config = GitHubConfig(org="o", token="t", api_base="https://ghe.example.com/api/v3")
+    assert config.api_base == "https://ghe.example.com/api/v3"
+    assert GitHubConfig(org="o", token="t").api_base == "https://api.github.com"
+    for bad in ("api.github.com", "ftp://api.github.com", "https://"):
+        with pytest.raises(ValidationError):
+            GitHubConfig(org="o", token="t", api_base=bad)